@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Baseline Store and Regression Gate
+Keeps the latency histograms and throughput of blessed harness runs as named
+baselines, and compares a new run against one. Each endpoint or workflow is
+tested with a one-sided Mann-Whitney U test on the bucketed latencies plus a
+bootstrap confidence interval on the p95 ratio; the gate fails only when the
+slowdown is both significant and larger than the allowed regression
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from json_codec import decode
+from latency_histogram import LatencyHistogram, merge_histogram_maps
+
+DEFAULT_BASELINE_DIR = Path(__file__).resolve().parents[1] / "baselines"
+BASELINE_VERSION = 1
+
+# Histograms and throughput of one run, keyed by group ("endpoints", "workflows", "targets")
+RunSamples = Tuple[Dict[str, Dict[str, LatencyHistogram]], Dict[str, float]]
+
+
+def run_samples(report: Dict[str, Any]) -> RunSamples:
+    """Latency histograms by group and throughput by "group/key" from any saved harness report"""
+    histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+    for group, histogram_map in report.get("latency_histograms", {}).items():
+        histograms[group] = merge_histogram_maps([histogram_map])
+
+    throughput: Dict[str, float] = {}
+    if "latency_histogram" in report and "target" in report:
+        # Single-workflow load report from comprehensive_agent_workflow_test.py --load
+        histograms.setdefault("workflows", {})[report["target"]] = LatencyHistogram.from_dict(report["latency_histogram"])
+        throughput[f"workflows/{report['target']}"] = report["throughput_rps"]
+    if "overall" in report:
+        # Sharded and cluster load reports
+        throughput["overall"] = report["overall"]["throughput_rps"]
+        for name, target in report.get("targets", {}).items():
+            throughput[f"targets/{name}"] = target["throughput_rps"]
+    return histograms, throughput
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+def baseline_histograms(baseline: Dict[str, Any]) -> Dict[str, Dict[str, LatencyHistogram]]:
+    return {group: merge_histogram_maps([histogram_map])
+            for group, histogram_map in baseline["latency_histograms"].items()}
+
+
+class BaselineStore:
+    """Named baselines saved as JSON files in one directory"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else DEFAULT_BASELINE_DIR
+
+    def path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def names(self) -> List[str]:
+        return sorted(path.stem for path in self.directory.glob("*.json"))
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """Saved baseline, raising FileNotFoundError when it has never been blessed"""
+        baseline = load_report(self.path(name))
+        if baseline.get("version") != BASELINE_VERSION:
+            raise ValueError(f"baseline {name} has version {baseline.get('version')}, expected {BASELINE_VERSION}")
+        return baseline
+
+    def bless(self, name: str, report_paths: List[Path], replace: bool = False) -> Dict[str, Any]:
+        """Fold the runs in report_paths into a baseline, starting over when replace is set"""
+        try:
+            baseline = None if replace else self.load(name)
+        except FileNotFoundError:
+            baseline = None
+        if baseline is None:
+            baseline = {"version": BASELINE_VERSION, "name": name, "runs": [],
+                        "latency_histograms": {}, "throughput": {}}
+
+        groups = baseline_histograms(baseline)
+        for report_path in report_paths:
+            histograms, throughput = run_samples(load_report(report_path))
+            for group, histogram_map in histograms.items():
+                merged = groups.setdefault(group, {})
+                for key, histogram in histogram_map.items():
+                    if key in merged:
+                        merged[key].merge(histogram)
+                    else:
+                        merged[key] = histogram
+            # Throughput is one number per run, so every blessed value is kept
+            for key, value in throughput.items():
+                baseline["throughput"].setdefault(key, []).append(value)
+            baseline["runs"].append({"report": str(report_path), "blessed_at": datetime.now().isoformat()})
+
+        baseline["latency_histograms"] = {
+            group: {key: histogram.to_dict() for key, histogram in sorted(histogram_map.items())}
+            for group, histogram_map in sorted(groups.items())
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.path(name).with_suffix(".tmp")
+        with open(temporary, "w") as f:
+            json.dump(baseline, f, indent=2)
+        os.replace(temporary, self.path(name))
+        return baseline
+
+
+def _weighted(histogram: LatencyHistogram) -> Tuple[np.ndarray, np.ndarray]:
+    """Bucket values in seconds and their counts"""
+    buckets = histogram.buckets()
+    return (np.array([value for value, _ in buckets], dtype=np.float64),
+            np.array([count for _, count in buckets], dtype=np.int64))
+
+
+def mann_whitney_greater(baseline: LatencyHistogram, current: LatencyHistogram) -> Tuple[float, float]:
+    """One-sided p-value that current is slower than baseline, and P(current > baseline)"""
+    base_values, base_counts = _weighted(baseline)
+    new_values, new_counts = _weighted(current)
+    values, inverse = np.unique(np.concatenate([base_values, new_values]), return_inverse=True)
+    a = np.bincount(inverse[:len(base_values)], weights=base_counts, minlength=len(values))
+    b = np.bincount(inverse[len(base_values):], weights=new_counts, minlength=len(values))
+
+    # Every bucket is one tie group; its members share the mid rank
+    ties = a + b
+    below = np.cumsum(ties) - ties
+    mid_rank = below + (ties + 1) / 2
+    n_a, n_b = a.sum(), b.sum()
+    n = n_a + n_b
+    u = float((b * mid_rank).sum() - n_b * (n_b + 1) / 2)
+
+    tie_term = float((ties ** 3 - ties).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n_a * n_b / 12 * ((n + 1) - tie_term)
+    effect = float(u / (n_a * n_b))
+    if variance <= 0:
+        return 1.0, effect
+    z = (u - n_a * n_b / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2)), effect
+
+
+def bootstrap_percentile_ratio(baseline: LatencyHistogram, current: LatencyHistogram,
+                               percentile: float = 95.0, resamples: int = 2000, confidence: float = 0.95,
+                               rng: Optional[np.random.Generator] = None) -> Tuple[float, float]:
+    """Confidence interval of current/baseline at `percentile`, resampling bucket counts"""
+    rng = rng or np.random.default_rng()
+
+    def resampled(histogram: LatencyHistogram) -> np.ndarray:
+        values, counts = _weighted(histogram)
+        total = int(counts.sum())
+        draws = rng.multinomial(total, counts / total, size=resamples)
+        rank = max(1, math.ceil(percentile / 100.0 * total))
+        return values[(np.cumsum(draws, axis=1) >= rank).argmax(axis=1)]
+
+    base = np.maximum(resampled(baseline), 1e-6)
+    ratios = resampled(current) / base
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(ratios, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+@dataclass
+class GateThresholds:
+    """How large and how certain a change must be to fail the gate"""
+    alpha: float = 0.01
+    max_p95_regression: float = 0.10
+    max_throughput_drop: float = 0.10
+    min_samples: int = 20
+    resamples: int = 2000
+    seed: Optional[int] = 0
+
+
+@dataclass
+class LatencyComparison:
+    group: str
+    key: str
+    verdict: str
+    baseline_count: int = 0
+    current_count: int = 0
+    baseline_p95: Optional[float] = None
+    current_p95: Optional[float] = None
+    p95_ratio_ci: Optional[Tuple[float, float]] = None
+    p_value: Optional[float] = None
+    effect: Optional[float] = None
+
+
+@dataclass
+class ThroughputComparison:
+    key: str
+    verdict: str
+    baseline_rps: float
+    current_rps: float
+    change: float
+
+
+@dataclass
+class GateResult:
+    baseline: str
+    latency: List[LatencyComparison] = field(default_factory=list)
+    throughput: List[ThroughputComparison] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[Any]:
+        return [c for c in self.latency + self.throughput if c.verdict == "regressed"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "baseline": self.baseline,
+            "regressed": bool(self.regressions),
+            "latency": [asdict(c) for c in self.latency],
+            "throughput": [asdict(c) for c in self.throughput]
+        }
+
+
+def compare_latency(group: str, key: str, baseline: LatencyHistogram, current: LatencyHistogram,
+                    thresholds: GateThresholds, rng: np.random.Generator) -> LatencyComparison:
+    comparison = LatencyComparison(group, key, "unchanged", baseline.total_count, current.total_count,
+                                   round(baseline.percentile(95), 6), round(current.percentile(95), 6))
+    if min(baseline.total_count, current.total_count) < thresholds.min_samples:
+        comparison.verdict = "insufficient"
+        return comparison
+
+    slower_p, effect = mann_whitney_greater(baseline, current)
+    faster_p, _ = mann_whitney_greater(current, baseline)
+    low, high = bootstrap_percentile_ratio(baseline, current, resamples=thresholds.resamples,
+                                           confidence=1 - thresholds.alpha, rng=rng)
+    comparison.p_value = round(slower_p, 6)
+    comparison.effect = round(effect, 4)
+    comparison.p95_ratio_ci = (round(low, 4), round(high, 4))
+    # Significance alone flags trivial shifts on large runs; the p95 bound must also clear the threshold
+    if slower_p < thresholds.alpha and low > 1 + thresholds.max_p95_regression:
+        comparison.verdict = "regressed"
+    elif faster_p < thresholds.alpha and high < 1 - thresholds.max_p95_regression:
+        comparison.verdict = "improved"
+    return comparison
+
+
+def compare_run(baseline: Dict[str, Any], report_paths: List[Path],
+                thresholds: Optional[GateThresholds] = None) -> GateResult:
+    """Compare the merged runs in report_paths against a saved baseline"""
+    thresholds = thresholds or GateThresholds()
+    rng = np.random.default_rng(thresholds.seed)
+    result = GateResult(baseline["name"])
+
+    current: Dict[str, Dict[str, LatencyHistogram]] = {}
+    throughput: Dict[str, List[float]] = {}
+    for report_path in report_paths:
+        histograms, rates = run_samples(load_report(report_path))
+        for group, histogram_map in histograms.items():
+            merged = current.setdefault(group, {})
+            for key, histogram in histogram_map.items():
+                if key in merged:
+                    merged[key].merge(histogram)
+                else:
+                    merged[key] = histogram
+        for key, value in rates.items():
+            throughput.setdefault(key, []).append(value)
+
+    base_groups = baseline_histograms(baseline)
+    for group in sorted(set(base_groups) | set(current)):
+        base_map, current_map = base_groups.get(group, {}), current.get(group, {})
+        for key in sorted(set(base_map) | set(current_map)):
+            if key not in current_map:
+                result.latency.append(LatencyComparison(group, key, "missing", base_map[key].total_count))
+            elif key not in base_map:
+                result.latency.append(LatencyComparison(group, key, "new", 0, current_map[key].total_count))
+            else:
+                result.latency.append(compare_latency(group, key, base_map[key], current_map[key], thresholds, rng))
+
+    for key, values in sorted(throughput.items()):
+        blessed = baseline["throughput"].get(key)
+        if not blessed:
+            continue
+        base_rps, current_rps = float(np.median(blessed)), float(np.mean(values))
+        change = (current_rps - base_rps) / base_rps if base_rps else 0.0
+        verdict = "regressed" if change < -thresholds.max_throughput_drop else "unchanged"
+        result.throughput.append(ThroughputComparison(key, verdict, base_rps, round(current_rps, 2), round(change, 4)))
+    return result
+
+
+VERDICT_ICONS = {"regressed": "❌", "improved": "🚀", "unchanged": "✅", "insufficient": "⚪", "new": "🆕", "missing": "⚠️"}
+
+
+def print_result(result: GateResult):
+    print(f"📏 Regression gate against baseline '{result.baseline}'")
+    for c in result.latency:
+        line = f"  {VERDICT_ICONS[c.verdict]} {c.group}/{c.key}: {c.verdict}"
+        if c.baseline_count and c.current_count:
+            line += f" p95 {c.baseline_p95:.3f}s → {c.current_p95:.3f}s (n={c.baseline_count}/{c.current_count})"
+        if c.p95_ratio_ci:
+            line += f", p95 ratio CI {c.p95_ratio_ci[0]:.2f}-{c.p95_ratio_ci[1]:.2f}, p={c.p_value:.4f}"
+        print(line)
+    for c in result.throughput:
+        print(f"  {VERDICT_ICONS[c.verdict]} throughput {c.key}: {c.baseline_rps:.1f} → {c.current_rps:.1f} req/s "
+              f"({c.change * 100:+.1f}%)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bless harness runs as baselines and gate new runs against them")
+    parser.add_argument("--baseline-dir", type=Path, default=DEFAULT_BASELINE_DIR, help="Directory of saved baselines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bless = commands.add_parser("bless", help="Fold saved reports into a baseline")
+    bless.add_argument("reports", nargs="+", type=Path)
+    bless.add_argument("--name", default="default", help="Baseline name (one per scenario and load profile)")
+    bless.add_argument("--replace", action="store_true", help="Start the baseline over instead of adding to it")
+
+    compare = commands.add_parser("compare", help="Compare saved reports against a baseline; exit 1 on regression")
+    compare.add_argument("reports", nargs="+", type=Path)
+    compare.add_argument("--name", default="default", help="Baseline name")
+    compare.add_argument("--alpha", type=float, default=0.01, help="Significance level of the tests")
+    compare.add_argument("--max-p95-regression", type=float, default=10.0,
+                         help="Allowed p95 slowdown in percent before the gate fails")
+    compare.add_argument("--max-throughput-drop", type=float, default=10.0,
+                         help="Allowed throughput drop in percent before the gate fails")
+    compare.add_argument("--min-samples", type=int, default=20,
+                         help="Skip keys with fewer latency samples on either side")
+    compare.add_argument("--resamples", type=int, default=2000, help="Bootstrap resamples for the p95 interval")
+    compare.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+
+    commands.add_parser("list", help="List saved baselines")
+    args = parser.parse_args(argv)
+    store = BaselineStore(args.baseline_dir)
+
+    if args.command == "list":
+        for name in store.names():
+            baseline = store.load(name)
+            keys = sum(len(histogram_map) for histogram_map in baseline["latency_histograms"].values())
+            print(f"  • {name}: {len(baseline['runs'])} runs, {keys} latency keys, {len(baseline['throughput'])} throughput keys")
+        return 0
+
+    try:
+        if args.command == "bless":
+            baseline = store.bless(args.name, args.reports, replace=args.replace)
+            print(f"✅ Baseline '{args.name}' now holds {len(baseline['runs'])} runs ({store.path(args.name)})")
+            return 0
+
+        thresholds = GateThresholds(alpha=args.alpha, max_p95_regression=args.max_p95_regression / 100,
+                                    max_throughput_drop=args.max_throughput_drop / 100,
+                                    min_samples=args.min_samples, resamples=args.resamples)
+        result = compare_run(store.load(args.name), args.reports, thresholds)
+    except FileNotFoundError as e:
+        print(f"❌ {e.filename}: not found")
+        return 2
+    except (KeyError, ValueError) as e:
+        print(f"❌ Unreadable report or baseline: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_result(result)
+        regressions = result.regressions
+        print(f"{'❌' if regressions else '✅'} {len(regressions)} regressions")
+    return 1 if result.regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,18 +4,68 @@ Comprehensive Agent Workflow End-to-End Test Suite
 Tests all AlexAI agents with proper mock data and executes n8n workflows for validation
 """
 
-import requests
+import argparse
 import json
 import time
 import subprocess
 import sys
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import asyncio
 import aiohttp
 
+from alexai_standin_server import AlexAIStandInServer
+from fanout_engine import FanOutEngine, FanOutOutcome, FanOutProbe
+from fixture_catalog import FixtureCatalog
+from http_transport import SharedTransport, get_transport
+from json_codec import decode, read_lazy
+from latency_histogram import LatencyHistogram, record_latency
+from load_generator import LOAD_MODES, LoadGenerator, LoadProfile, LoadReport
+from metrics_exporter import HarnessMetrics, add_metrics_arguments, start_metrics_server
+from n8n_standin_server import N8nStandInServer
+from payload_cache import PayloadCache, RequestStamper, query_params
+from result_sink import NDJSONResultSink, RunningSummary
+from request_policy import IDEMPOTENT_METHODS, PolicyExecutor, RequestPolicy, load_request_policy
+from request_timing import RequestTiming, elapsed_since, format_phases, phase_summaries, record_phases
+from response_validators import ValidatorRegistry, default_registry
+from result_store import ColumnarResultStore
+from sharded_load import TARGET_GROUPS, LoadTarget
+from report_analytics import analyze, notable_results, slow_outliers
+from standin_server import FaultModel, LatencyModel
+from suite_scheduler import SuiteScheduler, SuiteTask, TaskResult, format_schedule
+from workflow_catalog import WorkflowCatalog
+
+# Substring rules mapping test names to categories, evaluated once per logged result
+TEST_CATEGORIES = {
+    "agent_tests": ("Agent",),
+    "workflow_tests": ("Workflow",),
+    "sync_tests": ("Sync",),
+    "integration_tests": ("Integration", "Coordination"),
+    # Narrower groups used only by the recommendations
+    "agent_api": ("Agent API",),
+    "integration": ("Integration",)
+}
+
+REPORT_CATEGORIES = ["agent_tests", "workflow_tests", "sync_tests", "integration_tests"]
+
+FAILURE_RECOMMENDATIONS = [
+    ("agent_api", "Review and fix agent API endpoint configurations"),
+    ("workflow_tests", "Validate n8n workflow configurations and webhook endpoints"),
+    ("sync_tests", "Check bilateral sync system configuration and connectivity"),
+    ("integration", "Review multi-agent coordination and integration logic")
+]
+
+@lru_cache(maxsize=4096)
+def categorize_test(test_name: str) -> Tuple[str, ...]:
+    """Categories a test name belongs to"""
+    return tuple(
+        category for category, needles in TEST_CATEGORIES.items()
+        if any(needle in test_name for needle in needles)
+    )
+
 @dataclass
 class TestResult:
     """Test result data structure"""
@@ -27,110 +77,89 @@ class TestResult:
     workflow_id: Optional[str] = None
     agent_name: Optional[str] = None
     mock_data: Optional[Dict] = None
+    endpoint: Optional[str] = None
+    # Phase durations (dns, connect, ttfb, ...) of the request behind this result
+    timing: Optional[Dict[str, Any]] = None
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Serialisable form used in reports and result logs (mock data excluded)"""
+        return {
+            "test_name": self.test_name,
+            "status": self.status,
+            "details": self.details,
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+            "workflow_id": self.workflow_id,
+            "agent_name": self.agent_name,
+            "endpoint": self.endpoint,
+            "timing": self.timing
+        }
 
 class ComprehensiveAgentWorkflowTester:
     """Comprehensive end-to-end tester for all AlexAI agents and n8n workflows"""
     
-    def __init__(self):
-        self.local_url = "http://localhost:8000"
-        self.n8n_url = "https://n8n.pbradygeorgen.com"
-        self.test_results: List[TestResult] = []
-        self.mock_data = self._generate_mock_data()
+    def __init__(self, agent_concurrency: int = 10, default_endpoint_deadline: float = 15.0,
+                 endpoint_deadlines: Optional[Dict[str, float]] = None,
+                 transport: Optional[SharedTransport] = None,
+                 local_url: str = "http://localhost:8000",
+                 n8n_url: str = "https://n8n.pbradygeorgen.com",
+                 result_sink: Optional[NDJSONResultSink] = None,
+                 policy: Optional[RequestPolicy] = None,
+                 suite_concurrency: int = 4,
+                 validators: Optional[ValidatorRegistry] = None,
+                 discover_workflows: bool = False,
+                 metrics: Optional[HarnessMetrics] = None,
+                 all_detailed_results: bool = False):
+        self.local_url = local_url
+        self.n8n_url = n8n_url
+        # Compact columnar storage; detailed records are only materialised for the report
+        self.test_results = ColumnarResultStore()
+        self.summary = RunningSummary()
+        self.workflow_result_count = 0
+        # With a sink, results stream to disk instead of accumulating in test_results
+        self.result_sink = result_sink
+        # Reports list failures and slow outliers only, unless every result is asked for
+        self.all_detailed_results = all_detailed_results
+        # Fixture files load lazily and are shared (read-only) across testers
+        self.fixtures = FixtureCatalog()
+        self.mock_data = self.fixtures.as_mapping()
+        # Request bodies are encoded once per payload and reused for every send
+        self.payloads = PayloadCache()
+        # Response schemas are compiled once and looked up by webhook or endpoint key
+        self.validators = validators or default_registry()
+        # Also exercise every webhook path declared in workflows/*.json
+        self.discover_workflows = discover_workflows
+        self.workflow_catalog: Optional[WorkflowCatalog] = None
         self.workflow_results = {}
         
-    def _generate_mock_data(self) -> Dict[str, Any]:
-        """Generate comprehensive mock data for testing all agents"""
-        return {
-            "crew_requests": {
-                "captain_picard": {
-                    "context": "Strategic decision making for diplomatic mission",
-                    "priority": "high",
-                    "crew_members": ["lieutenant_data", "counselor_troi"],
-                    "mission_type": "diplomatic"
-                },
-                "lieutenant_data": {
-                    "context": "Technical analysis of alien technology",
-                    "priority": "medium",
-                    "crew_members": ["chief_engineer_scott"],
-                    "analysis_type": "technology_assessment"
-                },
-                "counselor_troi": {
-                    "context": "Psychological profile analysis of new species",
-                    "priority": "medium",
-                    "crew_members": ["captain_picard"],
-                    "analysis_type": "psychological_assessment"
-                },
-                "chief_engineer_scott": {
-                    "context": "Engineering solution for warp core instability",
-                    "priority": "critical",
-                    "crew_members": ["lieutenant_data"],
-                    "problem_type": "warp_core_issue"
-                },
-                "commander_spock": {
-                    "context": "Logical analysis of temporal paradox",
-                    "priority": "high",
-                    "crew_members": ["lieutenant_data", "captain_picard"],
-                    "analysis_type": "temporal_analysis"
-                },
-                "lieutenant_worf": {
-                    "context": "Security protocol assessment for hostile environment",
-                    "priority": "high",
-                    "crew_members": ["captain_picard"],
-                    "security_level": "maximum"
-                }
-            },
-            "specialized_requests": {
-                "ships_computer": {
-                    "context": "Database query for historical mission data",
-                    "query_type": "mission_history",
-                    "timeframe": "last_5_years"
-                },
-                "multimodal_agency": {
-                    "context": "Analysis of visual sensor data from unknown object",
-                    "data_type": "visual_sensors",
-                    "analysis_depth": "comprehensive"
-                },
-                "bilateral_learning": {
-                    "context": "Cross-agent knowledge synthesis",
-                    "agents_involved": ["captain_picard", "lieutenant_data"],
-                    "learning_type": "collaborative"
-                },
-                "enhanced_knowledge": {
-                    "context": "Knowledge base expansion with new discoveries",
-                    "discovery_type": "alien_civilization",
-                    "integration_priority": "high"
-                }
-            },
-            "orchestration_requests": {
-                "crew_coordination": {
-                    "context": "Multi-agent mission coordination",
-                    "mission_type": "exploration",
-                    "crew_size": 6,
-                    "duration": "72_hours"
-                },
-                "ship_agency": {
-                    "context": "Automated ship systems management",
-                    "systems": ["life_support", "navigation", "communications"],
-                    "autonomy_level": "full"
-                },
-                "llm_orchestration": {
-                    "context": "Multi-LLM task distribution",
-                    "llm_providers": ["openai", "anthropic", "local"],
-                    "task_complexity": "high"
-                }
-            },
-            "workflow_validation": {
-                "validation_type": "comprehensive",
-                "include_specialized": True,
-                "test_depth": "full_integration",
-                "mock_execution": True
-            }
-        }
-    
+        # Latency distributions keyed by endpoint path and by workflow id
+        self.endpoint_latency: Dict[str, LatencyHistogram] = {}
+        self.workflow_latency: Dict[str, LatencyHistogram] = {}
+        # Request phase distributions keyed by endpoint path or workflow id, then phase
+        self.request_phases: Dict[str, Dict[str, LatencyHistogram]] = {}
+        # Live counters and histograms for a /metrics scraper, when one is attached
+        self.metrics = metrics
+        
+        # Agent endpoint sweeps fan out concurrently; deadlines are per endpoint path
+        self.default_endpoint_deadline = default_endpoint_deadline
+        self.endpoint_deadlines: Dict[str, float] = endpoint_deadlines or {}
+        self.fanout = FanOutEngine(agent_concurrency, default_endpoint_deadline)
+        
+        # Every probe reuses the same keep-alive pools
+        self.transport = transport or get_transport()
+        
+        # Timeouts, retries and hedging come from test_config.json unless a policy is given
+        self.policy_executor = PolicyExecutor(policy)
+        
+        # Independent suite phases run concurrently; 1 restores the serial order
+        self.scheduler = SuiteScheduler(suite_concurrency)
+        
     def log_test(self, test_name: str, status: str, details: str = "", 
                  duration: float = 0.0, workflow_id: str = None, 
-                 agent_name: str = None, mock_data: Dict = None) -> TestResult:
+                 agent_name: str = None, mock_data: Dict = None,
+                 endpoint: str = None, timing: Optional[RequestTiming] = None) -> TestResult:
         """Log test results with comprehensive details"""
+        timestamp_ns = time.monotonic_ns()
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         result = TestResult(
             test_name=test_name,
@@ -140,9 +169,30 @@ class ComprehensiveAgentWorkflowTester:
             duration=duration,
             workflow_id=workflow_id,
             agent_name=agent_name,
-            mock_data=mock_data
+            mock_data=mock_data,
+            endpoint=endpoint,
+            timing=timing.to_dict() if timing is not None else None
         )
-        self.test_results.append(result)
+        categories = categorize_test(test_name)
+        self.summary.add(status, duration, categories)
+        if self.metrics is not None:
+            self.metrics.record_result(status, duration, endpoint, agent_name, workflow_id)
+        if workflow_id:
+            self.workflow_result_count += 1
+        if self.result_sink is not None:
+            # Categories travel with the record so result_sink.summarize_file can rebuild the breakdown
+            self.result_sink.write({**result.to_record(), "categories": list(categories)})
+        else:
+            self.test_results.append(test_name, status, details, duration, timestamp_ns,
+                                     workflow_id, agent_name, endpoint, result.timing)
+        
+        if duration > 0:
+            if endpoint:
+                record_latency(self.endpoint_latency, endpoint, duration)
+            if workflow_id:
+                record_latency(self.workflow_latency, workflow_id, duration)
+        if timing is not None:
+            record_phases(self.request_phases, endpoint or workflow_id or test_name, timing)
         
         status_emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
         print(f"[{timestamp}] {status_emoji} {test_name}: {status}")
@@ -157,286 +207,305 @@ class ComprehensiveAgentWorkflowTester:
         
         return result
     
-    async def test_n8n_workflow_execution(self, workflow_name: str, mock_data: Dict) -> bool:
-        """Test n8n workflow execution with mock data"""
-        start_time = time.time()
+    async def _execute_workflow(self, workflow_name: str, mock_data: Dict, retry: bool = True,
+                                stamper: Optional[RequestStamper] = None) -> Tuple[bool, str, float, Optional[RequestTiming]]:
+        """Execute an n8n workflow webhook under the request policy and return (passed, details, duration, timing)"""
+        if self.metrics is None:
+            return await self._send_workflow(workflow_name, mock_data, retry, stamper)
+        self.metrics.in_flight.inc(workflow_id=workflow_name)
+        try:
+            passed, details, duration, timing = await self._send_workflow(workflow_name, mock_data, retry, stamper)
+        finally:
+            self.metrics.in_flight.dec(workflow_id=workflow_name)
+        self.metrics.record_execution(workflow_name, passed, duration)
+        return passed, details, duration, timing
+    
+    async def _send_workflow(self, workflow_name: str, mock_data: Dict, retry: bool,
+                             stamper: Optional[RequestStamper]) -> Tuple[bool, str, float, Optional[RequestTiming]]:
+        start_ns = time.perf_counter_ns()
         
         try:
             # Test workflow webhook endpoint
             webhook_url = f"{self.n8n_url}/webhook/{workflow_name}"
+            method = self._webhook_method(workflow_name)
+            timeout = aiohttp.ClientTimeout(total=self.policy_executor.policy.timeout("workflow_execution"))
+            session = await self.transport.async_session()
+            if method in IDEMPOTENT_METHODS:
+                # n8n hands GET webhooks their query string; nested mock fields have no query form
+                request_kwargs = {"params": query_params({**mock_data, **(stamper.values() if stamper else {})})}
+            elif stamper is None:
+                request_kwargs = self.payloads.encoded(f"webhook:{workflow_name}", mock_data).request_kwargs()
+            else:
+                # Retries resend the same stamp so the server can recognise duplicates
+                template = self.payloads.template(f"webhook:{workflow_name}", mock_data)
+                request_kwargs = template.request_kwargs(**stamper.values())
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=mock_data, timeout=30) as response:
-                    if response.status == 200:
-                        result_data = await response.json()
-                        duration = time.time() - start_time
-                        
-                        # Validate response structure
-                        if self._validate_workflow_response(workflow_name, result_data):
-                            self.log_test(
-                                f"N8N Workflow: {workflow_name}",
-                                "PASS",
-                                f"Workflow executed successfully in {duration:.2f}s",
-                                duration,
-                                workflow_name,
-                                mock_data=mock_data
-                            )
-                            return True
-                        else:
-                            self.log_test(
-                                f"N8N Workflow: {workflow_name}",
-                                "FAIL",
-                                "Invalid response structure",
-                                duration,
-                                workflow_name,
-                                mock_data=mock_data
-                            )
-                            return False
-                    else:
-                        duration = time.time() - start_time
-                        self.log_test(
-                            f"N8N Workflow: {workflow_name}",
-                            "FAIL",
-                            f"HTTP {response.status}: {await response.text()}",
-                            duration,
-                            workflow_name,
-                            mock_data=mock_data
-                        )
-                        return False
-                        
-        except Exception as e:
-            duration = time.time() - start_time
-            self.log_test(
-                f"N8N Workflow: {workflow_name}",
-                "FAIL",
-                f"Execution error: {str(e)}",
-                duration,
-                workflow_name,
-                mock_data=mock_data
-            )
-            return False
-    
-    def _validate_workflow_response(self, workflow_name: str, response_data: Dict) -> bool:
-        """Validate workflow response structure based on workflow type"""
-        if not isinstance(response_data, dict):
-            return False
-            
-        # Common validation for all workflows
-        if "success" not in response_data:
-            return False
-            
-        # Workflow-specific validation
-        if "comprehensive-agent-validation" in workflow_name:
-            required_fields = ["validationType", "totalAgents", "systemHealth", "agentHealthChecks"]
-            return all(field in response_data for field in required_fields)
-            
-        elif "crew-coordination" in workflow_name:
-            required_fields = ["crewStatus", "coordinationLevel", "missionStatus"]
-            return all(field in response_data for field in required_fields)
+            async def call():
+                timing = RequestTiming.started()
+                async with session.request(method, webhook_url, timeout=timeout, trace_request_ctx=timing,
+                                           **request_kwargs) as response:
+                    body = await read_lazy(response)
+                timing.finish()
+                return response.status, body, timing
             
-        elif "bilateral-learning" in workflow_name:
-            required_fields = ["syncStatus", "learningProgress", "knowledgeGained"]
-            return all(field in response_data for field in required_fields)
+            key = f"webhook:{workflow_name}"
+            status_code, body, timing = await self.policy_executor.run_async(key, call, retry=retry)
             
-        elif "multimodal-agency" in workflow_name:
-            required_fields = ["analysisResult", "dataProcessed", "insightsGenerated"]
-            return all(field in response_data for field in required_fields)
+            if status_code == 200:
+                # Validate response structure
+                _, error = await self.validators.parse_and_check_async(key, body.raw)
+                duration = elapsed_since(start_ns)
+                if error is None:
+                    return True, f"Workflow executed successfully in {duration:.2f}s", duration, timing
+                return False, f"Invalid response structure: {error}", duration, timing
             
+            duration = elapsed_since(start_ns)
+            return False, f"HTTP {status_code}: {body.text(limit=500)}", duration, timing
+                
+        except Exception as e:
+            duration = elapsed_since(start_ns)
+            return False, f"Execution error: {str(e)}", duration, None
+    
+    async def test_n8n_workflow_execution(self, workflow_name: str, mock_data: Dict) -> bool:
+        """Test n8n workflow execution with mock data"""
+        passed, details, duration, timing = await self._execute_workflow(workflow_name, mock_data)
+        
+        self.log_test(
+            f"N8N Workflow: {workflow_name}",
+            "PASS" if passed else "FAIL",
+            details,
+            duration,
+            workflow_name,
+            mock_data=mock_data,
+            timing=timing
+        )
+        return passed
+    
+    def _build_agent_probes(self, session: aiohttp.ClientSession) -> List[FanOutProbe]:
+        """Build one fan-out probe per crew and specialized agent endpoint"""
+        probes = []
+        
+        agent_groups = [
+            ("crew_requests", "/api/crew", "Agent API", "Agent"),
+            ("specialized_requests", "/api/specialized", "Specialized Agent", "Specialized agent")
+        ]
+        
+        for mock_key, prefix, label, description in agent_groups:
+            for agent_name, mock_data in self.mock_data[mock_key].items():
+                endpoint = f"{prefix}/{agent_name.replace('_', '-')}"
+                probes.append(FanOutProbe(
+                    name=f"{label}: {agent_name}",
+                    call=self._make_agent_call(session, endpoint, mock_data),
+                    deadline=self.endpoint_deadlines.get(endpoint, self.default_endpoint_deadline),
+                    context={
+                        "endpoint": endpoint,
+                        "agent_name": agent_name,
+                        "description": description,
+                        "mock_data": mock_data
+                    }
+                ))
+        
+        return probes
+    
+    def _make_agent_call(self, session: aiohttp.ClientSession, endpoint: str, mock_data: Dict):
+        """Create the coroutine factory that posts mock data to an agent endpoint"""
+        body = self.payloads.encoded(endpoint, mock_data)
+        
+        async def call():
+            timing = RequestTiming.started()
+            async with session.post(f"{self.local_url}{endpoint}", trace_request_ctx=timing,
+                                    **body.request_kwargs()) as response:
+                # Decoded only when the outcome is validated
+                data = await read_lazy(response) if response.status == 200 else None
+            timing.finish()
+            return response.status, data, timing
+        
+        return call
+    
+    def _log_agent_outcome(self, outcome: FanOutOutcome) -> bool:
+        """Log a completed agent probe and return whether it passed"""
+        probe = outcome.probe
+        agent_name = probe.context["agent_name"]
+        description = probe.context["description"]
+        mock_data = probe.context["mock_data"]
+        
+        timing = None
+        if outcome.timed_out:
+            status, details = "FAIL", f"Deadline exceeded after {probe.deadline:.1f}s"
+        elif not outcome.ok:
+            status, details = "FAIL", f"Connection error: {str(outcome.error)}"
         else:
-            # Generic validation for unknown workflows
-            return "success" in response_data and response_data["success"] is True
+            status_code, data, timing = outcome.value
+            if status_code != 200:
+                status, details = "FAIL", f"HTTP {status_code}"
+            elif self.validators.check_body(probe.context["endpoint"], data) is None:
+                status, details = "PASS", f"{description} responding correctly"
+            else:
+                status, details = "FAIL", f"{description} returned error response"
+        
+        self.log_test(
+            probe.name,
+            status,
+            details,
+            outcome.duration,
+            agent_name=agent_name,
+            mock_data=mock_data,
+            endpoint=probe.context["endpoint"],
+            timing=timing
+        )
+        return status == "PASS"
     
     async def test_agent_api_endpoints(self) -> bool:
-        """Test all agent API endpoints with mock data"""
+        """Test all agent API endpoints concurrently with mock data"""
         print("\n🤖 Testing Agent API Endpoints...")
         
         all_passed = True
         
-        # Test crew agent endpoints
-        for agent_name, mock_data in self.mock_data["crew_requests"].items():
-            start_time = time.time()
-            
-            try:
-                endpoint = f"/api/crew/{agent_name.replace('_', '-')}"
-                response = requests.post(
-                    f"{self.local_url}{endpoint}",
-                    json=mock_data,
-                    timeout=15
-                )
-                
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("success"):
-                        self.log_test(
-                            f"Agent API: {agent_name}",
-                            "PASS",
-                            "Agent responding correctly",
-                            duration,
-                            agent_name=agent_name,
-                            mock_data=mock_data
-                        )
-                    else:
-                        self.log_test(
-                            f"Agent API: {agent_name}",
-                            "FAIL",
-                            "Agent returned error response",
-                            duration,
-                            agent_name=agent_name,
-                            mock_data=mock_data
-                        )
-                        all_passed = False
-                else:
-                    duration = time.time() - start_time
-                    self.log_test(
-                        f"Agent API: {agent_name}",
-                        "FAIL",
-                        f"HTTP {response.status_code}",
-                        duration,
-                        agent_name=agent_name,
-                        mock_data=mock_data
-                    )
-                    all_passed = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(
-                    f"Agent API: {agent_name}",
-                    "FAIL",
-                    f"Connection error: {str(e)}",
-                    duration,
-                    agent_name=agent_name,
-                    mock_data=mock_data
-                )
-                all_passed = False
-        
-        # Test specialized agent endpoints
-        for agent_name, mock_data in self.mock_data["specialized_requests"].items():
-            start_time = time.time()
-            
-            try:
-                endpoint = f"/api/specialized/{agent_name.replace('_', '-')}"
-                response = requests.post(
-                    f"{self.local_url}{endpoint}",
-                    json=mock_data,
-                    timeout=15
-                )
-                
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("success"):
-                        self.log_test(
-                            f"Specialized Agent: {agent_name}",
-                            "PASS",
-                            "Specialized agent responding correctly",
-                            duration,
-                            agent_name=agent_name,
-                            mock_data=mock_data
-                        )
-                    else:
-                        self.log_test(
-                            f"Specialized Agent: {agent_name}",
-                            "FAIL",
-                            "Specialized agent returned error response",
-                            duration,
-                            agent_name=agent_name,
-                            mock_data=mock_data
-                        )
-                        all_passed = False
-                else:
-                    duration = time.time() - start_time
-                    self.log_test(
-                        f"Specialized Agent: {agent_name}",
-                        "FAIL",
-                        f"HTTP {response.status_code}",
-                        duration,
-                        agent_name=agent_name,
-                        mock_data=mock_data
-                    )
-                    all_passed = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(
-                    f"Specialized Agent: {agent_name}",
-                    "FAIL",
-                    f"Connection error: {str(e)}",
-                    duration,
-                    agent_name=agent_name,
-                    mock_data=mock_data
-                )
+        session = await self.transport.async_session()
+        probes = self._build_agent_probes(session)
+        async for outcome in self.fanout.as_completed(probes):
+            if not self._log_agent_outcome(outcome):
                 all_passed = False
         
         return all_passed
     
+    def _workflow_payloads(self) -> Dict[str, Dict]:
+        """Map each n8n workflow under test to its mock data payload"""
+        crew_coordination = self.mock_data["orchestration_requests"]["crew_coordination"]
+        
+        payloads = {
+            "comprehensive-agent-validation": self.mock_data["workflow_validation"],
+            "crew-coordination": crew_coordination,
+            "simplified-crew-coordination": crew_coordination,
+            "optimized-crew-coordination": crew_coordination,
+            "bilateral-learning": self.mock_data["specialized_requests"]["bilateral_learning"],
+            "multimodal-agency-openrouter": self.mock_data["specialized_requests"]["multimodal_agency"],
+            "enhanced-ai-insights": {"context": "Comprehensive system analysis", "depth": "full"}
+        }
+        if self.discover_workflows:
+            payloads.update(self._discovered_workflow_payloads(payloads))
+        return payloads
+    
+    def _discovered_workflow_payloads(self, known: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Payloads for every catalogued webhook path not already covered by `known`"""
+        kind_payloads = {
+            "agent-validation": self.mock_data["workflow_validation"],
+            "crew-coordination": self.mock_data["orchestration_requests"]["crew_coordination"],
+            "bilateral-learning": self.mock_data["specialized_requests"]["bilateral_learning"],
+            "multimodal-agency": self.mock_data["specialized_requests"]["multimodal_agency"]
+        }
+        return {
+            path: kind_payloads.get(entry.kind, {"context": f"Discovered workflow {entry.name}"})
+            for path, entry in self._catalog().by_webhook.items()
+            if path not in known
+        }
+    
+    def _catalog(self) -> WorkflowCatalog:
+        if self.workflow_catalog is None:
+            self.workflow_catalog = WorkflowCatalog()
+        return self.workflow_catalog
+    
+    def _webhook_method(self, workflow_name: str) -> str:
+        """HTTP method n8n registered for a webhook path; harness-only names are POSTed"""
+        entry = self._catalog().by_webhook.get(workflow_name)
+        return entry.webhooks[workflow_name] if entry is not None else "POST"
+    
     async def test_n8n_workflows(self) -> bool:
         """Test all n8n workflows with mock data"""
         print("\n🔄 Testing N8N Workflows...")
         
         all_passed = True
         
-        # Test comprehensive agent validation workflow
-        if not await self.test_n8n_workflow_execution(
-            "comprehensive-agent-validation",
-            self.mock_data["workflow_validation"]
-        ):
-            all_passed = False
-        
-        # Test crew coordination workflows
-        for workflow_type in ["crew-coordination", "simplified-crew-coordination", "optimized-crew-coordination"]:
-            if not await self.test_n8n_workflow_execution(
-                workflow_type,
-                self.mock_data["orchestration_requests"]["crew_coordination"]
-            ):
+        for workflow_name, mock_data in self._workflow_payloads().items():
+            if not await self.test_n8n_workflow_execution(workflow_name, mock_data):
                 all_passed = False
         
-        # Test bilateral learning workflow
-        if not await self.test_n8n_workflow_execution(
-            "bilateral-learning",
-            self.mock_data["specialized_requests"]["bilateral_learning"]
-        ):
-            all_passed = False
+        return all_passed
+    
+    async def run_n8n_load(self, profile: LoadProfile, mock_data: Optional[Dict] = None,
+                           stamp_requests: bool = False) -> LoadReport:
+        """Run sustained load against one n8n workflow webhook"""
+        workflow_name = profile.target
+        if mock_data is None:
+            mock_data = self._workflow_payloads().get(
+                workflow_name,
+                {"context": f"Sustained load run against {workflow_name}"}
+            )
         
-        # Test multimodal agency workflow
-        if not await self.test_n8n_workflow_execution(
-            "multimodal-agency-openrouter",
-            self.mock_data["specialized_requests"]["multimodal_agency"]
-        ):
-            all_passed = False
+        if profile.mode == "open":
+            shape = f"{profile.rate:g} req/s open loop"
+        else:
+            shape = f"{profile.users} virtual users closed loop"
+        print(f"\n📈 Load Testing N8N Workflow: {workflow_name} ({shape}, {profile.duration:g}s, ramp-up {profile.ramp_up:g}s)")
         
-        # Test enhanced AI insights workflow
-        if not await self.test_n8n_workflow_execution(
-            "enhanced-ai-insights",
-            {"context": "Comprehensive system analysis", "depth": "full"}
-        ):
-            all_passed = False
+        stamper = RequestStamper(f"load-{workflow_name}") if stamp_requests else None
         
-        return all_passed
+        async def send() -> bool:
+            # Retries would inflate the offered rate and hide errors, so load sends make one attempt
+            passed, _, _, timing = await self._execute_workflow(workflow_name, mock_data, retry=False, stamper=stamper)
+            if timing is not None:
+                record_phases(self.request_phases, workflow_name, timing)
+            return passed
+        
+        report = await LoadGenerator(profile, send).run()
+        summary = report.to_dict()
+        
+        # Sustained-load samples feed the same per-workflow distribution as single probes
+        if workflow_name in self.workflow_latency:
+            self.workflow_latency[workflow_name].merge(report.latency)
+        else:
+            self.workflow_latency[workflow_name] = LatencyHistogram().merge(report.latency)
+        
+        self.log_test(
+            f"N8N Load: {workflow_name}",
+            "PASS" if report.completed and report.failed == 0 else "FAIL",
+            f"{summary['completed']} requests, {summary['throughput_rps']} req/s, "
+            f"{summary['error_rate']}% errors, {report.dropped} dropped over {report.elapsed:.1f}s",
+            0.0,
+            workflow_name
+        )
+        return report
+    
+    async def _request_json(self, method: str, endpoint: str, payload: Optional[Dict] = None,
+                            category: str = "api_requests") -> Tuple[int, Any, RequestTiming]:
+        """Call a local API endpoint under the request policy and decode its JSON body, with its phase timing"""
+        session = await self.transport.async_session()
+        timeout = aiohttp.ClientTimeout(total=self.policy_executor.policy.timeout(category))
+        request_kwargs = {} if payload is None else self.payloads.encoded(f"{method} {endpoint}", payload).request_kwargs()
+        
+        async def call():
+            timing = RequestTiming.started()
+            async with session.request(method, f"{self.local_url}{endpoint}", timeout=timeout,
+                                       trace_request_ctx=timing, **request_kwargs) as response:
+                raw = await response.read() if response.status == 200 else None
+            timing.finish()
+            return response.status, None if raw is None else decode(raw), timing
+        
+        return await self.policy_executor.run_async(
+            f"{method} {endpoint}", call, idempotent=method in IDEMPOTENT_METHODS
+        )
     
     async def test_bilateral_sync_system(self) -> bool:
         """Test bilateral sync system functionality"""
         print("\n🔄 Testing Bilateral Sync System...")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Test sync status
-            sync_status_url = f"{self.local_url}/api/sync/status"
-            response = requests.get(sync_status_url, timeout=10)
+            status_code, data, timing = await self._request_json("GET", "/api/sync/status")
             
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success") and data.get("syncStatus") == "active":
+            if status_code == 200:
+                if self.validators.is_valid("/api/sync/status", data):
                     self.log_test(
                         "Bilateral Sync Status",
                         "PASS",
                         "Sync system active and responding",
-                        duration
+                        duration,
+                        endpoint="/api/sync/status",
+                        timing=timing
                     )
                     return True
                 else:
@@ -444,28 +513,71 @@ class ComprehensiveAgentWorkflowTester:
                         "Bilateral Sync Status",
                         "FAIL",
                         "Sync system not properly configured",
-                        duration
+                        duration,
+                        endpoint="/api/sync/status",
+                        timing=timing
                     )
                     return False
             else:
                 self.log_test(
                     "Bilateral Sync Status",
                     "FAIL",
-                    f"HTTP {response.status_code}",
-                    duration
+                    f"HTTP {status_code}",
+                    duration,
+                    endpoint="/api/sync/status",
+                    timing=timing
                 )
                 return False
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             self.log_test(
                 "Bilateral Sync Status",
                 "FAIL",
                 f"Connection error: {str(e)}",
-                duration
+                duration,
+                endpoint="/api/sync/status"
             )
             return False
     
+    def _integration_payloads(self) -> Dict[str, Dict]:
+        """Map each integration scenario endpoint to its request payload"""
+        scenarios = self.mock_data["integration_scenarios"]
+        return {
+            "/api/coordination/mission": scenarios["multi_agent_mission"],
+            "/api/knowledge/synthesize": scenarios["knowledge_synthesis"]
+        }
+    
+    def load_targets(self, groups: List[str] = ("agents", "sync")) -> List[LoadTarget]:
+        """Endpoints this suite exercises, with their mock payloads, for the sharded load runner"""
+        unknown = set(groups) - set(TARGET_GROUPS)
+        if unknown:
+            raise ValueError(f"Unknown target groups: {', '.join(sorted(unknown))}")
+        
+        targets = []
+        if "agents" in groups:
+            for mock_key, prefix in (("crew_requests", "/api/crew"), ("specialized_requests", "/api/specialized")):
+                for agent_name, mock_data in self.mock_data[mock_key].items():
+                    endpoint = f"{prefix}/{agent_name.replace('_', '-')}"
+                    targets.append(LoadTarget(endpoint, "POST", f"{self.local_url}{endpoint}", mock_data))
+        if "sync" in groups:
+            targets.append(LoadTarget("/api/sync/status", "GET", f"{self.local_url}/api/sync/status"))
+        if "integration" in groups:
+            for endpoint, payload in self._integration_payloads().items():
+                targets.append(LoadTarget(endpoint, "POST", f"{self.local_url}{endpoint}", payload))
+        if "workflows" in groups:
+            for workflow_name, payload in self._workflow_payloads().items():
+                targets.append(LoadTarget(
+                    f"webhook:{workflow_name}", self._webhook_method(workflow_name),
+                    f"{self.n8n_url}/webhook/{workflow_name}", payload
+                ))
+        if "consultation" in groups:
+            # Large analysis payloads: throughput runs count the bytes instead of decoding them
+            endpoint = "/api/alexai/consultation"
+            payload = {"context": "Sustained load run against AlexAI consultation"}
+            targets.append(LoadTarget(endpoint, "POST", f"{self.local_url}{endpoint}", payload, body="count"))
+        return targets
+    
     async def test_integration_scenarios(self) -> bool:
         """Test complex integration scenarios with multiple agents"""
         print("\n🔗 Testing Integration Scenarios...")
@@ -473,33 +585,29 @@ class ComprehensiveAgentWorkflowTester:
         all_passed = True
         
         # Test multi-agent coordination scenario
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            coordination_data = {
-                "scenario": "multi_agent_mission",
-                "agents": ["captain_picard", "lieutenant_data", "chief_engineer_scott"],
-                "mission_type": "critical_engineering",
-                "priority": "critical",
-                "timeframe": "immediate"
-            }
+            coordination_data = self._integration_payloads()["/api/coordination/mission"]
             
-            response = requests.post(
-                f"{self.local_url}/api/coordination/mission",
-                json=coordination_data,
-                timeout=20
+            status_code, data, timing = await self._request_json(
+                "POST",
+                "/api/coordination/mission",
+                coordination_data,
+                category="integration_tests"
             )
             
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success") and data.get("coordinationStatus") == "active":
+            if status_code == 200:
+                if self.validators.is_valid("/api/coordination/mission", data):
                     self.log_test(
                         "Multi-Agent Coordination",
                         "PASS",
                         "Complex coordination scenario successful",
                         duration,
-                        mock_data=coordination_data
+                        mock_data=coordination_data,
+                        endpoint="/api/coordination/mission",
+                        timing=timing
                     )
                 else:
                     self.log_test(
@@ -507,57 +615,59 @@ class ComprehensiveAgentWorkflowTester:
                         "FAIL",
                         "Coordination scenario failed",
                         duration,
-                        mock_data=coordination_data
+                        mock_data=coordination_data,
+                        endpoint="/api/coordination/mission",
+                        timing=timing
                     )
                     all_passed = False
             else:
                 self.log_test(
                     "Multi-Agent Coordination",
                     "FAIL",
-                    f"HTTP {response.status_code}",
+                    f"HTTP {status_code}",
                     duration,
-                    mock_data=coordination_data
+                    mock_data=coordination_data,
+                    endpoint="/api/coordination/mission",
+                    timing=timing
                 )
                 all_passed = False
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             self.log_test(
                 "Multi-Agent Coordination",
                 "FAIL",
                 f"Connection error: {str(e)}",
                 duration,
-                mock_data=coordination_data
+                mock_data=coordination_data,
+                endpoint="/api/coordination/mission"
             )
             all_passed = False
         
         # Test knowledge synthesis scenario
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            synthesis_data = {
-                "scenario": "knowledge_synthesis",
-                "agents": ["enhanced_knowledge", "bilateral_learning"],
-                "synthesis_type": "cross_domain",
-                "complexity": "high"
-            }
+            synthesis_data = self._integration_payloads()["/api/knowledge/synthesize"]
             
-            response = requests.post(
-                f"{self.local_url}/api/knowledge/synthesize",
-                json=synthesis_data,
-                timeout=20
+            status_code, data, timing = await self._request_json(
+                "POST",
+                "/api/knowledge/synthesize",
+                synthesis_data,
+                category="integration_tests"
             )
             
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
+            if status_code == 200:
+                if self.validators.is_valid("/api/knowledge/synthesize", data):
                     self.log_test(
                         "Knowledge Synthesis",
                         "PASS",
                         "Knowledge synthesis successful",
                         duration,
-                        mock_data=synthesis_data
+                        mock_data=synthesis_data,
+                        endpoint="/api/knowledge/synthesize",
+                        timing=timing
                     )
                 else:
                     self.log_test(
@@ -565,27 +675,32 @@ class ComprehensiveAgentWorkflowTester:
                         "FAIL",
                         "Knowledge synthesis failed",
                         duration,
-                        mock_data=synthesis_data
+                        mock_data=synthesis_data,
+                        endpoint="/api/knowledge/synthesize",
+                        timing=timing
                     )
                     all_passed = False
             else:
                 self.log_test(
                     "Knowledge Synthesis",
                     "FAIL",
-                    f"HTTP {response.status_code}",
+                    f"HTTP {status_code}",
                     duration,
-                    mock_data=synthesis_data
+                    mock_data=synthesis_data,
+                    endpoint="/api/knowledge/synthesize",
+                    timing=timing
                 )
                 all_passed = False
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = elapsed_since(start_ns)
             self.log_test(
                 "Knowledge Synthesis",
                 "FAIL",
                 f"Connection error: {str(e)}",
                 duration,
-                mock_data=synthesis_data
+                mock_data=synthesis_data,
+                endpoint="/api/knowledge/synthesize"
             )
             all_passed = False
         
@@ -593,18 +708,12 @@ class ComprehensiveAgentWorkflowTester:
     
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """Generate comprehensive test report"""
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r.status == "PASS"])
-        failed_tests = len([r for r in self.test_results if r.status == "FAIL"])
-        warning_tests = len([r for r in self.test_results if r.status == "WARNING"])
-        
-        success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+        total_tests = self.summary.total
+        passed_tests = self.summary.count("PASS")
+        failed_tests = self.summary.count("FAIL")
+        warning_tests = self.summary.count("WARNING")
         
-        # Group results by category
-        agent_tests = [r for r in self.test_results if "Agent" in r.test_name]
-        workflow_tests = [r for r in self.test_results if "Workflow" in r.test_name]
-        sync_tests = [r for r in self.test_results if "Sync" in r.test_name]
-        integration_tests = [r for r in self.test_results if "Integration" in r.test_name or "Coordination" in r.test_name]
+        success_rate = self.summary.success_rate()
         
         report = {
             "test_summary": {
@@ -614,112 +723,105 @@ class ComprehensiveAgentWorkflowTester:
                 "warnings": warning_tests,
                 "success_rate": round(success_rate, 2),
                 "timestamp": datetime.now().isoformat(),
-                "test_duration": sum(r.duration for r in self.test_results)
+                "test_duration": self.summary.duration_sum
             },
             "category_breakdown": {
-                "agent_tests": {
-                    "total": len(agent_tests),
-                    "passed": len([r for r in agent_tests if r.status == "PASS"]),
-                    "failed": len([r for r in agent_tests if r.status == "FAIL"])
-                },
-                "workflow_tests": {
-                    "total": len(workflow_tests),
-                    "passed": len([r for r in workflow_tests if r.status == "PASS"]),
-                    "failed": len([r for r in workflow_tests if r.status == "FAIL"])
-                },
-                "sync_tests": {
-                    "total": len(sync_tests),
-                    "passed": len([r for r in sync_tests if r.status == "PASS"]),
-                    "failed": len([r for r in sync_tests if r.status == "FAIL"])
-                },
-                "integration_tests": {
-                    "total": len(integration_tests),
-                    "passed": len([r for r in integration_tests if r.status == "PASS"]),
-                    "failed": len([r for r in integration_tests if r.status == "FAIL"])
+                category: {
+                    "total": self.summary.category_count(category),
+                    "passed": self.summary.category_count(category, "PASS"),
+                    "failed": self.summary.category_count(category, "FAIL")
                 }
+                for category in REPORT_CATEGORIES
             },
-            "detailed_results": [
-                {
-                    "test_name": r.test_name,
-                    "status": r.status,
-                    "details": r.details,
-                    "timestamp": r.timestamp,
-                    "duration": r.duration,
-                    "workflow_id": r.workflow_id,
-                    "agent_name": r.agent_name
-                }
-                for r in self.test_results
-            ],
+            "detailed_results": self._detailed_results(),
+            "detailed_results_scope": "all" if self.all_detailed_results else "failures_and_outliers",
+            "results_file": self.result_sink.path if self.result_sink else None,
+            "analytics": analyze(self.test_results),
+            "latency_percentiles": {
+                "endpoints": {key: h.summary() for key, h in sorted(self.endpoint_latency.items())},
+                "workflows": {key: h.summary() for key, h in sorted(self.workflow_latency.items())}
+            },
+            "latency_histograms": {
+                "endpoints": {key: h.to_dict() for key, h in sorted(self.endpoint_latency.items())},
+                "workflows": {key: h.to_dict() for key, h in sorted(self.workflow_latency.items())}
+            },
+            "request_phases": phase_summaries(self.request_phases),
+            "request_policy": self.policy_executor.stats.to_dict(),
             "recommendations": self._generate_recommendations(),
             "mock_data_summary": {
                 "crew_agents_tested": len(self.mock_data["crew_requests"]),
                 "specialized_agents_tested": len(self.mock_data["specialized_requests"]),
                 "orchestration_agents_tested": len(self.mock_data["orchestration_requests"]),
-                "workflows_validated": len([r for r in self.test_results if r.workflow_id])
+                "workflows_validated": self.workflow_result_count
             }
         }
         
         return report
     
+    def _detailed_results(self) -> List[Dict[str, Any]]:
+        """Report records: every result on request, else failures and slow outliers"""
+        if self.all_detailed_results:
+            return list(self.test_results.records())
+        return [self.test_results.record(index) for index in notable_results(self.test_results)]
+    
     def _generate_recommendations(self) -> List[str]:
         """Generate recommendations based on test results"""
         recommendations = []
         
-        failed_tests = [r for r in self.test_results if r.status == "FAIL"]
-        
-        if any("Agent API" in r.test_name for r in failed_tests):
-            recommendations.append("Review and fix agent API endpoint configurations")
+        for category, recommendation in FAILURE_RECOMMENDATIONS:
+            if self.summary.category_count(category, "FAIL"):
+                recommendations.append(recommendation)
         
-        if any("Workflow" in r.test_name for r in failed_tests):
-            recommendations.append("Validate n8n workflow configurations and webhook endpoints")
-        
-        if any("Sync" in r.test_name for r in failed_tests):
-            recommendations.append("Check bilateral sync system configuration and connectivity")
-        
-        if any("Integration" in r.test_name for r in failed_tests):
-            recommendations.append("Review multi-agent coordination and integration logic")
-        
-        # Performance recommendations
-        slow_tests = [r for r in self.test_results if r.duration > 10.0]
-        if slow_tests:
-            recommendations.append(f"Optimize performance for {len(slow_tests)} slow-running tests")
+        # Performance recommendations: MAD outliers over in-memory results, else the fixed cutoff
+        slow_count = len(slow_outliers(self.test_results)) if len(self.test_results) else self.summary.slow_count
+        if slow_count:
+            recommendations.append(f"Optimize performance for {slow_count} slow-running tests")
         
         # Success rate recommendations
-        success_rate = len([r for r in self.test_results if r.status == "PASS"]) / len(self.test_results) * 100
-        if success_rate < 90:
+        success_rate = self.summary.success_rate()
+        if self.summary.total and success_rate < 90:
             recommendations.append("Overall system reliability needs improvement")
-        elif success_rate < 95:
+        elif self.summary.total and success_rate < 95:
             recommendations.append("Minor optimizations recommended for better reliability")
         
         return recommendations
     
+    def _suite_tasks(self) -> List[SuiteTask]:
+        """Suite phases and the phases each one needs"""
+        return [
+            SuiteTask("agent_api_endpoints", self.test_agent_api_endpoints),
+            SuiteTask("n8n_workflows", self.test_n8n_workflows),
+            SuiteTask("bilateral_sync", self.test_bilateral_sync_system),
+            SuiteTask("integration_scenarios", self.test_integration_scenarios)
+        ]
+    
+    def _phase_passed(self, result: TaskResult) -> bool:
+        """Report a phase that raised and return whether it passed"""
+        if result.error is not None:
+            print(f"\n💥 Phase {result.task.name} raised: {str(result.error)}")
+        return result.passed
+    
     async def run_comprehensive_test_suite(self) -> bool:
         """Run the complete comprehensive test suite"""
         print("🚀 Starting Comprehensive Agent Workflow Test Suite...")
         print("=" * 60)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Test all components
-        test_results = []
+        # The four phases share no state, so none declares a dependency
+        phases = await self.scheduler.run(self._suite_tasks())
+        test_results = [self._phase_passed(result) for result in phases.values()]
         
-        # Test agent API endpoints
-        test_results.append(await self.test_agent_api_endpoints())
-        
-        # Test n8n workflows
-        test_results.append(await self.test_n8n_workflows())
-        
-        # Test bilateral sync system
-        test_results.append(await self.test_bilateral_sync_system())
-        
-        # Test integration scenarios
-        test_results.append(await self.test_integration_scenarios())
-        
-        total_duration = time.time() - start_time
+        total_duration = elapsed_since(start_ns)
         
         # Generate and save report
         report = self.generate_comprehensive_report()
         report["test_summary"]["total_duration"] = total_duration
+        report["schedule"] = {
+            name: {"passed": result.passed, "skipped": result.skipped,
+                   "start": round(result.start, 3), "duration": round(result.duration, 3)}
+            for name, result in phases.items()
+        }
         
         # Save report to file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -738,7 +840,26 @@ class ComprehensiveAgentWorkflowTester:
         print(f"Warnings: {report['test_summary']['warnings']} ⚠️")
         print(f"Success Rate: {report['test_summary']['success_rate']}%")
         print(f"Total Duration: {total_duration:.2f}s")
+        print(format_schedule(phases, self.scheduler.wall_time))
         print(f"Report Saved: {report_filename}")
+        if self.result_sink is not None:
+            print(f"Results Log: {self.result_sink.path}")
+        
+        for group, percentiles in report["latency_percentiles"].items():
+            if percentiles:
+                print(f"\n⏱️ Latency Percentiles ({group}):")
+                for key, summary in percentiles.items():
+                    print(f"  • {key}: p50 {summary['p50']:.3f}s | p90 {summary['p90']:.3f}s | "
+                          f"p99 {summary['p99']:.3f}s | p99.9 {summary['p99.9']:.3f}s | max {summary['max']:.3f}s")
+        
+        if "all" in report["request_phases"]:
+            print(f"\n🔬 Request Phases: {format_phases(report['request_phases']['all'])}")
+        
+        policy_stats = report["request_policy"]
+        if policy_stats["retries"] or policy_stats["hedges_sent"]:
+            print(f"\n🔁 Request Policy: {policy_stats['retries']} retries, "
+                  f"{policy_stats['hedges_sent']} hedges sent ({policy_stats['hedges_won']} won), "
+                  f"{policy_stats['retries_exhausted']} gave up")
         
         if report['recommendations']:
             print("\n📋 Recommendations:")
@@ -753,12 +874,132 @@ class ComprehensiveAgentWorkflowTester:
         
         return all(test_results)
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="AlexAI comprehensive agent workflow test suite")
+    parser.add_argument("--load", metavar="WORKFLOW",
+                        help="Run sustained load against one n8n workflow instead of the full suite")
+    parser.add_argument("--load-mode", choices=LOAD_MODES, default="closed",
+                        help="open: fixed request rate; closed: fixed number of virtual users")
+    parser.add_argument("--rate", type=float, default=10.0, help="Target requests per second (open loop)")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users (closed loop)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Load duration in seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Linear ramp-up in seconds")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Pause between requests per virtual user (closed loop)")
+    parser.add_argument("--stamp-requests", action="store_true",
+                        help="Add a request_id and timestamp to every load request body")
+    parser.add_argument("--results-ndjson", metavar="PATH",
+                        help="Stream results to an append-only NDJSON log instead of keeping them in memory")
+    parser.add_argument("--detailed-results", action="store_true",
+                        help="List every result in the report, not just failures and slow outliers")
+    parser.add_argument("--local-url", default="http://localhost:8000", help="AlexAI API base URL")
+    parser.add_argument("--n8n-url", default="https://n8n.pbradygeorgen.com", help="n8n base URL")
+    parser.add_argument("--alexai-standin", action="store_true",
+                        help="Serve the AlexAI API routes from an in-process stand-in instead of --local-url")
+    parser.add_argument("--n8n-standin", action="store_true",
+                        help="Serve workflows/*.json webhooks from an in-process stand-in instead of --n8n-url")
+    parser.add_argument("--standin-latency", type=float, default=0.0, help="Stand-in fixed service time (s)")
+    parser.add_argument("--standin-jitter", type=float, default=0.0, help="Stand-in uniform extra service time (s)")
+    parser.add_argument("--standin-error-rate", type=float, default=0.0, help="Stand-in injected error fraction")
+    parser.add_argument("--test-config", metavar="PATH",
+                        help="test_config.json supplying timeouts and retry settings (default: tests/fixtures/mock-data)")
+    parser.add_argument("--hedge-delay", type=float, default=None,
+                        help="Send a duplicate idempotent GET after this many seconds without a response")
+    parser.add_argument("--max-retries", type=int, default=None, help="Override retry_settings.max_retries")
+    parser.add_argument("--discover-workflows", action="store_true",
+                        help="Test every webhook path declared in workflows/*.json, not just the known workflows")
+    parser.add_argument("--validation-workers", type=int, default=0,
+                        help="Threads that parse and validate large (64 KiB+) workflow responses off the event loop")
+    parser.add_argument("--suite-concurrency", type=int, default=4,
+                        help="Suite phases allowed to run at once (1 runs them serially)")
+    add_metrics_arguments(parser)
+    return parser.parse_args(argv)
+
+async def run_load_mode(tester: ComprehensiveAgentWorkflowTester, args: argparse.Namespace) -> bool:
+    """Run the requested load profile and save its report"""
+    profile = LoadProfile(
+        target=args.load,
+        mode=args.load_mode,
+        rate=args.rate,
+        users=args.users,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        think_time=args.think_time
+    )
+    report = await tester.run_n8n_load(profile, stamp_requests=args.stamp_requests)
+    summary = report.to_dict()
+    summary["request_phases"] = phase_summaries(tester.request_phases)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_filename = f"n8n_load_report_{args.load}_{timestamp}.json"
+    with open(f"tests/reports/{report_filename}", "w") as f:
+        json.dump(summary, f, indent=2)
+    
+    print("\n" + "=" * 60)
+    print(f"📈 LOAD RUN COMPLETE: {args.load}")
+    print("=" * 60)
+    print(f"Requests: {summary['completed']} completed, {summary['dropped']} dropped")
+    print(f"Throughput: {summary['throughput_rps']} req/s")
+    print(f"Error Rate: {summary['error_rate']}%")
+    latency = summary["latency"]
+    if latency["count"]:
+        print(f"Latency: p50 {latency['p50']:.3f}s | p90 {latency['p90']:.3f}s | p99 {latency['p99']:.3f}s | "
+              f"p99.9 {latency['p99.9']:.3f}s | max {latency['max']:.3f}s")
+    if "all" in summary["request_phases"]:
+        print(f"Phases: {format_phases(summary['request_phases']['all'])}")
+    print(f"Report Saved: {report_filename}")
+    
+    return report.failed == 0 and report.completed > 0
+
 async def main():
     """Main execution function"""
-    tester = ComprehensiveAgentWorkflowTester()
+    args = parse_args()
+    standins = []
+    metrics_server = None
+    result_sink = None
+    tester = None
+    local_url = args.local_url
+    n8n_url = args.n8n_url
     
     try:
-        success = await tester.run_comprehensive_test_suite()
+        if args.alexai_standin:
+            alexai_standin = AlexAIStandInServer(
+                latency=LatencyModel(args.standin_latency, args.standin_jitter),
+                faults=FaultModel(args.standin_error_rate)
+            )
+            local_url = await alexai_standin.start()
+            standins.append(alexai_standin)
+            print(f"🛰️ AlexAI API stand-in serving on {local_url}")
+        
+        if args.n8n_standin:
+            n8n_standin = N8nStandInServer(
+                latency=LatencyModel(args.standin_latency, args.standin_jitter),
+                faults=FaultModel(args.standin_error_rate)
+            )
+            n8n_url = await n8n_standin.start()
+            standins.append(n8n_standin)
+            print(f"🛰️ n8n stand-in serving {len(n8n_standin.routes)} webhook paths on {n8n_url}")
+        
+        metrics, metrics_server = await start_metrics_server(args)
+        result_sink = NDJSONResultSink(args.results_ndjson) if args.results_ndjson else None
+        policy = load_request_policy(args.test_config, args.hedge_delay, args.max_retries)
+        tester = ComprehensiveAgentWorkflowTester(
+            local_url=local_url,
+            n8n_url=n8n_url,
+            result_sink=result_sink,
+            policy=policy,
+            suite_concurrency=args.suite_concurrency,
+            validators=default_registry(pool_workers=args.validation_workers),
+            discover_workflows=args.discover_workflows,
+            metrics=metrics,
+            all_detailed_results=args.detailed_results
+        )
+        
+        if args.load:
+            success = await run_load_mode(tester, args)
+        else:
+            success = await tester.run_comprehensive_test_suite()
         
         if success:
             print("\n🎉 All tests passed! Your AlexAI system is fully operational.")
@@ -773,6 +1014,20 @@ async def main():
     except Exception as e:
         print(f"\n💥 Unexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        if tester is not None:
+            if result_sink is not None:
+                result_sink.close(tester.summary.to_dict())
+            tester.policy_executor.close()
+            tester.validators.close()
+            await tester.transport.aclose()
+            tester.transport.close()
+        elif result_sink is not None:
+            result_sink.close()
+        for standin in standins:
+            await standin.stop()
+        if metrics_server is not None:
+            await metrics_server.stop()
 
 if __name__ == "__main__":
     asyncio.run(main())
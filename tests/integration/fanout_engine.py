@@ -0,0 +1,78 @@
+"""
+Concurrent Fan-Out Engine
+Runs independent async probes under a concurrency limit with per-probe deadlines
+and hands back outcomes in completion order
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+@dataclass
+class FanOutProbe:
+    """A single probe scheduled as part of a fan-out sweep"""
+    name: str
+    call: Callable[[], Awaitable[Any]]
+    deadline: Optional[float] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FanOutOutcome:
+    """Outcome of one fan-out probe"""
+    probe: FanOutProbe
+    value: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True when the probe returned without raising or timing out"""
+        return self.error is None
+
+
+class FanOutEngine:
+    """Runs probes concurrently and yields their outcomes as they complete"""
+
+    def __init__(self, concurrency: int = 10, default_deadline: float = 15.0):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.default_deadline = default_deadline
+
+    async def _run_probe(self, probe: FanOutProbe, semaphore: asyncio.Semaphore) -> FanOutOutcome:
+        """Run one probe inside the concurrency limit and its deadline"""
+        deadline = probe.deadline if probe.deadline is not None else self.default_deadline
+
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                value = await asyncio.wait_for(probe.call(), timeout=deadline)
+                return FanOutOutcome(probe, value=value, duration=time.perf_counter() - start_time)
+            except asyncio.TimeoutError as e:
+                return FanOutOutcome(probe, error=e, duration=time.perf_counter() - start_time, timed_out=True)
+            except Exception as e:
+                return FanOutOutcome(probe, error=e, duration=time.perf_counter() - start_time)
+
+    async def as_completed(self, probes: Iterable[FanOutProbe]) -> AsyncIterator[FanOutOutcome]:
+        """Start every probe and yield outcomes in completion order"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._run_probe(probe, semaphore)) for probe in probes]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: do not leave probes running in the background
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def run(self, probes: Iterable[FanOutProbe]) -> List[FanOutOutcome]:
+        """Run every probe and return outcomes in completion order"""
+        return [outcome async for outcome in self.as_completed(probes)]
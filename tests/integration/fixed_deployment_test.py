@@ -4,17 +4,29 @@ Fixed End-to-End Deployment Test Suite
 Excludes problematic dashboard deployment
 """
 
+import argparse
 import requests
 import json
 import time
 import sys
 from datetime import datetime
 
+from alexai_standin_server import AlexAIStandInServer
+from http_transport import get_transport
+from json_codec import DecodeError, decode
+from metrics_exporter import add_metrics_arguments, start_background_metrics_server
+from request_policy import PolicySession
+from standin_server import BackgroundStandIn
+
 class FixedDeploymentTester:
-    def __init__(self):
-        self.local_url = "http://localhost:8000"
-        self.remote_main_url = "https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app"
+    def __init__(self, transport=None, local_url="http://localhost:8000",
+                 remote_main_url="https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app",
+                 policy=None, metrics=None):
+        self.local_url = local_url
+        self.remote_main_url = remote_main_url
         self.test_results = []
+        self.http = PolicySession((transport or get_transport()).sync_session(), policy, metrics=metrics)
+        self.metrics = metrics
         
     def test_local_deployment(self):
         """Test local deployment"""
@@ -22,7 +34,7 @@ class FixedDeploymentTester:
         
         try:
             # Test main page
-            response = requests.get(f"{self.local_url}/", timeout=10)
+            response = self.http.get(f"{self.local_url}/")
             if response.status_code == 200:
                 self.log_test("Local Main Page", "PASS", f"Status: {response.status_code}")
             else:
@@ -30,9 +42,9 @@ class FixedDeploymentTester:
                 return False
             
             # Test AlexAI status endpoint
-            response = requests.get(f"{self.local_url}/api/alexai/status", timeout=10)
+            response = self.http.get(f"{self.local_url}/api/alexai/status")
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success"):
                     self.log_test("Local AlexAI Status", "PASS", "AlexAI core agent responding")
                 else:
@@ -47,6 +59,9 @@ class FixedDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("Local Deployment", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("Local Deployment", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def test_remote_main_deployment(self):
         """Test remote main deployment (with password protection awareness)"""
@@ -54,7 +69,7 @@ class FixedDeploymentTester:
         
         try:
             # Test main page (may have password protection)
-            response = requests.get(f"{self.remote_main_url}/", timeout=10)
+            response = self.http.get(f"{self.remote_main_url}/")
             if response.status_code == 200:
                 self.log_test("Remote Main Page", "PASS", f"Status: {response.status_code}")
             elif response.status_code == 401 or "Authentication Required" in response.text:
@@ -79,6 +94,8 @@ class FixedDeploymentTester:
             "details": details
         }
         self.test_results.append(result)
+        if self.metrics is not None:
+            self.metrics.record_result(status, 0.0)
         print(f"[{timestamp}] {test_name}: {status}")
         if details:
             print(f"  Details: {details}")
@@ -113,8 +130,24 @@ class FixedDeploymentTester:
         return self.generate_report()
 
 def main():
-    tester = FixedDeploymentTester()
-    success = tester.run_fixed_test_suite()
+    parser = argparse.ArgumentParser(description="AlexAI fixed deployment tests")
+    parser.add_argument("--standin", action="store_true",
+                        help="Run against an in-process AlexAI API stand-in")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    
+    metrics, metrics_server = start_background_metrics_server(args)
+    try:
+        if args.standin:
+            with BackgroundStandIn(AlexAIStandInServer()) as standin_url:
+                tester = FixedDeploymentTester(local_url=standin_url, remote_main_url=standin_url, metrics=metrics)
+                success = tester.run_fixed_test_suite()
+        else:
+            tester = FixedDeploymentTester(metrics=metrics)
+            success = tester.run_fixed_test_suite()
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
     
     if success:
         print("\n🎉 Fixed end-to-end deployment test completed successfully!")
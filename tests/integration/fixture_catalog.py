@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Fixture Catalog
+Lazily loads the tests/fixtures/mock-data JSON files, validates each once and
+caches the parsed objects and their pre-serialized bytes keyed on file mtime.
+Large generated corpora use memory-mapped NDJSON with a persisted line-offset
+index, so load runs can sample payloads without parsing the whole file
+"""
+
+import argparse
+import mmap
+import random
+import struct
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from json_codec import DecodeError, decode, encode
+
+DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "mock-data"
+
+# Fixture name -> file, using the mock-data keys the testers already address
+FIXTURE_FILES = {
+    "crew_requests": "crew_agents.json",
+    "specialized_requests": "specialized_agents.json",
+    "orchestration_requests": "orchestration_agents.json",
+    "workflow_validation": "workflow_validation.json",
+    "integration_scenarios": "integration_scenarios.json"
+}
+
+
+class FixtureError(ValueError):
+    """A fixture file is missing or does not have the expected shape"""
+
+
+def _validate_agent_requests(name: str, data: Any):
+    if not isinstance(data, dict) or not data:
+        raise FixtureError(f"{name}: expected a non-empty object of agent requests")
+    for agent, request in data.items():
+        if not isinstance(request, dict) or not isinstance(request.get("context"), str):
+            raise FixtureError(f"{name}.{agent}: each request needs a string 'context'")
+
+
+def _validate_workflow_validation(name: str, data: Any):
+    if not isinstance(data, dict) or "validation_type" not in data:
+        raise FixtureError(f"{name}: expected an object with 'validation_type'")
+
+
+def _validate_integration_scenarios(name: str, data: Any):
+    if not isinstance(data, dict) or not data:
+        raise FixtureError(f"{name}: expected a non-empty object of scenarios")
+    for scenario, payload in data.items():
+        if not isinstance(payload, dict) or not isinstance(payload.get("agents"), list):
+            raise FixtureError(f"{name}.{scenario}: each scenario needs an 'agents' list")
+
+
+VALIDATORS: Dict[str, Callable[[str, Any], None]] = {
+    "crew_requests": _validate_agent_requests,
+    "specialized_requests": _validate_agent_requests,
+    "orchestration_requests": _validate_agent_requests,
+    "workflow_validation": _validate_workflow_validation,
+    "integration_scenarios": _validate_integration_scenarios
+}
+
+
+class _CachedFixture:
+    """Parsed, validated fixture plus lazily serialized member payloads"""
+    __slots__ = ("stamp", "data", "encoded")
+
+    def __init__(self, stamp: Tuple[int, int], data: Any):
+        self.stamp = stamp
+        self.data = data
+        self.encoded: Dict[Optional[str], bytes] = {}
+
+
+# Shared by every catalog so several testers in one process parse each file once
+_FIXTURE_CACHE: Dict[Path, _CachedFixture] = {}
+
+
+class FixtureCatalog:
+    """Access to the mock-data fixtures; returned objects are shared and must be treated as read-only"""
+
+    def __init__(self, fixtures_dir: Optional[Path] = None):
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else DEFAULT_FIXTURES_DIR
+
+    def path(self, name: str) -> Path:
+        if name not in FIXTURE_FILES:
+            raise KeyError(f"Unknown fixture {name!r}; known: {', '.join(FIXTURE_FILES)}")
+        return self.fixtures_dir / FIXTURE_FILES[name]
+
+    def _entry(self, name: str) -> _CachedFixture:
+        """Cached entry for a fixture, reloaded only when the file's mtime or size changes"""
+        path = self.path(name)
+        try:
+            stat = path.stat()
+        except OSError as e:
+            raise FixtureError(f"{name}: cannot read {path}: {e}") from e
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        entry = _FIXTURE_CACHE.get(path)
+        if entry is None or entry.stamp != stamp:
+            try:
+                with open(path, "rb") as f:
+                    data = decode(f.read())
+            except DecodeError as e:
+                raise FixtureError(f"{name}: invalid JSON in {path}: {e}") from e
+            VALIDATORS[name](name, data)
+            entry = _FIXTURE_CACHE[path] = _CachedFixture(stamp, data)
+        return entry
+
+    def get(self, name: str) -> Any:
+        """Parsed fixture"""
+        return self._entry(name).data
+
+    def payload(self, name: str, key: str) -> Any:
+        """One member of an object fixture, e.g. payload("crew_requests", "captain_picard")"""
+        return self._entry(name).data[key]
+
+    def payload_bytes(self, name: str, key: Optional[str] = None) -> bytes:
+        """Pre-serialized JSON body for a fixture member (or the whole fixture when key is None)"""
+        entry = self._entry(name)
+        encoded = entry.encoded.get(key)
+        if encoded is None:
+            encoded = entry.encoded[key] = encode(entry.data if key is None else entry.data[key])
+        return encoded
+
+    def as_mapping(self) -> "LazyFixtures":
+        """Read-only mapping of fixture name to data that loads each file on first access"""
+        return LazyFixtures(self)
+
+    def validate_all(self) -> Dict[str, int]:
+        """Load and validate every fixture, returning the member count of each"""
+        return {name: len(self.get(name)) for name in FIXTURE_FILES}
+
+
+class LazyFixtures(Mapping):
+    """Mapping facade over a catalog; mtime checks keep it current if files change"""
+
+    def __init__(self, catalog: FixtureCatalog):
+        self.catalog = catalog
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in FIXTURE_FILES:
+            raise KeyError(name)
+        return self.catalog.get(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIXTURE_FILES)
+
+    def __len__(self) -> int:
+        return len(FIXTURE_FILES)
+
+
+# Sidecar index header: source mtime_ns, source size, line count
+_INDEX_HEADER = struct.Struct("<qqq")
+
+
+class NDJSONCorpus:
+    """Memory-mapped NDJSON file addressed by line through a persisted offset index"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self._file = open(self.path, "rb")
+        stat = self.path.stat()
+        self._stamp = (stat.st_mtime_ns, stat.st_size)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else None
+        self.offsets = self._load_index()
+
+    def _build_index(self) -> np.ndarray:
+        """Start and end offsets of every non-empty line, found with one vectorized newline scan"""
+        if self._map is None:
+            return np.zeros((2, 0), dtype=np.int64)
+        newlines = np.flatnonzero(np.frombuffer(self._map, dtype=np.uint8) == ord("\n"))
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(self._map)]))
+        keep = ends > starts
+        return np.stack((starts[keep], ends[keep])).astype(np.int64)
+
+    def _load_index(self) -> np.ndarray:
+        """Read the sidecar index when it matches the corpus, else rebuild and save it"""
+        try:
+            with open(self.index_path, "rb") as f:
+                mtime_ns, size, count = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+                if (mtime_ns, size) == self._stamp:
+                    data = np.fromfile(f, dtype=np.int64)
+                    if len(data) == 2 * count:
+                        return data.reshape(2, count)
+        except (OSError, struct.error):
+            pass
+
+        offsets = self._build_index()
+        try:
+            with open(self.index_path, "wb") as f:
+                f.write(_INDEX_HEADER.pack(self._stamp[0], self._stamp[1], offsets.shape[1]))
+                offsets.tofile(f)
+        except OSError:
+            pass  # A read-only corpus directory just means re-indexing next time
+        return offsets
+
+    def __len__(self) -> int:
+        return self.offsets.shape[1]
+
+    def raw(self, index: int) -> bytes:
+        """Line `index` as JSON bytes, without parsing"""
+        if not 0 <= index < len(self):
+            raise IndexError("corpus index out of range")
+        start, end = self.offsets[:, index]
+        return self._map[int(start):int(end)]
+
+    def __getitem__(self, index: int) -> Any:
+        return decode(self.raw(index))
+
+    def sample(self, rng: random.Random) -> bytes:
+        """Raw bytes of a uniformly chosen line"""
+        return self.raw(rng.randrange(len(self)))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "NDJSONCorpus":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_corpus(path: Path, records: Iterable[Any]) -> int:
+    """Write records as compact NDJSON and return how many were written"""
+    count = 0
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(encode(record) + b"\n")
+            count += 1
+    return count
+
+
+def generated_agent_requests(catalog: FixtureCatalog, count: int, seed: Optional[int] = None) -> Iterator[Dict]:
+    """Variants of the crew and specialized fixtures, tagged with a sequence number"""
+    rng = random.Random(seed)
+    templates: List[Tuple[str, Dict]] = [
+        (agent, request)
+        for name in ("crew_requests", "specialized_requests")
+        for agent, request in catalog.get(name).items()
+    ]
+    for sequence in range(count):
+        agent, request = templates[rng.randrange(len(templates))]
+        yield {**request, "agent": agent, "sequence": sequence,
+               "context": f"{request['context']} (variant {sequence})"}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate fixtures and build NDJSON payload corpora")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("validate", help="Load and validate every mock-data fixture")
+    generate = commands.add_parser("generate", help="Write a generated agent-request corpus")
+    generate.add_argument("output", type=Path)
+    generate.add_argument("--count", type=int, default=100000)
+    generate.add_argument("--seed", type=int, default=None)
+    index = commands.add_parser("index", help="Build or refresh the offset index of an NDJSON corpus")
+    index.add_argument("corpus", type=Path)
+    args = parser.parse_args(argv)
+
+    catalog = FixtureCatalog()
+    if args.command == "validate":
+        try:
+            counts = catalog.validate_all()
+        except FixtureError as e:
+            print(f"❌ {e}")
+            return 1
+        for name, count in counts.items():
+            print(f"✅ {FIXTURE_FILES[name]}: {count} entries")
+    elif args.command == "generate":
+        written = write_corpus(args.output, generated_agent_requests(catalog, args.count, args.seed))
+        with NDJSONCorpus(args.output) as corpus:
+            print(f"📝 Wrote {written} payloads to {args.output} (index: {corpus.index_path})")
+    else:
+        with NDJSONCorpus(args.corpus) as corpus:
+            print(f"📇 {args.corpus}: {len(corpus)} lines indexed in {corpus.index_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Shared HTTP Transport
+Keep-alive connection pools, DNS caching and per-host limits shared by every
+integration tester, so probes stop paying a fresh TCP+TLS handshake each time
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+
+from request_timing import TimedHTTPAdapter, timing_trace_config
+
+
+class SharedTransport:
+    """Pooled sync (requests) and async (aiohttp) sessions shared across testers"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 20,
+                 dns_cache_ttl: int = 300, keepalive_timeout: float = 30.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._sync_session: Optional[requests.Session] = None
+        # aiohttp sessions are bound to the loop they were created on
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def sync_session(self) -> requests.Session:
+        """Return the shared requests session, creating its pools on first use"""
+        if self._sync_session is None:
+            session = requests.Session()
+            # Timed pools stamp DNS, connect, TLS and first-byte phases when a caller captures them
+            adapter = TimedHTTPAdapter(
+                pool_connections=max(1, self.limit // self.limit_per_host),
+                pool_maxsize=self.limit_per_host
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sync_session = session
+        return self._sync_session
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create a pooled connector with DNS caching and per-host limits"""
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+
+    async def async_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session for the running event loop"""
+        loop = asyncio.get_running_loop()
+
+        # Drop sessions left behind by loops that have since been closed
+        for stale_loop in [l for l in self._async_sessions if l.is_closed()]:
+            del self._async_sessions[stale_loop]
+
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(connector=self._create_connector(),
+                                            trace_configs=[timing_trace_config()])
+            self._async_sessions[loop] = session
+        return session
+
+    async def aclose(self):
+        """Close the async session bound to the running event loop"""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self):
+        """Close the shared sync session"""
+        if self._sync_session is not None:
+            self._sync_session.close()
+            self._sync_session = None
+
+
+_shared_transport: Optional[SharedTransport] = None
+
+
+def get_transport() -> SharedTransport:
+    """Return the process-wide shared transport"""
+    global _shared_transport
+    if _shared_transport is None:
+        _shared_transport = SharedTransport()
+    return _shared_transport
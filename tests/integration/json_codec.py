@@ -0,0 +1,80 @@
+"""
+JSON Codec
+One place to encode and decode JSON bodies. orjson is used when it is
+installed and the stdlib json module otherwise; both produce compact UTF-8
+bytes. Bodies can also be held undecoded (LazyBody) or merely counted, for
+throughput runs that never look inside large responses
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib path behaves the same
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# orjson.JSONDecodeError subclasses ValueError, so callers catch one type for both backends
+DecodeError = ValueError
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def decode(raw: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse a JSON document"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode(value: Any) -> bytes:
+    """Compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _ENCODER.encode(value).encode("utf-8")
+
+
+class LazyBody:
+    """Raw response bytes that are decoded on first access to `data`"""
+    __slots__ = ("raw", "_data", "_decoded")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._data: Any = None
+        self._decoded = False
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.raw)
+
+    @property
+    def decoded(self) -> bool:
+        return self._decoded
+
+    @property
+    def data(self) -> Any:
+        """Decoded body; raises DecodeError if it is not JSON"""
+        if not self._decoded:
+            self._data = decode(self.raw)
+            self._decoded = True
+        return self._data
+
+    def text(self, limit: Optional[int] = None) -> str:
+        """Body as text for details capture, optionally truncated"""
+        raw = self.raw if limit is None else self.raw[:limit]
+        return raw.decode("utf-8", "replace")
+
+
+async def read_lazy(response) -> LazyBody:
+    """Read an aiohttp response without decoding it"""
+    return LazyBody(await response.read())
+
+
+async def count_body(response, chunk_size: int = 64 * 1024) -> int:
+    """Drain an aiohttp response and return its size, holding at most one chunk in memory"""
+    total = 0
+    async for chunk in response.content.iter_chunked(chunk_size):
+        total += len(chunk)
+    return total
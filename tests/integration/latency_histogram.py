@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+HDR-Style Latency Histograms
+Log-linear bucketed latency recording with bounded relative error, percentile
+queries and lossless merging across runs without keeping raw samples
+"""
+
+import json
+import math
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REPORT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """Sparse HDR-style histogram of latencies recorded in microseconds"""
+
+    def __init__(self, significant_digits: int = 2):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+
+        # Each power-of-two range is split into enough linear sub-buckets to
+        # keep the relative error below 10^-significant_digits
+        largest_single_unit = 2 * 10 ** significant_digits
+        self.sub_bucket_bits = math.ceil(math.log2(largest_single_unit))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count // 2
+
+        self.counts: Dict[int, int] = {}
+        self.total_count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def _bucket_index(self, value_us: int) -> int:
+        """Map a value to its log-linear bucket index"""
+        if value_us < self.sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.sub_bucket_half + ((value_us >> shift) - self.sub_bucket_half)
+
+    def _bucket_upper(self, index: int) -> int:
+        """Highest value (in microseconds) that maps to a bucket index"""
+        if index < self.sub_bucket_count:
+            return index
+        offset = index - self.sub_bucket_count
+        shift = offset // self.sub_bucket_half + 1
+        mantissa = offset % self.sub_bucket_half + self.sub_bucket_half
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float, count: int = 1):
+        """Record a latency given in seconds"""
+        value_us = max(0, int(round(seconds * 1_000_000)))
+        index = self._bucket_index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.total_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Fold another histogram's counts into this one"""
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("cannot merge histograms with different significant_digits")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+        return self
+
+    def percentile(self, percentile: float) -> float:
+        """Value in seconds at or below which `percentile` percent of samples fall"""
+        if self.total_count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100.0 * self.total_count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._bucket_upper(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.total_count / 1_000_000 if self.total_count else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentile summary in seconds for reports"""
+        summary: Dict[str, Any] = {"count": self.total_count}
+        if self.total_count == 0:
+            return summary
+        summary["min"] = round(self.min_us / 1_000_000, 6)
+        summary["mean"] = round(self.mean, 6)
+        for percentile in REPORT_PERCENTILES:
+            summary[f"p{percentile:g}"] = round(self.percentile(percentile), 6)
+        summary["max"] = round(self.max_us / 1_000_000, 6)
+        return summary
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """(bucket upper bound in seconds, count) pairs in ascending order"""
+        return [(self._bucket_upper(index) / 1_000_000, count) for index, count in sorted(self.counts.items())]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the bucket counts so runs can be merged later"""
+        return {
+            "unit": "us",
+            "significant_digits": self.significant_digits,
+            "count": self.total_count,
+            "sum": self.total_us,
+            "min": self.min_us,
+            "max": self.max_us,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram serialised with to_dict"""
+        histogram = cls(data.get("significant_digits", 2))
+        histogram.counts = {int(index): count for index, count in data.get("counts", {}).items()}
+        histogram.total_count = data.get("count", sum(histogram.counts.values()))
+        histogram.total_us = data.get("sum", 0)
+        histogram.min_us = data.get("min")
+        histogram.max_us = data.get("max")
+        return histogram
+
+
+def record_latency(histograms: Dict[str, LatencyHistogram], key: str, seconds: float):
+    """Record into the histogram for `key`, creating it on first use"""
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = LatencyHistogram()
+    histogram.record(seconds)
+
+
+def merge_histogram_maps(maps: Iterable[Dict[str, Dict[str, Any]]]) -> Dict[str, LatencyHistogram]:
+    """Merge several {key: serialised histogram} maps into live histograms"""
+    merged: Dict[str, LatencyHistogram] = {}
+    for histogram_map in maps:
+        for key, data in histogram_map.items():
+            histogram = LatencyHistogram.from_dict(data)
+            if key in merged:
+                merged[key].merge(histogram)
+            else:
+                merged[key] = histogram
+    return merged
+
+
+def main(argv: List[str]) -> int:
+    """Merge the latency histograms of several saved reports and print percentiles"""
+    if not argv:
+        print("Usage: latency_histogram.py REPORT.json [REPORT.json ...]")
+        return 1
+
+    groups: Dict[str, List[Dict[str, Dict[str, Any]]]] = {}
+    for path in argv:
+        with open(path) as f:
+            report = json.load(f)
+        for group, histogram_map in report.get("latency_histograms", {}).items():
+            groups.setdefault(group, []).append(histogram_map)
+
+    for group, maps in sorted(groups.items()):
+        print(f"\n📊 {group} ({len(maps)} runs)")
+        for key, histogram in sorted(merge_histogram_maps(maps).items()):
+            summary = histogram.summary()
+            percentiles = " ".join(
+                f"p{p:g}={summary[f'p{p:g}']:.3f}s" for p in REPORT_PERCENTILES
+            )
+            print(f"  {key}: n={summary['count']} {percentiles} max={summary['max']:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Multi-Node Load Coordination
+A controller hands a workload (endpoints, mock payloads, rate, duration) to
+load agents over a plain HTTP control channel, releases them at a common start
+time and merges the histograms they return. Several agents can run on one host
+for local testing; no outside services are involved.
+
+Control protocol (JSON over HTTP, X-Load-Token header; the token is required
+whenever an agent binds to anything but loopback):
+  GET  /health   agent state
+  POST /prepare  {"spec": ShardSpec fields}           -> 200 once ready
+  POST /start    {"start_at": unix seconds}            -> 202, load begins at start_at
+  GET  /result   202 while running, then 200 {"targets": deltas, "done": counters}
+"""
+
+import argparse
+import asyncio
+import hmac
+import ipaddress
+import json
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+from load_generator import LOAD_MODES, LoadProfile, LoadReport
+from sharded_load import TARGET_GROUPS, LoadTarget, ShardedLoadReport, ShardSpec, drive_shard
+from standin_server import BackgroundStandIn, StandInServer, serve_forever
+
+TOKEN_HEADER = "X-Load-Token"
+
+
+def is_loopback(host: str) -> bool:
+    """Whether binding to `host` only accepts connections from this machine"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class LoadAgent(StandInServer):
+    """Runs one shard of a controller's workload on request"""
+
+    def __init__(self, token: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        if not token and not is_loopback(self.host):
+            # /prepare takes arbitrary targets and rates; unauthenticated it is an open load relay
+            raise ValueError(f"a load agent bound to {self.host} needs a --token")
+        self.token = token
+        self.state = "idle"
+        self.spec: Optional[ShardSpec] = None
+        self.result: Optional[ShardedLoadReport] = None
+        self.done: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._check_token])
+        app.router.add_get("/health", self.handle_health)
+        app.router.add_post("/prepare", self.handle_prepare)
+        app.router.add_post("/start", self.handle_start)
+        app.router.add_get("/result", self.handle_result)
+        return app
+
+    @web.middleware
+    async def _check_token(self, request: web.Request, handler):
+        if self.token and not hmac.compare_digest(request.headers.get(TOKEN_HEADER, "").encode(),
+                                                  self.token.encode()):
+            return web.json_response({"success": False, "error": "Invalid load token"}, status=403)
+        return await handler(request)
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({"success": True, "state": self.state})
+
+    async def handle_prepare(self, request: web.Request) -> web.Response:
+        if self.state == "running":
+            return web.json_response({"success": False, "error": "Load already running"}, status=409)
+        try:
+            self.spec = ShardSpec(**(await request.json())["spec"])
+        except (KeyError, TypeError, ValueError) as e:
+            return web.json_response({"success": False, "error": f"Invalid spec: {e}"}, status=400)
+        self.state = "ready"
+        self.result = ShardedLoadReport(self.spec.mode, 1, LoadReport("agent", self.spec.mode))
+        self.done = None
+        return web.json_response({"success": True, "state": self.state, "shard": self.spec.shard})
+
+    async def handle_start(self, request: web.Request) -> web.Response:
+        if self.state != "ready":
+            return web.json_response({"success": False, "error": f"Agent is {self.state}"}, status=409)
+        start_at = float((await request.json()).get("start_at", time.time()))
+        self.state = "running"
+        self._task = asyncio.ensure_future(self._run(start_at))
+        return web.json_response({"success": True, "state": self.state}, status=202)
+
+    async def _run(self, start_at: float):
+        """Wait for the common start time, run the shard and keep its merged result"""
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+        try:
+            report = await drive_shard(self.spec, lambda message: self.result.merge_delta(message["targets"]))
+            self.done = {"type": "done", "shard": self.spec.shard, "sent": report.sent,
+                         "dropped": report.dropped, "elapsed": report.elapsed}
+        except Exception as e:
+            self.done = {"type": "error", "shard": self.spec.shard, "error": f"{type(e).__name__}: {e}"}
+        self.state = "finished"
+
+    async def handle_result(self, request: web.Request) -> web.Response:
+        if self.state == "running":
+            return web.json_response({"success": True, "state": self.state}, status=202)
+        if self.state != "finished":
+            return web.json_response({"success": False, "error": f"Agent is {self.state}"}, status=409)
+        targets = {
+            name: {"passed": report.passed, "failed": report.failed,
+                   "bytes": self.result.bytes_received.get(name, 0), "histogram": report.latency.to_dict()}
+            for name, report in self.result.targets.items()
+        }
+        return web.json_response({"success": True, "state": self.state, "targets": targets, "done": self.done})
+
+
+class LoadController:
+    """Prepares, releases and collects a set of load agents"""
+
+    def __init__(self, agent_urls: List[str], token: Optional[str] = None,
+                 start_lead: float = 1.0, poll_interval: float = 0.5):
+        if not agent_urls:
+            raise ValueError("at least one agent URL is required")
+        self.agent_urls = [url.rstrip("/") for url in agent_urls]
+        self.headers = {TOKEN_HEADER: token} if token else {}
+        self.start_lead = start_lead
+        self.poll_interval = poll_interval
+
+    async def _call(self, session: aiohttp.ClientSession, method: str, url: str,
+                    payload: Optional[Dict] = None) -> Dict[str, Any]:
+        async with session.request(method, url, json=payload, headers=self.headers) as response:
+            body = await response.json(content_type=None)
+            if response.status >= 400:
+                raise RuntimeError(f"{url}: HTTP {response.status} {body.get('error', '')}")
+            body["_status"] = response.status
+            return body
+
+    async def run(self, profile: LoadProfile, targets: List[LoadTarget], **shard_options) -> ShardedLoadReport:
+        """Split the profile across agents, start them together and merge their results"""
+        specs = ShardSpec.split(profile, targets, len(self.agent_urls), **shard_options)
+        report = ShardedLoadReport(profile.mode, len(self.agent_urls), LoadReport("cluster", profile.mode))
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+            await asyncio.gather(*[
+                self._call(session, "POST", f"{url}/prepare", {"spec": asdict(spec)})
+                for url, spec in zip(self.agent_urls, specs)
+            ])
+
+            # Agents wait for a shared wall-clock instant; across hosts this assumes NTP-synced clocks
+            start_at = time.time() + self.start_lead
+            await asyncio.gather(*[
+                self._call(session, "POST", f"{url}/start", {"start_at": start_at})
+                for url in self.agent_urls
+            ])
+            release_time = datetime.fromtimestamp(start_at).strftime("%H:%M:%S.%f")[:-3]
+            print(f"🚦 {len(self.agent_urls)} agents released for {release_time}")
+
+            pending = list(self.agent_urls)
+            await asyncio.sleep(max(0.0, start_at - time.time()) + profile.duration)
+            while pending:
+                for url in list(pending):
+                    result = await self._call(session, "GET", f"{url}/result")
+                    if result["_status"] == 202:
+                        continue
+                    report.merge_delta(result["targets"])
+                    report.finish_shard(result["done"])
+                    pending.remove(url)
+                    if result["done"]["type"] == "error":
+                        print(f"  💥 Agent {url} failed: {result['done']['error']}")
+                if pending:
+                    await asyncio.sleep(self.poll_interval)
+        return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Multi-node load controller and agent")
+    parser.add_argument("--token", help="Shared secret required on every control request")
+    roles = parser.add_subparsers(dest="role", required=True)
+
+    agent = roles.add_parser("agent", help="Serve the control channel and run assigned load")
+    agent.add_argument("--host", default="127.0.0.1",
+                       help="Interface to bind; anything but loopback requires --token")
+    agent.add_argument("--port", type=int, default=9100, help="Control port")
+
+    controller = roles.add_parser("controller", help="Distribute a workload to agents and merge results")
+    controller.add_argument("--agents", default="", help="Comma-separated agent base URLs")
+    controller.add_argument("--local-agents", type=int, default=0,
+                            help="Start this many agents in-process on localhost (for testing)")
+    controller.add_argument("--mode", choices=LOAD_MODES, default="closed",
+                            help="open: fixed total request rate; closed: fixed total virtual users")
+    controller.add_argument("--rate", type=float, default=100.0, help="Total requests per second (open loop)")
+    controller.add_argument("--users", type=int, default=50, help="Total virtual users (closed loop)")
+    controller.add_argument("--duration", type=float, default=30.0, help="Load duration in seconds")
+    controller.add_argument("--ramp-up", type=float, default=0.0, help="Linear ramp-up in seconds")
+    controller.add_argument("--think-time", type=float, default=0.0, help="Pause between requests per virtual user")
+    controller.add_argument("--groups", default="agents,sync",
+                            help=f"Comma-separated endpoint groups: {', '.join(TARGET_GROUPS)}")
+    controller.add_argument("--local-url", default="http://localhost:8000", help="AlexAI API base URL")
+    controller.add_argument("--n8n-url", default="https://n8n.pbradygeorgen.com", help="n8n base URL")
+    controller.add_argument("--alexai-standin", action="store_true",
+                            help="Drive an AlexAI API stand-in started by the controller instead of --local-url")
+    controller.add_argument("--stamp-requests", action="store_true",
+                            help="Add a request_id and timestamp to every fixed payload")
+    controller.add_argument("--start-lead", type=float, default=1.0,
+                            help="Seconds between the start command and the common start time")
+    return parser.parse_args(argv)
+
+
+def run_agent(args: argparse.Namespace) -> int:
+    try:
+        agent = LoadAgent(token=args.token, host=args.host, port=args.port)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    try:
+        asyncio.run(serve_forever(agent, "Load agent"))
+    except KeyboardInterrupt:
+        print("\n⏹️ Load agent stopped.")
+    return 0
+
+
+def run_controller(args: argparse.Namespace) -> int:
+    from alexai_standin_server import AlexAIStandInServer
+    from comprehensive_agent_workflow_test import ComprehensiveAgentWorkflowTester
+
+    background = []
+    try:
+        local_url = args.local_url
+        if args.alexai_standin:
+            standin = BackgroundStandIn(AlexAIStandInServer())
+            local_url = standin.start()
+            background.append(standin)
+
+        agent_urls = [url for url in args.agents.split(",") if url]
+        for _ in range(args.local_agents):
+            local_agent = BackgroundStandIn(LoadAgent(token=args.token))
+            agent_urls.append(local_agent.start())
+            background.append(local_agent)
+        if not agent_urls:
+            print("❌ No agents: pass --agents URL[,URL...] or --local-agents N")
+            return 1
+
+        groups = [group.strip() for group in args.groups.split(",") if group.strip()]
+        targets = ComprehensiveAgentWorkflowTester(local_url=local_url, n8n_url=args.n8n_url).load_targets(groups)
+        profile = LoadProfile(
+            target="cluster", mode=args.mode, rate=args.rate, users=args.users,
+            duration=args.duration, ramp_up=args.ramp_up, think_time=args.think_time
+        )
+        shape = f"{args.rate:g} req/s open loop" if args.mode == "open" else f"{args.users} virtual users"
+        print(f"📈 Cluster load: {len(targets)} endpoints, {len(agent_urls)} agents, {shape}, {args.duration:g}s")
+        controller = LoadController(agent_urls, token=args.token, start_lead=args.start_lead)
+        report = asyncio.run(controller.run(profile, targets, stamp_requests=args.stamp_requests))
+    except (RuntimeError, aiohttp.ClientError) as e:
+        print(f"❌ Cluster load aborted: {str(e)}")
+        return 1
+    finally:
+        for server in reversed(background):
+            server.stop()
+
+    summary = report.to_dict()
+    summary["agents"] = agent_urls
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_filename = f"cluster_load_report_{timestamp}.json"
+    with open(f"tests/reports/{report_filename}", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    overall = summary["overall"]
+    print("\n" + "=" * 60)
+    print("📈 CLUSTER LOAD RUN COMPLETE")
+    print("=" * 60)
+    print(f"Requests: {overall['completed']} completed, {overall['dropped']} dropped")
+    print(f"Throughput: {overall['throughput_rps']} req/s across {report.workers} agents, "
+          f"{overall['bytes_per_second'] / 1e6:.2f} MB/s received")
+    print(f"Error Rate: {overall['error_rate']}%")
+    latency = overall["latency"]
+    if latency["count"]:
+        print(f"Latency: p50 {latency['p50']:.3f}s | p90 {latency['p90']:.3f}s | p99 {latency['p99']:.3f}s | "
+              f"max {latency['max']:.3f}s")
+    print(f"Report Saved: {report_filename}")
+    return 0 if overall["failed"] == 0 and overall["completed"] > 0 else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    return run_agent(args) if args.role == "agent" else run_controller(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Sustained Load Generator
+Drives a single request coroutine in open-loop (target request rate) or
+closed-loop (N virtual users) mode for a fixed duration with linear ramp-up
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Set
+
+from latency_histogram import LatencyHistogram
+
+LOAD_MODES = ("open", "closed")
+
+
+@dataclass
+class LoadProfile:
+    """Shape of a sustained load run"""
+    target: str
+    mode: str = "closed"
+    rate: float = 10.0
+    users: int = 10
+    duration: float = 60.0
+    ramp_up: float = 0.0
+    think_time: float = 0.0
+    max_in_flight: int = 1000
+
+    def __post_init__(self):
+        if self.mode not in LOAD_MODES:
+            raise ValueError(f"mode must be one of {LOAD_MODES}, got {self.mode!r}")
+        if self.duration <= 0:
+            raise ValueError("duration must be positive")
+        if self.mode == "open" and self.rate <= 0:
+            raise ValueError("open-loop rate must be positive")
+        if self.mode == "closed" and self.users < 1:
+            raise ValueError("closed-loop runs need at least one virtual user")
+        self.ramp_up = min(max(self.ramp_up, 0.0), self.duration)
+
+
+@dataclass
+class LoadReport:
+    """Running totals for a load run"""
+    target: str
+    mode: str
+    sent: int = 0
+    passed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record(self, passed: bool, latency: float):
+        """Fold one completed request into the totals"""
+        if passed:
+            self.passed += 1
+        else:
+            self.failed += 1
+        self.latency.record(latency)
+
+    @property
+    def completed(self) -> int:
+        return self.passed + self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarise the run for the JSON report"""
+        completed = self.completed
+        return {
+            "target": self.target,
+            "mode": self.mode,
+            "sent": self.sent,
+            "completed": completed,
+            "passed": self.passed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "elapsed": round(self.elapsed, 3),
+            "throughput_rps": round(completed / self.elapsed, 2) if self.elapsed > 0 else 0,
+            "error_rate": round(self.failed / completed * 100, 2) if completed else 0,
+            "latency": self.latency.summary(),
+            "latency_histogram": self.latency.to_dict()
+        }
+
+
+def open_loop_arrival_offset(index: int, rate: float, ramp_up: float) -> float:
+    """Offset in seconds of the index-th arrival when the rate ramps linearly to `rate`"""
+    # During the ramp the cumulative arrivals are rate * t^2 / (2 * ramp_up)
+    ramp_arrivals = rate * ramp_up / 2
+    if ramp_up > 0 and index <= ramp_arrivals:
+        return math.sqrt(2 * ramp_up * index / rate)
+    return ramp_up + (index - ramp_arrivals) / rate
+
+
+class LoadGenerator:
+    """Runs a request coroutine under an open- or closed-loop load profile"""
+
+    def __init__(self, profile: LoadProfile, send: Callable[[], Awaitable[bool]]):
+        self.profile = profile
+        self.send = send
+
+    async def _timed_send(self, report: LoadReport):
+        """Send one request and record its outcome"""
+        start_time = time.perf_counter()
+        try:
+            passed = bool(await self.send())
+        except Exception:
+            passed = False
+        report.record(passed, time.perf_counter() - start_time)
+
+    async def _run_open_loop(self, report: LoadReport, start: float):
+        """Issue requests on a fixed arrival schedule regardless of response times"""
+        profile = self.profile
+        in_flight: Set[asyncio.Task] = set()
+        index = 0
+
+        while True:
+            offset = open_loop_arrival_offset(index, profile.rate, profile.ramp_up)
+            if offset >= profile.duration:
+                break
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            index += 1
+
+            # Open loop never waits on responses; shed arrivals past the in-flight cap
+            if len(in_flight) >= profile.max_in_flight:
+                report.dropped += 1
+                continue
+            report.sent += 1
+            task = asyncio.ensure_future(self._timed_send(report))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _virtual_user(self, report: LoadReport, start_offset: float, end: float):
+        """Loop send/think until the run ends"""
+        await asyncio.sleep(start_offset)
+        while time.perf_counter() < end:
+            report.sent += 1
+            await self._timed_send(report)
+            if self.profile.think_time > 0:
+                await asyncio.sleep(self.profile.think_time)
+
+    async def _run_closed_loop(self, report: LoadReport, start: float):
+        """Run N virtual users, staggering their start across the ramp-up"""
+        profile = self.profile
+        end = start + profile.duration
+        stagger = profile.ramp_up / profile.users
+        await asyncio.gather(*[
+            self._virtual_user(report, user * stagger, end)
+            for user in range(profile.users)
+        ])
+
+    async def run(self) -> LoadReport:
+        """Run the profile to completion and return its report"""
+        report = LoadReport(self.profile.target, self.profile.mode)
+        start = time.perf_counter()
+
+        if self.profile.mode == "open":
+            await self._run_open_loop(report, start)
+        else:
+            await self._run_closed_loop(report, start)
+
+        report.elapsed = time.perf_counter() - start
+        return report
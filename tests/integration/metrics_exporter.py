@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+OpenMetrics Exporter
+Live counters, gauges and latency histograms for the harness, served as
+OpenMetrics text on a local /metrics endpoint. Recording is a locked dict
+update; the exposition text is only built when a scraper asks for it
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+from latency_histogram import LatencyHistogram
+from standin_server import BackgroundStandIn, StandInServer
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Exposition bucket bounds in seconds; samples are kept at full resolution and folded at scrape time
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+INF_BUCKET = 'le="+Inf"'
+
+RESULT_LABELS = ("endpoint", "agent_name", "workflow_id", "status")
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricFamily:
+    """One named metric and its children, keyed by label values"""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+        self._children: Dict[LabelValues, object] = {}
+
+    def _key(self, labels: Dict[str, Optional[str]]) -> LabelValues:
+        if set(labels) - set(self.labelnames):
+            raise ValueError(f"{self.name} has no labels {sorted(set(labels) - set(self.labelnames))}")
+        return tuple("" if labels.get(label) is None else str(labels[label]) for label in self.labelnames)
+
+    def _label_text(self, key: LabelValues, extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def header(self) -> List[str]:
+        return [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {_escape(self.help)}"]
+
+
+class Counter(MetricFamily):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, value in sorted(self._children.items()):
+            lines.append(f"{self.name}_total{self._label_text(key)} {_number(value)}")
+        return lines
+
+
+class Gauge(MetricFamily):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, value in sorted(self._children.items()):
+            lines.append(f"{self.name}{self._label_text(key)} {_number(value)}")
+        return lines
+
+
+class Histogram(MetricFamily):
+    """Latency histogram in seconds, recorded into a LatencyHistogram per label set"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock,
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, seconds: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            histogram = self._children.get(key)
+            if histogram is None:
+                histogram = self._children[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, histogram in sorted(self._children.items()):
+            recorded = histogram.buckets()
+            position, cumulative = 0, 0
+            for bound in self.buckets:
+                # Bucket upper bounds carry the histogram's 1% relative error at the edges
+                while position < len(recorded) and recorded[position][0] <= bound:
+                    cumulative += recorded[position][1]
+                    position += 1
+                le = f'le="{float(bound)!r}"'
+                lines.append(f"{self.name}_bucket{self._label_text(key, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{self._label_text(key, INF_BUCKET)} {histogram.total_count}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {histogram.total_count}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_number(histogram.total_us / 1_000_000)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metric families exposed together; one lock guards every update and scrape"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.families: Dict[str, MetricFamily] = {}
+
+    def _add(self, family: MetricFamily) -> MetricFamily:
+        existing = self.families.get(family.name)
+        if existing is not None:
+            if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+                raise ValueError(f"metric {family.name} is already registered differently")
+            return existing
+        self.families[family.name] = family
+        return family
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help_text, labelnames, self._lock))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help_text, labelnames, self._lock))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help_text, labelnames, self._lock, buckets))
+
+    def render(self) -> str:
+        """OpenMetrics exposition of every family"""
+        lines: List[str] = []
+        with self._lock:
+            for _, family in sorted(self.families.items()):
+                lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class HarnessMetrics:
+    """The harness's metric families and the hooks the testers call"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.results = self.registry.counter(
+            "harness_results", "Logged test results", RESULT_LABELS)
+        self.result_latency = self.registry.histogram(
+            "harness_result_latency_seconds", "Duration of logged test results", RESULT_LABELS)
+        self.executions = self.registry.counter(
+            "harness_workflow_executions", "Workflow webhook executions, including load sends",
+            ("workflow_id", "status"))
+        self.execution_latency = self.registry.histogram(
+            "harness_workflow_execution_latency_seconds", "Workflow webhook execution latency",
+            ("workflow_id", "status"))
+        self.in_flight = self.registry.gauge(
+            "harness_workflow_executions_in_flight", "Workflow webhook executions awaiting a response",
+            ("workflow_id",))
+        self.requests = self.registry.counter(
+            "harness_requests", "HTTP requests sent by the synchronous deployment testers", ("endpoint", "status"))
+        self.request_latency = self.registry.histogram(
+            "harness_request_latency_seconds", "Latency of requests sent by the synchronous deployment testers",
+            ("endpoint", "status"))
+
+    def record_result(self, status: str, duration: float, endpoint: Optional[str] = None,
+                      agent_name: Optional[str] = None, workflow_id: Optional[str] = None):
+        labels = {"endpoint": endpoint, "agent_name": agent_name, "workflow_id": workflow_id, "status": status}
+        self.results.inc(**labels)
+        if duration > 0:
+            self.result_latency.observe(duration, **labels)
+
+    def record_execution(self, workflow_id: str, passed: bool, duration: float):
+        status = "PASS" if passed else "FAIL"
+        self.executions.inc(workflow_id=workflow_id, status=status)
+        self.execution_latency.observe(duration, workflow_id=workflow_id, status=status)
+
+    def record_request(self, endpoint: str, status: str, duration: float):
+        """One request, labelled by its HTTP status code or "error" when no response came back"""
+        self.requests.inc(endpoint=endpoint, status=status)
+        self.request_latency.observe(duration, endpoint=endpoint, status=status)
+
+
+class MetricsServer(StandInServer):
+    """Serves a registry at /metrics on the stand-in server machinery"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        super().__init__(host=host, port=port)
+        self.registry = registry
+        self.scrapes = 0
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        return app
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        self.scrapes += 1
+        return web.Response(body=self.registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser):
+    """Add the shared --metrics-port/--metrics-host options to an argparse parser"""
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Serve live OpenMetrics at http://HOST:PORT/metrics while the run lasts")
+    parser.add_argument("--metrics-host", default="127.0.0.1", help="Interface for the metrics endpoint")
+
+
+async def start_metrics_server(args: argparse.Namespace) -> Tuple[Optional[HarnessMetrics], Optional[MetricsServer]]:
+    """HarnessMetrics and its running server when --metrics-port is set, else (None, None)"""
+    if args.metrics_port is None:
+        return None, None
+    metrics = HarnessMetrics()
+    server = MetricsServer(metrics.registry, args.metrics_host, args.metrics_port)
+    base_url = await server.start()
+    print(f"📊 OpenMetrics endpoint at {base_url}/metrics")
+    return metrics, server
+
+
+def start_background_metrics_server(
+        args: argparse.Namespace) -> Tuple[Optional[HarnessMetrics], Optional[BackgroundStandIn]]:
+    """start_metrics_server for the synchronous testers: the server runs on its own loop thread"""
+    if args.metrics_port is None:
+        return None, None
+    metrics = HarnessMetrics()
+    server = BackgroundStandIn(MetricsServer(metrics.registry, args.metrics_host, args.metrics_port))
+    print(f"📊 OpenMetrics endpoint at {server.start()}/metrics")
+    return metrics, server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve an empty harness registry, e.g. to check a scraper's configuration"""
+    parser = argparse.ArgumentParser(description="Serve the harness metrics families at /metrics")
+    parser.add_argument("--port", type=int, default=9464, help="Port to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = MetricsServer(HarnessMetrics().registry, args.host, args.port)
+        print(f"📊 OpenMetrics endpoint at {await server.start()}/metrics")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Local n8n Webhook Stand-In
+Serves the webhook paths declared in workflows/*.json with responses shaped to
+pass the harness's workflow validation, so load and regression runs can target
+localhost instead of https://n8n.pbradygeorgen.com
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from aiohttp import web
+
+from standin_server import StandInServer, add_standin_arguments, models_from_args, serve_forever
+from workflow_catalog import DEFAULT_WORKFLOWS_DIR, WorkflowCatalog, WorkflowEntry
+
+
+def build_workflow_response(kind: str, payload: Dict[str, Any], entry: WorkflowEntry) -> Dict[str, Any]:
+    """Build a success body with the fields the harness validates for `kind`"""
+    body: Dict[str, Any] = {
+        "success": True,
+        "workflow": entry.name,
+        "nodesExecuted": entry.node_count
+    }
+
+    if kind == "agent-validation":
+        body.update({
+            "validationType": payload.get("validation_type", "comprehensive"),
+            "totalAgents": 13,
+            "systemHealth": "optimal",
+            "agentHealthChecks": [
+                {"agent": agent, "status": "healthy"}
+                for agent in ("captain_picard", "lieutenant_data", "counselor_troi",
+                              "chief_engineer_scott", "commander_spock", "lieutenant_worf")
+            ]
+        })
+    elif kind == "crew-coordination":
+        body.update({
+            "crewStatus": "coordinated",
+            "coordinationLevel": "optimal",
+            "missionStatus": "active",
+            "crewSize": payload.get("crew_size", 6)
+        })
+    elif kind == "bilateral-learning":
+        body.update({
+            "syncStatus": "active",
+            "learningProgress": 0.87,
+            "knowledgeGained": payload.get("agents_involved", [])
+        })
+    elif kind == "multimodal-agency":
+        body.update({
+            "analysisResult": {"dataType": payload.get("data_type", "unknown"), "confidence": 0.92},
+            "dataProcessed": True,
+            "insightsGenerated": 3
+        })
+
+    return body
+
+
+class N8nStandInServer(StandInServer):
+    """Serves n8n webhook paths from the workflows/ JSON definitions"""
+
+    def __init__(self, workflows_dir: Optional[Path] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.workflows_dir = Path(workflows_dir) if workflows_dir else DEFAULT_WORKFLOWS_DIR
+        self.catalog = WorkflowCatalog(self.workflows_dir)
+        self.routes = self.catalog.routes()
+        # Methods n8n registers per webhook path; harness-only slug aliases accept any method
+        self.methods: Dict[str, Set[str]] = {}
+        for entry in self.catalog.entries:
+            if entry.error is None:
+                for path, method in entry.webhooks.items():
+                    self.methods.setdefault(path, set()).add(method)
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/webhook/{path:.+}", self.handle_webhook)
+        return app
+
+    async def handle_webhook(self, request: web.Request) -> web.Response:
+        """Answer one webhook call"""
+        path = request.match_info["path"]
+        entry = self.routes.get(path)
+        if entry is None or request.method not in self.methods.get(path, {request.method}):
+            return web.json_response(
+                {"code": 404, "message": f"The requested webhook \"{request.method} {path}\" is not registered."},
+                status=404
+            )
+
+        injected = await self.simulate(path)
+        if injected is not None:
+            return injected
+
+        payload: Dict[str, Any] = dict(request.query)
+        if request.can_read_body:
+            try:
+                payload = await request.json()
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return web.json_response({"success": False, "error": "Invalid JSON body"}, status=400)
+            if not isinstance(payload, dict):
+                payload = {}
+
+        return web.json_response(build_workflow_response(entry.kind, payload, entry))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Local n8n webhook stand-in server")
+    parser.add_argument("--port", type=int, default=5678, help="Port to listen on")
+    parser.add_argument("--workflows-dir", type=Path, default=DEFAULT_WORKFLOWS_DIR,
+                        help="Directory of n8n workflow JSON definitions")
+    add_standin_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    latency, faults = models_from_args(args)
+    server = N8nStandInServer(
+        workflows_dir=args.workflows_dir,
+        host=args.host,
+        port=args.port,
+        latency=latency,
+        faults=faults,
+        seed=args.seed
+    )
+    print(f"📂 Serving {len(server.routes)} webhook paths from {server.workflows_dir}")
+    try:
+        asyncio.run(serve_forever(server, "n8n"))
+    except KeyboardInterrupt:
+        print("\n⏹️ n8n stand-in stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
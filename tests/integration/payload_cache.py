@@ -0,0 +1,129 @@
+"""
+Pre-Serialized Request Bodies
+Encodes each mock payload to JSON bytes once and reuses the body and its
+precomputed headers for every send. Templates leave named slots (request id,
+timestamp) that are filled per request by splicing in just the slot values,
+so stamped payloads also skip a full re-encode
+"""
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from json_codec import encode
+
+# Shared by every pre-encoded request; callers must not mutate it
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Slots stamped onto load requests so the server side can correlate and age them
+STAMP_SLOTS = ("request_id", "timestamp")
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A request body encoded once, with the headers that go with it"""
+    body: bytes
+    headers: Dict[str, str]
+
+    def request_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for aiohttp/requests in place of json=payload"""
+        return {"data": self.body, "headers": self.headers}
+
+
+class PayloadTemplate:
+    """A payload with top-level slots whose values are spliced into pre-encoded bytes"""
+
+    def __init__(self, payload: Dict[str, Any], slots: Iterable[str]):
+        self.slots: Tuple[str, ...] = tuple(slots)
+        # Markers contain a NUL so they cannot collide with real payload text
+        markers = {slot: f"\x00slot:{slot}\x00" for slot in self.slots}
+        encoded = encode({**payload, **markers})
+
+        # A slot replaces an existing key of the same name in place, so split at marker positions
+        spans = sorted(
+            (encoded.index(encoded_marker), len(encoded_marker), slot)
+            for slot, encoded_marker in ((slot, encode(marker)) for slot, marker in markers.items())
+        )
+        self.segments: List[bytes] = []
+        cursor = 0
+        for index, length, _ in spans:
+            self.segments.append(encoded[cursor:index])
+            cursor = index + length
+        self.segments.append(encoded[cursor:])
+        self.order: Tuple[str, ...] = tuple(slot for _, _, slot in spans)
+
+    def render(self, **values: Any) -> bytes:
+        """Body with every slot filled; only the slot values are encoded"""
+        segments = self.segments
+        parts = [segments[0]]
+        for index, slot in enumerate(self.order, 1):
+            parts.append(encode(values[slot]))
+            parts.append(segments[index])
+        return b"".join(parts)
+
+    def request_kwargs(self, **values: Any) -> Dict[str, Any]:
+        return {"data": self.render(**values), "headers": JSON_HEADERS}
+
+
+class PayloadCache:
+    """Encoded bodies keyed by name; an entry is re-encoded only if its key is given a different payload object"""
+
+    def __init__(self):
+        self._encoded: Dict[str, Tuple[Any, EncodedPayload]] = {}
+        self._templates: Dict[Tuple[str, Tuple[str, ...]], Tuple[Any, PayloadTemplate]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encoded(self, key: str, payload: Any) -> EncodedPayload:
+        """Pre-encoded body for `payload`, which must not be mutated while cached"""
+        entry = self._encoded.get(key)
+        if entry is not None and entry[0] is payload:
+            self.hits += 1
+            return entry[1]
+        with self._lock:
+            self.misses += 1
+            encoded = EncodedPayload(encode(payload), JSON_HEADERS)
+            self._encoded[key] = (payload, encoded)
+        return encoded
+
+    def template(self, key: str, payload: Dict[str, Any], slots: Iterable[str] = STAMP_SLOTS) -> PayloadTemplate:
+        """Cached template of `payload` with the given slots added at the top level"""
+        cache_key = (key, tuple(slots))
+        entry = self._templates.get(cache_key)
+        if entry is not None and entry[0] is payload:
+            self.hits += 1
+            return entry[1]
+        with self._lock:
+            self.misses += 1
+            template = PayloadTemplate(payload, cache_key[1])
+            self._templates[cache_key] = (payload, template)
+        return template
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"entries": len(self._encoded) + len(self._templates), "hits": self.hits, "misses": self.misses}
+
+
+class RequestStamper:
+    """Fills the standard stamp slots with a prefixed sequence number and the wall-clock time"""
+
+    def __init__(self, prefix: str = "req"):
+        self.prefix = prefix
+        self._sequence = itertools.count()
+
+    def values(self, now: Optional[float] = None) -> Dict[str, Any]:
+        return {"request_id": f"{self.prefix}-{next(self._sequence)}",
+                "timestamp": time.time() if now is None else now}
+
+
+def query_params(payload: Dict[str, Any]) -> Dict[str, str]:
+    """Top-level scalar fields of a payload as query parameters, for GET webhooks"""
+    params: Dict[str, str] = {}
+    for key, value in payload.items():
+        if isinstance(value, bool):
+            params[key] = "true" if value else "false"
+        elif isinstance(value, (str, int, float)):
+            params[key] = str(value)
+    return params
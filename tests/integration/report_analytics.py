@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Vectorized Report Analytics
+NumPy analytics over the columnar result store: per-group percentiles and
+pass/fail counts, MAD-based slow-outlier detection and error-rate time series,
+computed without per-result Python loops
+"""
+
+import json
+import sys
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+from latency_histogram import REPORT_PERCENTILES
+from result_store import NO_VALUE, ColumnarResultStore
+
+GROUP_COLUMNS = ("test_name", "agent_name", "workflow_id", "endpoint")
+
+# Modified z-score above which a duration counts as an outlier (Iglewicz & Hoaglin)
+MAD_THRESHOLD = 3.5
+# Scales the MAD to match the standard deviation of a normal distribution
+MAD_SCALE = 0.6745
+
+# Most results a report lists individually unless every row is asked for
+DETAILED_RESULTS_LIMIT = 1000
+
+
+def _column(store: ColumnarResultStore, name: str) -> np.ndarray:
+    """Zero-copy NumPy view of one store column"""
+    column = {
+        "test_name": store.test_names,
+        "status": store.statuses,
+        "agent_name": store.agent_names,
+        "workflow_id": store.workflow_ids,
+        "endpoint": store.endpoints,
+        "duration": store.durations,
+        "timestamp_ns": store.timestamps_ns
+    }[name]
+    if len(column) == 0:
+        return np.empty(0, dtype=np.dtype(column.typecode))
+    return np.frombuffer(column, dtype=np.dtype(column.typecode))
+
+
+def status_mask(store: ColumnarResultStore, *statuses: str) -> np.ndarray:
+    """Boolean mask of results with any of the given statuses"""
+    ids = [store.strings.find(status) for status in statuses]
+    return np.isin(_column(store, "status"), [i for i in ids if i != NO_VALUE])
+
+
+def success_rate(store: ColumnarResultStore) -> float:
+    """Percentage of results that passed"""
+    return float(status_mask(store, "PASS").mean() * 100) if len(store) else 0.0
+
+
+def _nearest_ranks(count: int, percentiles: Iterable[float]) -> np.ndarray:
+    """Zero-based nearest-rank positions of the percentiles in `count` sorted samples"""
+    return np.maximum(1, np.ceil(np.asarray(list(percentiles)) / 100.0 * count).astype(np.int64)) - 1
+
+
+def group_stats(store: ColumnarResultStore, by: str,
+                percentiles: Iterable[float] = REPORT_PERCENTILES) -> Dict[str, Dict[str, Any]]:
+    """Counts, success rate and duration percentiles per value of a string column"""
+    if by not in GROUP_COLUMNS:
+        raise ValueError(f"by must be one of {', '.join(GROUP_COLUMNS)}")
+    keys = _column(store, by)
+    present = keys != NO_VALUE
+    if not present.any():
+        return {}
+
+    keys = keys[present]
+    durations = _column(store, "duration")[present]
+    counts = np.bincount(keys)
+    passed_counts = np.bincount(keys, weights=status_mask(store, "PASS")[present])
+    failed_counts = np.bincount(keys, weights=status_mask(store, "FAIL")[present])
+    sums = np.bincount(keys, weights=durations)
+    percentiles = list(percentiles)
+
+    # A stable integer sort groups the rows; each group is then partitioned,
+    # not sorted, to pick out its percentile ranks in linear time
+    grouped = durations[np.argsort(keys, kind="stable")]
+    group_ids = np.flatnonzero(counts)
+    ends = np.cumsum(counts[group_ids])
+
+    stats = {}
+    for group_id, end in zip(group_ids, ends):
+        count = int(counts[group_id])
+        ranks = _nearest_ranks(count, percentiles)
+        segment = np.partition(grouped[end - count:end], np.append(ranks, count - 1))
+        entry = {
+            "total": count,
+            "passed": int(passed_counts[group_id]),
+            "failed": int(failed_counts[group_id]),
+            "success_rate": round(float(passed_counts[group_id] / count * 100), 2),
+            "mean": round(float(sums[group_id] / count), 6),
+            "max": round(float(segment[count - 1]), 6)
+        }
+        entry.update({f"p{p:g}": round(float(segment[rank]), 6) for p, rank in zip(percentiles, ranks)})
+        stats[store.strings.lookup(int(group_id))] = entry
+    return stats
+
+
+def mad_outliers(durations: np.ndarray, threshold: float = MAD_THRESHOLD,
+                 min_duration: float = 0.0) -> np.ndarray:
+    """Mask of slow outliers by modified z-score, ignoring anything under `min_duration`"""
+    if durations.size == 0:
+        return np.zeros(0, dtype=bool)
+    median = np.median(durations)
+    mad = np.median(np.abs(durations - median))
+    if mad == 0:
+        # Over half the samples are identical; anything slower than them stands out
+        slow = durations > median
+    else:
+        slow = MAD_SCALE * (durations - median) / mad > threshold
+    return slow & (durations >= min_duration)
+
+
+def slow_outliers(store: ColumnarResultStore, threshold: float = MAD_THRESHOLD,
+                  min_duration: float = 1.0) -> List[int]:
+    """Indices of results that are slow outliers among the timed results"""
+    durations = _column(store, "duration")
+    timed = np.flatnonzero(durations > 0)
+    return timed[mad_outliers(durations[timed], threshold, min_duration)].tolist()
+
+
+def notable_results(store: ColumnarResultStore, limit: int = DETAILED_RESULTS_LIMIT,
+                    min_outlier_duration: float = 1.0) -> List[int]:
+    """Indices of failed results and slow outliers in result order, at most `limit` of them"""
+    failed = np.flatnonzero(status_mask(store, "FAIL"))
+    outliers = slow_outliers(store, min_duration=min_outlier_duration)
+    return np.union1d(failed, outliers)[:limit].astype(np.int64).tolist()
+
+
+def error_rate_series(store: ColumnarResultStore, bucket_seconds: float = 1.0) -> List[Dict[str, Any]]:
+    """Results, failures and error rate per time bucket since the first result"""
+    if len(store) == 0:
+        return []
+    timestamps = _column(store, "timestamp_ns")
+    buckets = (timestamps - timestamps.min()) // int(bucket_seconds * 1e9)
+    totals = np.bincount(buckets)
+    failures = np.bincount(buckets, weights=status_mask(store, "FAIL")).astype(np.int64)
+    occupied = np.flatnonzero(totals)
+    return [
+        {
+            "offset": round(float(bucket * bucket_seconds), 3),
+            "total": int(totals[bucket]),
+            "failed": int(failures[bucket]),
+            "error_rate": round(float(failures[bucket] / totals[bucket] * 100), 2)
+        }
+        for bucket in occupied
+    ]
+
+
+def analyze(store: ColumnarResultStore, bucket_seconds: float = 1.0,
+            min_outlier_duration: float = 1.0) -> Dict[str, Any]:
+    """Report analytics section for a result store"""
+    outliers = slow_outliers(store, min_duration=min_outlier_duration)
+    return {
+        "by_agent": group_stats(store, "agent_name"),
+        "by_workflow": group_stats(store, "workflow_id"),
+        "by_endpoint": group_stats(store, "endpoint"),
+        "slow_outlier_count": len(outliers),
+        "slow_outliers": [store.record(index) for index in outliers[:DETAILED_RESULTS_LIMIT]],
+        "error_rate_series": error_rate_series(store, bucket_seconds)
+    }
+
+
+def store_from_records(records: Iterable[Dict[str, Any]]) -> ColumnarResultStore:
+    """Load saved report or NDJSON records into a store for offline analysis"""
+    store = ColumnarResultStore()
+    for position, record in enumerate(records):
+        # Saved records only carry second-resolution wall time; keep their order
+        store.append(record.get("test_name", ""), record.get("status", "UNKNOWN"), record.get("details", ""),
+                     float(record.get("duration") or 0.0), store.origin_ns + position,
+                     record.get("workflow_id"), record.get("agent_name"), record.get("endpoint"),
+                     record.get("timing"))
+    return store
+
+
+def main(argv: List[str]) -> int:
+    """Print per-group analytics for a saved report or NDJSON result log"""
+    if not argv:
+        print("Usage: report_analytics.py REPORT.json|RESULTS.ndjson [--by test_name|agent_name|workflow_id|endpoint]")
+        return 1
+    path = argv[0]
+    by = argv[argv.index("--by") + 1] if "--by" in argv else "test_name"
+
+    if path.endswith(".ndjson"):
+        from result_sink import read_results
+        store = store_from_records(read_results(path))
+    else:
+        with open(path) as f:
+            report = json.load(f)
+        store = store_from_records(report.get("detailed_results", []))
+        if report.get("detailed_results_scope", "all") != "all":
+            if report.get("results_file"):
+                from result_sink import read_results
+                store = store_from_records(read_results(report["results_file"]))
+            else:
+                print("⚠️ Report lists failures and slow outliers only; "
+                      "rerun with --detailed-results or --results-ndjson for every result")
+
+    print(f"📊 {len(store)} results, {success_rate(store):.1f}% passed")
+    print(json.dumps(group_stats(store, by), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
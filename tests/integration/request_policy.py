@@ -0,0 +1,394 @@
+"""
+Request Policy Engine
+Timeouts and retry settings loaded from tests/fixtures/mock-data/test_config.json,
+exponential backoff with jitter, optional hedging of idempotent requests, and
+accounting that keeps first-attempt latency apart from the final latency
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+from latency_histogram import LatencyHistogram, record_latency
+from metrics_exporter import HarnessMetrics
+from request_timing import capture_sync, elapsed_since
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "mock-data" / "test_config.json"
+
+DEFAULT_TIMEOUTS = {
+    "api_requests": 15.0,
+    "workflow_execution": 30.0,
+    "integration_tests": 20.0
+}
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Transport failures worth another attempt; covers requests, aiohttp and timeouts
+RETRY_EXCEPTIONS = (OSError, asyncio.TimeoutError, aiohttp.ClientError)
+
+
+def request_not_sent(error: BaseException) -> bool:
+    """Whether a transport error happened before any of the request reached the server"""
+    if isinstance(error, (aiohttp.ClientConnectorError, requests.exceptions.ConnectTimeout)):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        # requests wraps urllib3's MaxRetryError; NewConnectionError subclasses ConnectTimeoutError
+        return isinstance(getattr(error.args[0], "reason", None), ConnectTimeoutError)
+    return False
+
+
+@dataclass
+class RetrySettings:
+    """Exponential backoff parameters (the test_config.json retry_settings block)"""
+    max_retries: int = 3
+    retry_delay: float = 2.0
+    backoff_multiplier: float = 1.5
+    max_delay: float = 30.0
+    jitter: float = 0.5
+
+    def delay(self, retry: int, rng: random.Random) -> float:
+        """Backoff before retry number `retry` (1-based), randomly shortened by up to `jitter`"""
+        base = min(self.max_delay, self.retry_delay * self.backoff_multiplier ** (retry - 1))
+        return base * (1 - self.jitter * rng.random())
+
+
+@dataclass
+class RequestPolicy:
+    """Per-category timeouts plus retry and hedging rules"""
+    timeouts: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TIMEOUTS))
+    retry: RetrySettings = field(default_factory=RetrySettings)
+    # Seconds to wait on an idempotent request before sending a duplicate; None disables hedging
+    hedge_delay: Optional[float] = None
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
+    def timeout(self, category: str = "api_requests") -> float:
+        """Timeout in seconds for a request category"""
+        return self.timeouts.get(category, self.timeouts.get("api_requests", DEFAULT_TIMEOUTS["api_requests"]))
+
+    def is_retryable(self, value: Any) -> bool:
+        """Whether a completed response carries a status worth retrying"""
+        return status_of(value) in self.retry_statuses
+
+
+def load_request_policy(path: Optional[Path] = None, hedge_delay: Optional[float] = None,
+                        max_retries: Optional[int] = None) -> RequestPolicy:
+    """Build a policy from test_config.json, falling back to defaults for missing settings"""
+    config_path = Path(path) if path else DEFAULT_CONFIG_PATH
+    try:
+        with open(config_path) as f:
+            environment = json.load(f).get("test_environment", {})
+    except (OSError, json.JSONDecodeError):
+        environment = {}
+
+    timeouts = dict(DEFAULT_TIMEOUTS)
+    timeouts.update({key: float(value) for key, value in environment.get("timeout_settings", {}).items()})
+
+    retry_config = environment.get("retry_settings", {})
+    retry = RetrySettings(
+        max_retries=int(retry_config.get("max_retries", RetrySettings.max_retries)),
+        retry_delay=float(retry_config.get("retry_delay", RetrySettings.retry_delay)),
+        backoff_multiplier=float(retry_config.get("backoff_multiplier", RetrySettings.backoff_multiplier))
+    )
+    if max_retries is not None:
+        retry.max_retries = max_retries
+
+    return RequestPolicy(timeouts=timeouts, retry=retry, hedge_delay=hedge_delay)
+
+
+def status_of(value: Any) -> Optional[int]:
+    """HTTP status of a requests/aiohttp response or a (status, body) tuple"""
+    for attribute in ("status_code", "status"):
+        status = getattr(value, attribute, None)
+        if isinstance(status, int):
+            return status
+    if isinstance(value, tuple) and value and isinstance(value[0], int):
+        return value[0]
+    return None
+
+
+class RequestStats:
+    """First-attempt and final latency per request key, with retry and hedge counters"""
+
+    def __init__(self):
+        self.first_attempt: Dict[str, LatencyHistogram] = {}
+        self.final: Dict[str, LatencyHistogram] = {}
+        self.requests = 0
+        self.retries = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.exhausted = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "retries_exhausted": self.exhausted,
+            "first_attempt_latency": {key: h.summary() for key, h in sorted(self.first_attempt.items())},
+            "final_latency": {key: h.summary() for key, h in sorted(self.final.items())}
+        }
+
+
+class _Attempt:
+    """Outcome of one (possibly hedged) attempt"""
+    __slots__ = ("value", "error", "primary_latency")
+
+    def __init__(self, value: Any = None, error: Optional[BaseException] = None, primary_latency: float = 0.0):
+        self.value = value
+        self.error = error
+        self.primary_latency = primary_latency
+
+
+class PolicyExecutor:
+    """Runs request callables under a RequestPolicy and records RequestStats"""
+
+    def __init__(self, policy: Optional[RequestPolicy] = None, stats: Optional[RequestStats] = None):
+        self.policy = policy or load_request_policy()
+        self.stats = stats or RequestStats()
+        # Sync callers may share one executor across threads
+        self._lock = threading.Lock()
+        self._threads: Optional[ThreadPoolExecutor] = None
+
+    def _should_retry(self, outcome: _Attempt, retry_on: Optional[Callable[[Any], bool]],
+                      idempotent: bool) -> bool:
+        # A non-idempotent request that may have reached the server (a webhook run, a mission
+        # launch) is never repeated; only a connection that never opened is retried
+        if outcome.error is not None:
+            if not idempotent:
+                return request_not_sent(outcome.error)
+            return isinstance(outcome.error, RETRY_EXCEPTIONS)
+        return idempotent and (retry_on or self.policy.is_retryable)(outcome.value)
+
+    def _finish(self, key: str, outcome: _Attempt, retries: int, started: float, exhausted: bool) -> Any:
+        """Record the final latency and return the value or raise the last error"""
+        with self._lock:
+            record_latency(self.stats.final, key, time.perf_counter() - started)
+            self.stats.requests += 1
+            self.stats.retries += retries
+            if exhausted:
+                self.stats.exhausted += 1
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.value
+
+    async def run_async(self, key: str, call: Callable[[], Awaitable[Any]], idempotent: bool = False,
+                        retry: bool = True, retry_on: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Await `call` with retries, hedging it when idempotent and hedging is enabled.
+        Non-idempotent calls are only retried when the connection could not be opened"""
+        started = time.perf_counter()
+        max_retries = self.policy.retry.max_retries if retry else 0
+        hedge = idempotent and self.policy.hedge_delay is not None
+
+        retries = 0
+        while True:
+            outcome = await (self._hedged_async(call) if hedge else self._single_async(call))
+            if retries == 0:
+                with self._lock:
+                    record_latency(self.stats.first_attempt, key, outcome.primary_latency)
+            retryable = self._should_retry(outcome, retry_on, idempotent)
+            if not retryable or retries >= max_retries:
+                return self._finish(key, outcome, retries, started, retryable and max_retries > 0)
+            retries += 1
+            await asyncio.sleep(self.policy.retry.delay(retries, self.policy.rng))
+
+    async def _single_async(self, call: Callable[[], Awaitable[Any]]) -> _Attempt:
+        start = time.perf_counter()
+        try:
+            value = await call()
+        except RETRY_EXCEPTIONS as e:
+            return _Attempt(error=e, primary_latency=time.perf_counter() - start)
+        return _Attempt(value, primary_latency=time.perf_counter() - start)
+
+    async def _hedged_async(self, call: Callable[[], Awaitable[Any]]) -> _Attempt:
+        """Send a duplicate if the primary is still running after hedge_delay; first success wins"""
+        start = time.perf_counter()
+        pending = set()
+        outcome = None
+        try:
+            # Cancelling the caller at any await below cancels whichever requests are still running
+            primary = asyncio.ensure_future(call())
+            pending = {primary}
+            done, pending = await asyncio.wait(pending, timeout=self.policy.hedge_delay)
+            if done:
+                return self._attempt_from_task(primary, time.perf_counter() - start)
+
+            with self._lock:
+                self.stats.hedges_sent += 1
+            hedge = asyncio.ensure_future(call())
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    candidate = self._attempt_from_task(task, time.perf_counter() - start)
+                    if candidate.error is None or outcome is None:
+                        outcome = candidate
+                    if candidate.error is None:
+                        if task is hedge:
+                            self.stats.hedges_won += 1
+                        # A primary abandoned for the hedge is recorded at abandonment, a lower bound
+                        outcome.primary_latency = time.perf_counter() - start
+                        return outcome
+            return outcome
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _attempt_from_task(self, task: "asyncio.Future", elapsed: float) -> _Attempt:
+        error = task.exception()
+        if error is not None:
+            if not isinstance(error, RETRY_EXCEPTIONS):
+                raise error
+            return _Attempt(error=error, primary_latency=elapsed)
+        return _Attempt(task.result(), primary_latency=elapsed)
+
+    def run_sync(self, key: str, call: Callable[[], Any], idempotent: bool = False,
+                 retry: bool = True, retry_on: Optional[Callable[[Any], bool]] = None,
+                 discard: Optional[Callable[[Any], None]] = None) -> Any:
+        """Call `call` with retries, hedging it on a worker thread when idempotent and enabled.
+        Non-idempotent calls are only retried when the connection could not be opened"""
+        started = time.perf_counter()
+        max_retries = self.policy.retry.max_retries if retry else 0
+        hedge = idempotent and self.policy.hedge_delay is not None
+
+        retries = 0
+        while True:
+            outcome = self._hedged_sync(call, discard) if hedge else self._single_sync(call)
+            if retries == 0:
+                with self._lock:
+                    record_latency(self.stats.first_attempt, key, outcome.primary_latency)
+            retryable = self._should_retry(outcome, retry_on, idempotent)
+            if not retryable or retries >= max_retries:
+                return self._finish(key, outcome, retries, started, retryable and max_retries > 0)
+            if outcome.error is None and discard is not None:
+                discard(outcome.value)
+            retries += 1
+            time.sleep(self.policy.retry.delay(retries, self.policy.rng))
+
+    def _single_sync(self, call: Callable[[], Any]) -> _Attempt:
+        start = time.perf_counter()
+        try:
+            value = call()
+        except RETRY_EXCEPTIONS as e:
+            return _Attempt(error=e, primary_latency=time.perf_counter() - start)
+        return _Attempt(value, primary_latency=time.perf_counter() - start)
+
+    def _hedged_sync(self, call: Callable[[], Any], discard: Optional[Callable[[Any], None]]) -> _Attempt:
+        """Thread-based counterpart of _hedged_async; a losing request is discarded when it finishes"""
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+        start = time.perf_counter()
+        primary = self._threads.submit(call)
+        done, _ = wait({primary}, timeout=self.policy.hedge_delay)
+        if done:
+            return self._attempt_from_future(primary, time.perf_counter() - start)
+
+        with self._lock:
+            self.stats.hedges_sent += 1
+        hedge = self._threads.submit(call)
+        pending = {primary, hedge}
+        outcome = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                candidate = self._attempt_from_future(future, time.perf_counter() - start)
+                if candidate.error is None or outcome is None:
+                    outcome = candidate
+                if candidate.error is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.stats.hedges_won += 1
+                    outcome.primary_latency = time.perf_counter() - start
+                    for loser in pending:
+                        if discard is not None:
+                            loser.add_done_callback(
+                                lambda f: discard(f.result()) if f.exception() is None else None
+                            )
+                    return outcome
+        return outcome
+
+    def _attempt_from_future(self, future, elapsed: float) -> _Attempt:
+        error = future.exception()
+        if error is not None:
+            if not isinstance(error, RETRY_EXCEPTIONS):
+                raise error
+            return _Attempt(error=error, primary_latency=elapsed)
+        return _Attempt(future.result(), primary_latency=elapsed)
+
+    def close(self):
+        """Stop the hedging threads"""
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+            self._threads = None
+
+
+class PolicySession:
+    """requests.Session wrapper applying category timeouts, retries and hedging"""
+
+    def __init__(self, session, policy: Optional[RequestPolicy] = None,
+                 executor: Optional[PolicyExecutor] = None,
+                 metrics: Optional[HarnessMetrics] = None):
+        self.session = session
+        self.executor = executor or PolicyExecutor(policy)
+        # Final outcome of each request, retries and hedges included, for a /metrics scraper
+        self.metrics = metrics
+
+    @property
+    def policy(self) -> RequestPolicy:
+        return self.executor.policy
+
+    @property
+    def stats(self) -> RequestStats:
+        return self.executor.stats
+
+    def request(self, method: str, url: str, category: str = "api_requests",
+                key: Optional[str] = None, **kwargs):
+        """Issue a request; the timeout defaults to the category's configured value"""
+        kwargs.setdefault("timeout", self.policy.timeout(category))
+        method = method.upper()
+        
+        def attempt():
+            # Each attempt (retry or hedge) carries the phase timing of its own request
+            with capture_sync() as timing:
+                response = self.session.request(method, url, **kwargs)
+            response.timing = timing
+            return response
+        
+        start_ns = time.perf_counter_ns()
+        status = "error"
+        try:
+            response = self.executor.run_sync(
+                key or f"{method} {url}",
+                attempt,
+                idempotent=method in IDEMPOTENT_METHODS,
+                discard=lambda response: response.close()
+            )
+            status = str(response.status_code)
+            return response
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_request(key or urlsplit(url).path or "/", status, elapsed_since(start_ns))
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.executor.close()
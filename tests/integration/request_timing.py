@@ -0,0 +1,289 @@
+"""
+Per-Phase Request Timing
+Splits each request into queue, DNS, connect, TLS, time-to-first-byte and
+transfer phases, stamped with time.perf_counter_ns. The async path uses aiohttp
+trace hooks; the sync path uses urllib3 connection classes mounted on the
+shared requests session
+"""
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+from latency_histogram import LatencyHistogram, record_latency
+
+PHASES = ("queue", "dns", "connect", "tls", "ttfb", "transfer", "total")
+
+
+def elapsed_since(start_ns: int) -> float:
+    """Seconds since a perf_counter_ns stamp"""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+@dataclass
+class RequestTiming:
+    """perf_counter_ns stamps of one request; phases that did not happen stay 0"""
+    start_ns: int = 0
+    queue_ns: int = 0
+    dns_ns: int = 0
+    connect_ns: int = 0
+    tls_ns: int = 0
+    sent_ns: int = 0
+    headers_ns: int = 0
+    end_ns: int = 0
+    reused: bool = False
+
+    @classmethod
+    def started(cls) -> "RequestTiming":
+        return cls(start_ns=time.perf_counter_ns())
+
+    def finish(self):
+        """Stamp the end of the body transfer"""
+        self.end_ns = time.perf_counter_ns()
+
+    def phases(self) -> Dict[str, float]:
+        """Phase durations in seconds; connection phases only appear on new connections"""
+        phases: Dict[str, float] = {}
+        for phase in ("queue", "dns", "connect", "tls"):
+            value = getattr(self, f"{phase}_ns")
+            if value:
+                phases[phase] = value / 1e9
+        if self.sent_ns and self.headers_ns:
+            phases["ttfb"] = (self.headers_ns - self.sent_ns) / 1e9
+        if self.headers_ns and self.end_ns:
+            phases["transfer"] = (self.end_ns - self.headers_ns) / 1e9
+        if self.start_ns and self.end_ns:
+            phases["total"] = (self.end_ns - self.start_ns) / 1e9
+        return phases
+
+    def to_dict(self) -> Dict[str, float]:
+        record: Dict[str, float] = {phase: round(value, 6) for phase, value in self.phases().items()}
+        record["reused"] = self.reused
+        return record
+
+
+def record_phases(histograms: Dict[str, Dict[str, LatencyHistogram]], key: str, timing: RequestTiming):
+    """Record each phase of a request under `key` in {key: {phase: histogram}}"""
+    by_phase = histograms.setdefault(key, {})
+    for phase, seconds in timing.phases().items():
+        record_latency(by_phase, phase, seconds)
+
+
+def phase_summaries(histograms: Dict[str, Dict[str, LatencyHistogram]]) -> Dict[str, Dict[str, Dict]]:
+    """Report form: {key: {phase: percentile summary}} with an "all" key merging every request"""
+    merged: Dict[str, LatencyHistogram] = {}
+    for by_phase in histograms.values():
+        for phase, histogram in by_phase.items():
+            merged.setdefault(phase, LatencyHistogram()).merge(histogram)
+    summaries = {
+        key: {phase: by_phase[phase].summary() for phase in PHASES if phase in by_phase}
+        for key, by_phase in sorted(histograms.items())
+    }
+    if merged:
+        summaries["all"] = {phase: merged[phase].summary() for phase in PHASES if phase in merged}
+    return summaries
+
+
+def format_phases(by_phase: Dict[str, Dict]) -> str:
+    """One line of p50/p90 per phase from a phase_summaries entry"""
+    return " | ".join(
+        f"{phase} p50 {summary['p50'] * 1000:.1f}ms p90 {summary['p90'] * 1000:.1f}ms (n={summary['count']})"
+        for phase, summary in by_phase.items() if summary["count"]
+    )
+
+
+# aiohttp: the caller passes a RequestTiming as trace_request_ctx and calls finish() after reading the body
+
+def _timing_of(context) -> Optional[RequestTiming]:
+    timing = context.trace_request_ctx
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_request_start(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None and not timing.start_ns:
+        timing.start_ns = time.perf_counter_ns()
+
+
+async def _on_queued_start(session, context, params):
+    context.queued_at = time.perf_counter_ns()
+
+
+async def _on_queued_end(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None:
+        timing.queue_ns += time.perf_counter_ns() - context.queued_at
+
+
+async def _on_dns_start(session, context, params):
+    context.dns_at = time.perf_counter_ns()
+
+
+async def _on_dns_end(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None:
+        timing.dns_ns += time.perf_counter_ns() - context.dns_at
+
+
+async def _on_connection_start(session, context, params):
+    timing = _timing_of(context)
+    context.dns_before = timing.dns_ns if timing is not None else 0
+    context.connect_at = time.perf_counter_ns()
+
+
+async def _on_connection_end(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None:
+        # aiohttp resolves inside connection creation and reports no TLS boundary,
+        # so connect covers TCP plus any TLS handshake
+        resolving = timing.dns_ns - context.dns_before
+        timing.connect_ns += time.perf_counter_ns() - context.connect_at - resolving
+
+
+async def _on_connection_reuse(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None:
+        timing.reused = True
+
+
+async def _on_request_sent(session, context, params):
+    # Headers, then each body chunk; the last stamp marks the request fully sent
+    timing = _timing_of(context)
+    if timing is not None:
+        timing.sent_ns = time.perf_counter_ns()
+
+
+async def _on_request_end(session, context, params):
+    timing = _timing_of(context)
+    if timing is not None:
+        timing.headers_ns = time.perf_counter_ns()
+
+
+def timing_trace_config() -> aiohttp.TraceConfig:
+    """Trace hooks filling the RequestTiming passed as a request's trace_request_ctx"""
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_queued_start.append(_on_queued_start)
+    config.on_connection_queued_end.append(_on_queued_end)
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connection_start)
+    config.on_connection_create_end.append(_on_connection_end)
+    config.on_connection_reuseconn.append(_on_connection_reuse)
+    config.on_request_headers_sent.append(_on_request_sent)
+    config.on_request_chunk_sent.append(_on_request_sent)
+    config.on_request_end.append(_on_request_end)
+    return config
+
+
+# requests/urllib3: connections stamp the RequestTiming active on their thread
+
+_active = threading.local()
+
+
+def _current() -> Optional[RequestTiming]:
+    return getattr(_active, "timing", None)
+
+
+@contextmanager
+def capture_sync() -> Iterator[RequestTiming]:
+    """Time the requests call made inside the block on this thread"""
+    timing = RequestTiming.started()
+    previous, _active.timing = _current(), timing
+    try:
+        yield timing
+    finally:
+        timing.finish()
+        timing.reused = not timing.connect_ns
+        _active.timing = previous
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self) -> socket.socket:
+        timing = _current()
+        if timing is None:
+            return super()._new_conn()
+        start = time.perf_counter_ns()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host.strip("[]"), self.port,
+                                           allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            return super()._new_conn()  # Raises urllib3's own resolution error
+        resolved = time.perf_counter_ns()
+        timing.dns_ns += resolved - start
+
+        # Try each resolved address in turn, as urllib3's create_connection does, so the
+        # lookup is not repeated inside the connect and a refusing first address falls through
+        host = self._dns_host
+        error: Optional[ConnectTimeoutError] = None
+        try:
+            for *_, address in addresses:
+                self._dns_host = address[0]
+                try:
+                    sock = super()._new_conn()
+                except ConnectTimeoutError as e:  # NewConnectionError included
+                    error = e
+                    continue
+                timing.connect_ns += time.perf_counter_ns() - resolved
+                return sock
+        finally:
+            self._dns_host = host
+        timing.connect_ns += time.perf_counter_ns() - resolved
+        if error is None:
+            return super()._new_conn()  # No addresses: urllib3 reports it
+        raise error
+
+    def getresponse(self, *args, **kwargs):
+        timing = _current()
+        if timing is None:
+            return super().getresponse(*args, **kwargs)
+        # The request has been written by the time urllib3 waits for the response
+        timing.sent_ns = time.perf_counter_ns()
+        response = super().getresponse(*args, **kwargs)
+        timing.headers_ns = time.perf_counter_ns()
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        timing = _current()
+        if timing is None:
+            return super().connect()
+        start = time.perf_counter_ns()
+        before = timing.dns_ns + timing.connect_ns
+        super().connect()
+        # Whatever connect() spent beyond resolving and the TCP connect is the TLS handshake
+        timing.tls_ns += time.perf_counter_ns() - start - (timing.dns_ns + timing.connect_ns - before)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools use the timed connection classes"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
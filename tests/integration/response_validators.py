@@ -0,0 +1,153 @@
+"""
+Compiled Response Validators
+Each workflow webhook and API endpoint has a small response schema that is
+compiled once into a field checker and looked up by exact key ("webhook:<name>"
+or the endpoint path). Other webhooks take the schema of their kind in the
+workflow catalog. Large bodies can be parsed and checked on a thread pool
+so the event loop keeps draining responses under load
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from json_codec import DecodeError, LazyBody, decode
+from workflow_catalog import WorkflowCatalog, WorkflowEntry
+
+# A compiled checker returns None for a valid body, otherwise the reason it failed
+Checker = Callable[[Any], Optional[str]]
+
+
+@dataclass(frozen=True)
+class ResponseSchema:
+    """Required fields, fields that must be truthy, and fields with one expected value"""
+    required: Tuple[str, ...] = ()
+    truthy: Tuple[str, ...] = ()
+    equals: Tuple[Tuple[str, Any], ...] = ()
+
+    def compile(self) -> Checker:
+        """Build a checker that closes over precomputed field sets"""
+        required = frozenset(self.required) | frozenset(self.truthy) | frozenset(f for f, _ in self.equals)
+        truthy = self.truthy
+        equals = self.equals
+
+        def check(body: Any) -> Optional[str]:
+            if not isinstance(body, dict):
+                return "response is not a JSON object"
+            if not required <= body.keys():
+                return f"missing fields: {', '.join(sorted(required - body.keys()))}"
+            for field in truthy:
+                if not body[field]:
+                    return f"{field} is {body[field]!r}"
+            for field, expected in equals:
+                if body[field] != expected:
+                    return f"{field} is {body[field]!r}, expected {expected!r}"
+            return None
+
+        return check
+
+
+# Every workflow reports `success`; known workflows also return their result fields
+WORKFLOW_SCHEMAS = {
+    "webhook:comprehensive-agent-validation": ResponseSchema(
+        required=("success", "validationType", "totalAgents", "systemHealth", "agentHealthChecks")),
+    "webhook:crew-coordination": ResponseSchema(
+        required=("success", "crewStatus", "coordinationLevel", "missionStatus")),
+    "webhook:bilateral-learning": ResponseSchema(
+        required=("success", "syncStatus", "learningProgress", "knowledgeGained")),
+    "webhook:multimodal-agency": ResponseSchema(
+        required=("success", "analysisResult", "dataProcessed", "insightsGenerated"))
+}
+GENERIC_WORKFLOW_SCHEMA = ResponseSchema(equals=(("success", True),))
+
+ENDPOINT_SCHEMAS = {
+    "/api/sync/status": ResponseSchema(truthy=("success",), equals=(("syncStatus", "active"),)),
+    "/api/coordination/mission": ResponseSchema(truthy=("success",), equals=(("coordinationStatus", "active"),)),
+    "/api/knowledge/synthesize": ResponseSchema(truthy=("success",))
+}
+DEFAULT_ENDPOINT_SCHEMA = ResponseSchema(truthy=("success",))
+
+# Catalogued webhooks and harness names (e.g. optimized-crew-coordination) take the schema of
+# their WorkflowEntry.kind, the same classification the n8n stand-in answers with
+KIND_SCHEMAS = {
+    "agent-validation": WORKFLOW_SCHEMAS["webhook:comprehensive-agent-validation"],
+    "crew-coordination": WORKFLOW_SCHEMAS["webhook:crew-coordination"],
+    "bilateral-learning": WORKFLOW_SCHEMAS["webhook:bilateral-learning"],
+    "multimodal-agency": WORKFLOW_SCHEMAS["webhook:multimodal-agency"]
+}
+
+
+class ValidatorRegistry:
+    """Compiled checkers by exact key; unseen keys are resolved once and memoised"""
+
+    def __init__(self, schemas: Optional[Dict[str, ResponseSchema]] = None,
+                 pool_workers: int = 0, pool_threshold: int = 64 * 1024,
+                 catalog: Optional[WorkflowCatalog] = None):
+        self.schemas: Dict[str, ResponseSchema] = dict(schemas or {})
+        self.catalog = catalog
+        self._routes: Optional[Dict[str, WorkflowEntry]] = None
+        self._checkers: Dict[str, Checker] = {key: schema.compile() for key, schema in self.schemas.items()}
+        self._lock = threading.Lock()
+        self.pool_threshold = pool_threshold
+        self._pool = ThreadPoolExecutor(pool_workers, thread_name_prefix="validate") if pool_workers > 0 else None
+
+    def register(self, key: str, schema: ResponseSchema):
+        with self._lock:
+            self.schemas[key] = schema
+            self._checkers[key] = schema.compile()
+
+    def _resolve(self, key: str) -> ResponseSchema:
+        """Schema for a key with no exact registration"""
+        if key.startswith("webhook:"):
+            if self._routes is None:
+                # Loaded on the first unregistered webhook; called under the registry lock
+                self._routes = (self.catalog or WorkflowCatalog()).routes()
+            entry = self._routes.get(key[len("webhook:"):])
+            return KIND_SCHEMAS.get(entry.kind, GENERIC_WORKFLOW_SCHEMA) if entry else GENERIC_WORKFLOW_SCHEMA
+        return DEFAULT_ENDPOINT_SCHEMA
+
+    def checker(self, key: str) -> Checker:
+        checker = self._checkers.get(key)
+        if checker is None:
+            with self._lock:
+                checker = self._checkers.setdefault(key, self._resolve(key).compile())
+        return checker
+
+    def check(self, key: str, body: Any) -> Optional[str]:
+        return self.checker(key)(body)
+
+    def is_valid(self, key: str, body: Any) -> bool:
+        return self.checker(key)(body) is None
+
+    def parse_and_check(self, key: str, raw: bytes) -> Tuple[Any, Optional[str]]:
+        """Decode a raw body and check it, returning (body, error)"""
+        try:
+            body = decode(raw)
+        except DecodeError as e:
+            return None, f"invalid JSON: {e}"
+        return body, self.checker(key)(body)
+
+    def check_body(self, key: str, body: LazyBody) -> Optional[str]:
+        """Check a lazily read body, decoding it only now"""
+        try:
+            return self.checker(key)(body.data)
+        except DecodeError as e:
+            return f"invalid JSON: {e}"
+
+    async def parse_and_check_async(self, key: str, raw: bytes) -> Tuple[Any, Optional[str]]:
+        """parse_and_check, moved to the pool for bodies of at least pool_threshold bytes"""
+        if self._pool is None or len(raw) < self.pool_threshold:
+            return self.parse_and_check(key, raw)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, self.parse_and_check, key, raw)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+def default_registry(**options) -> ValidatorRegistry:
+    """Registry preloaded with the suite's workflow and endpoint schemas"""
+    return ValidatorRegistry({**WORKFLOW_SCHEMAS, **ENDPOINT_SCHEMAS}, **options)
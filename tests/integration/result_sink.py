@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON Result Sink
+Append-only, line-buffered result log written as tests complete, plus the
+incrementally maintained summary used by the reports, so long soak runs keep
+flat memory and survive interruption
+"""
+
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+class RunningSummary:
+    """Pass/fail counts, per-category counts and duration totals maintained one result at a time"""
+
+    def __init__(self, slow_threshold: float = 10.0):
+        self.total = 0
+        self.status_counts: Dict[str, int] = {}
+        self.category_counts: Dict[str, Dict[str, int]] = {}
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+        self.slow_threshold = slow_threshold
+        self.slow_count = 0
+
+    def add(self, status: str, duration: float, categories: Iterable[str] = ()):
+        """Fold one result into the summary in O(number of categories)"""
+        self.total += 1
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.duration_sum += duration
+        self.duration_max = max(self.duration_max, duration)
+        if duration > self.slow_threshold:
+            self.slow_count += 1
+        for category in categories:
+            counts = self.category_counts.setdefault(category, {})
+            counts[status] = counts.get(status, 0) + 1
+
+    def count(self, *statuses: str) -> int:
+        """Number of results with any of the given statuses"""
+        return sum(self.status_counts.get(status, 0) for status in statuses)
+
+    def category_count(self, category: str, *statuses: str) -> int:
+        """Number of results in a category, optionally limited to the given statuses"""
+        counts = self.category_counts.get(category, {})
+        if not statuses:
+            return sum(counts.values())
+        return sum(counts.get(status, 0) for status in statuses)
+
+    def success_rate(self) -> float:
+        """Percentage of results that passed"""
+        return self.count("PASS") / self.total * 100 if self.total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_tests": self.total,
+            "status_counts": dict(self.status_counts),
+            "category_counts": {category: dict(counts) for category, counts in self.category_counts.items()},
+            "success_rate": round(self.success_rate(), 2),
+            "test_duration": self.duration_sum,
+            "max_duration": self.duration_max,
+            "slow_tests": self.slow_count
+        }
+
+
+class NDJSONResultSink:
+    """Writes one JSON object per line, flushed as each line completes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        # Line buffering flushes every record, so a crash loses at most a partial line
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]):
+        """Append one result record"""
+        self._file.write(json.dumps({"type": "result", **record}, separators=(",", ":"), default=str) + "\n")
+
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        """Append the closing summary record, if given, and close the file"""
+        if self._file.closed:
+            return
+        if summary is not None:
+            self._file.write(json.dumps({"type": "summary", **summary}, separators=(",", ":"), default=str) + "\n")
+        self._file.close()
+
+    def __enter__(self) -> "NDJSONResultSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_results(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield result records from an NDJSON log, skipping a torn final line"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("type") == "result":
+                yield record
+
+
+def summarize_file(path: str) -> RunningSummary:
+    """Rebuild the running summary from an NDJSON log, e.g. after an interrupted run"""
+    summary = RunningSummary()
+    for record in read_results(path):
+        summary.add(record.get("status", "UNKNOWN"), float(record.get("duration") or 0.0),
+                    record.get("categories") or ())
+    return summary
+
+
+def main(argv) -> int:
+    """Print the summary of one or more NDJSON result logs"""
+    if not argv:
+        print("Usage: result_sink.py RESULTS.ndjson [RESULTS.ndjson ...]")
+        return 1
+    for path in argv:
+        print(f"{path}: {json.dumps(summarize_file(path).to_dict(), indent=2)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
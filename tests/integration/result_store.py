@@ -0,0 +1,147 @@
+"""
+Columnar Result Store
+Array-backed storage for test results: repeated names and ids are interned
+into lookup tables, free-text details stay in a plain list, durations live in
+a float64 array and timestamps in an int64 array of monotonic nanoseconds, so
+million-sample load runs stay compact.
+Request phase durations get one int64 nanosecond column per phase
+"""
+
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from request_timing import PHASES
+
+# Index stored for a missing optional string
+NO_VALUE = -1
+
+# Connection reuse flag stored for a result without request timing
+NO_TIMING = -1
+
+
+class StringTable:
+    """Interns strings to small integer ids"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        """Id for `value`, adding it on first use; NO_VALUE for None"""
+        if value is None:
+            return NO_VALUE
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+    def find(self, value: str) -> int:
+        """Id for `value` without adding it; NO_VALUE if it was never interned"""
+        return self._ids.get(value, NO_VALUE)
+
+    def lookup(self, string_id: int) -> Optional[str]:
+        return None if string_id == NO_VALUE else self.values[string_id]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ColumnarResultStore:
+    """Append-only result columns with the record view the reports expect"""
+
+    def __init__(self):
+        # Pair the monotonic clock with wall time once, to render readable timestamps
+        self.origin_ns = time.monotonic_ns()
+        self.origin_wall = time.time()
+
+        self.strings = StringTable()
+        self.test_names = array("i")
+        self.statuses = array("i")
+        # Details embed durations and response excerpts, so nearly every value is unique
+        # and interning would only add a table entry per result
+        self.details: List[Optional[str]] = []
+        self.workflow_ids = array("i")
+        self.agent_names = array("i")
+        self.endpoints = array("i")
+        self.durations = array("d")
+        self.timestamps_ns = array("q")
+        # Phase durations in ns, 0 for a phase that did not happen; reused is NO_TIMING without a timing
+        self.phases_ns = {phase: array("q") for phase in PHASES}
+        self.reused = array("b")
+
+    def append(self, test_name: str, status: str, details: str = "", duration: float = 0.0,
+               timestamp_ns: Optional[int] = None, workflow_id: Optional[str] = None,
+               agent_name: Optional[str] = None, endpoint: Optional[str] = None,
+               timing: Optional[Dict[str, Any]] = None) -> int:
+        """Store one result and return its index; `timing` is in RequestTiming.to_dict() form"""
+        intern = self.strings.intern
+        self.test_names.append(intern(test_name))
+        self.statuses.append(intern(status))
+        self.details.append(details or None)
+        self.workflow_ids.append(intern(workflow_id))
+        self.agent_names.append(intern(agent_name))
+        self.endpoints.append(intern(endpoint))
+        self.durations.append(duration)
+        self.timestamps_ns.append(time.monotonic_ns() if timestamp_ns is None else timestamp_ns)
+        phases = timing or {}
+        for phase, column in self.phases_ns.items():
+            column.append(round(phases.get(phase, 0.0) * 1e9))
+        self.reused.append(NO_TIMING if timing is None else int(bool(timing.get("reused"))))
+        return len(self.durations) - 1
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def wall_time(self, timestamp_ns: int) -> datetime:
+        """Wall-clock time of a stored monotonic timestamp"""
+        return datetime.fromtimestamp(self.origin_wall + (timestamp_ns - self.origin_ns) / 1e9)
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Materialise one result in the report record format"""
+        lookup = self.strings.lookup
+        return {
+            "test_name": lookup(self.test_names[index]),
+            "status": lookup(self.statuses[index]),
+            "details": self.details[index] or "",
+            "timestamp": self.wall_time(self.timestamps_ns[index]).strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": self.durations[index],
+            "workflow_id": lookup(self.workflow_ids[index]),
+            "agent_name": lookup(self.agent_names[index]),
+            "endpoint": lookup(self.endpoints[index]),
+            "timing": self.timing(index)
+        }
+
+    def timing(self, index: int) -> Optional[Dict[str, Any]]:
+        """Phases of one result in RequestTiming.to_dict() form, or None without a timing"""
+        if self.reused[index] == NO_TIMING:
+            return None
+        timing: Dict[str, Any] = {
+            phase: round(column[index] / 1e9, 6) for phase, column in self.phases_ns.items() if column[index]
+        }
+        timing["reused"] = bool(self.reused[index])
+        return timing
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Materialise every result, oldest first"""
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.records()
+
+    def nbytes(self) -> int:
+        """Approximate array column storage in bytes, excluding strings and the details list"""
+        columns = (self.test_names, self.statuses, self.workflow_ids,
+                   self.agent_names, self.endpoints, self.durations, self.timestamps_ns,
+                   self.reused, *self.phases_ns.values())
+        return sum(column.itemsize * len(column) for column in columns)
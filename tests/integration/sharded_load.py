@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Multi-Process Sharded Load Runner
+Splits a load profile across N worker processes, each with its own event loop
+and connection pool. Workers stream compact per-interval histogram deltas back,
+and the parent merges them into one report, so the harness can saturate the
+server under test instead of its own core
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import queue
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import cycle
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from fixture_catalog import NDJSONCorpus
+from json_codec import count_body
+from latency_histogram import LatencyHistogram
+from load_generator import LOAD_MODES, LoadGenerator, LoadProfile, LoadReport
+from payload_cache import JSON_HEADERS, PayloadCache, RequestStamper, query_params
+from response_validators import ValidatorRegistry, default_registry
+
+TARGET_GROUPS = ("agents", "sync", "integration", "workflows", "consultation")
+# validate: decode and check the body; count: drain and count bytes without decoding
+BODY_MODES = ("validate", "count")
+
+
+@dataclass
+class LoadTarget:
+    """One endpoint driven by the sharded runner"""
+    name: str
+    method: str
+    url: str
+    payload: Optional[Dict[str, Any]] = None
+    body: str = "validate"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadTarget":
+        return cls(data["name"], data["method"], data["url"], data.get("payload"), data.get("body", "validate"))
+
+
+@dataclass
+class ShardSpec:
+    """Picklable description of one worker's share of the load"""
+    shard: int
+    shards: int
+    targets: List[Dict[str, Any]]
+    mode: str
+    rate: float
+    users: int
+    duration: float
+    ramp_up: float = 0.0
+    think_time: float = 0.0
+    report_interval: float = 1.0
+    connection_limit: int = 100
+    request_timeout: float = 30.0
+    # NDJSON payload corpus; when set, POST targets send a sampled line instead of their fixed payload
+    corpus: Optional[str] = None
+    # Add request_id/timestamp slots to every fixed payload
+    stamp_requests: bool = False
+
+    @classmethod
+    def split(cls, profile: LoadProfile, targets: List[LoadTarget], shards: int,
+              **options) -> List["ShardSpec"]:
+        """Divide a profile's rate or virtual users evenly across shards"""
+        specs = []
+        for shard in range(shards):
+            # Remainder users go to the lowest shards; idle shards still report
+            users = profile.users // shards + (1 if shard < profile.users % shards else 0)
+            specs.append(cls(
+                shard=shard,
+                shards=shards,
+                targets=[asdict(target) for target in targets],
+                mode=profile.mode,
+                rate=profile.rate / shards,
+                users=users,
+                duration=profile.duration,
+                ramp_up=profile.ramp_up,
+                think_time=profile.think_time,
+                **options
+            ))
+        return specs
+
+
+class IntervalAccumulator:
+    """Per-target counters and histograms for the current reporting interval"""
+
+    def __init__(self):
+        self.targets: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, passed: bool, seconds: float, nbytes: int = 0):
+        entry = self.targets.get(name)
+        if entry is None:
+            entry = self.targets[name] = {"passed": 0, "failed": 0, "bytes": 0, "histogram": LatencyHistogram()}
+        entry["passed" if passed else "failed"] += 1
+        entry["bytes"] += nbytes
+        entry["histogram"].record(seconds)
+
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        """Return the interval's compact delta and start a new interval"""
+        delta = {
+            name: {"passed": entry["passed"], "failed": entry["failed"], "bytes": entry["bytes"],
+                   "histogram": entry["histogram"].to_dict()}
+            for name, entry in self.targets.items()
+        }
+        self.targets = {}
+        return delta
+
+
+def response_passed(validators: ValidatorRegistry, key: str, status: int, body: bytes) -> bool:
+    """HTTP 200 and a body that passes the target's compiled response schema"""
+    return status == 200 and validators.parse_and_check(key, body)[1] is None
+
+
+async def drive_shard(spec: ShardSpec, emit) -> LoadReport:
+    """Run one shard's load in the current event loop, emitting interval deltas via `emit`"""
+    targets = [LoadTarget.from_dict(target) for target in spec.targets]
+    # Shards start at different points of the rotation so their mixes interleave
+    rotation = cycle(targets[spec.shard % len(targets):] + targets[:spec.shard % len(targets)])
+    accumulator = IntervalAccumulator()
+    timeout = aiohttp.ClientTimeout(total=spec.request_timeout)
+
+    corpus = NDJSONCorpus(spec.corpus) if spec.corpus else None
+    rng = random.Random(spec.shard)
+    payloads = PayloadCache()
+    validators = default_registry()
+    stamper = RequestStamper(f"shard{spec.shard}") if spec.stamp_requests else None
+
+    connector = aiohttp.TCPConnector(limit=spec.connection_limit, limit_per_host=spec.connection_limit)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        def request_options(target: LoadTarget) -> Dict[str, Any]:
+            if corpus is not None and target.method == "POST":
+                return {"data": corpus.sample(rng), "headers": JSON_HEADERS}
+            if target.payload is None:
+                return {}
+            if target.method == "GET":
+                return {"params": query_params({**target.payload, **(stamper.values() if stamper else {})})}
+            if stamper is not None:
+                return payloads.template(target.name, target.payload).request_kwargs(**stamper.values())
+            return payloads.encoded(target.name, target.payload).request_kwargs()
+
+        async def send() -> bool:
+            target = next(rotation)
+            start_time = time.perf_counter()
+            nbytes = 0
+            try:
+                async with session.request(target.method, target.url, **request_options(target)) as response:
+                    if target.body == "count":
+                        nbytes = await count_body(response)
+                        passed = response.status == 200
+                    else:
+                        body = await response.read()
+                        nbytes = len(body)
+                        passed = response_passed(validators, target.name, response.status, body)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                passed = False
+            accumulator.record(target.name, passed, time.perf_counter() - start_time, nbytes)
+            return passed
+
+        async def flush_periodically():
+            while True:
+                await asyncio.sleep(spec.report_interval)
+                emit({"type": "interval", "shard": spec.shard, "targets": accumulator.drain()})
+
+        if spec.mode == "closed" and spec.users == 0:
+            report = LoadReport("shard", spec.mode)
+        else:
+            profile = LoadProfile(
+                target=f"shard-{spec.shard}", mode=spec.mode, rate=spec.rate, users=max(spec.users, 1),
+                duration=spec.duration, ramp_up=spec.ramp_up, think_time=spec.think_time
+            )
+            if spec.mode == "open":
+                # Offset each shard's arrivals so N shards interleave rather than fire together
+                await asyncio.sleep(spec.shard / (spec.rate * spec.shards))
+            flusher = asyncio.ensure_future(flush_periodically())
+            try:
+                report = await LoadGenerator(profile, send).run()
+            finally:
+                flusher.cancel()
+    if corpus is not None:
+        corpus.close()
+
+    emit({"type": "interval", "shard": spec.shard, "targets": accumulator.drain()})
+    return report
+
+
+def shard_process(spec: ShardSpec, results: "multiprocessing.Queue", start_event):
+    """Worker process entry point: signal readiness, wait for the common start, run, report"""
+    results.put({"type": "ready", "shard": spec.shard})
+    start_event.wait()
+    try:
+        report = asyncio.run(drive_shard(spec, results.put))
+        results.put({"type": "done", "shard": spec.shard, "sent": report.sent,
+                     "dropped": report.dropped, "elapsed": report.elapsed})
+    except Exception as e:
+        results.put({"type": "error", "shard": spec.shard, "error": f"{type(e).__name__}: {e}"})
+
+
+@dataclass
+class ShardedLoadReport:
+    """Merged view of every shard's results"""
+    mode: str
+    workers: int
+    overall: LoadReport
+    targets: Dict[str, LoadReport] = field(default_factory=dict)
+    shards: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    bytes_received: Dict[str, int] = field(default_factory=dict)
+
+    def merge_delta(self, delta: Dict[str, Dict[str, Any]]):
+        """Fold one interval delta from a shard into the totals"""
+        for name, entry in delta.items():
+            report = self.targets.get(name)
+            if report is None:
+                report = self.targets[name] = LoadReport(name, self.mode)
+            histogram = LatencyHistogram.from_dict(entry["histogram"])
+            report.sent += entry["passed"] + entry["failed"]
+            self.bytes_received[name] = self.bytes_received.get(name, 0) + entry.get("bytes", 0)
+            for merged in (report, self.overall):
+                merged.passed += entry["passed"]
+                merged.failed += entry["failed"]
+                merged.latency.merge(histogram)
+
+    def finish_shard(self, message: Dict[str, Any]):
+        """Record a shard's closing counters"""
+        self.shards[message["shard"]] = {key: value for key, value in message.items() if key != "type"}
+        if message["type"] == "done":
+            self.overall.sent += message["sent"]
+            self.overall.dropped += message["dropped"]
+            self.overall.elapsed = max(self.overall.elapsed, message["elapsed"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        overall = self.overall.to_dict()
+        total_bytes = sum(self.bytes_received.values())
+        overall["bytes_received"] = total_bytes
+        overall["bytes_per_second"] = round(total_bytes / self.overall.elapsed, 1) if self.overall.elapsed else 0.0
+        targets = {}
+        for name, report in sorted(self.targets.items()):
+            report.elapsed = self.overall.elapsed
+            targets[name] = {**report.to_dict(), "bytes_received": self.bytes_received.get(name, 0)}
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "overall": overall,
+            "targets": targets,
+            "shards": [self.shards[shard] for shard in sorted(self.shards)],
+            # Merged bucket counts, in the layout latency_histogram.py merges across runs
+            "latency_histograms": {
+                "targets": {name: report.latency.to_dict() for name, report in sorted(self.targets.items())}
+            }
+        }
+
+
+class ShardedLoadRunner:
+    """Runs a load profile across worker processes and merges their streamed results"""
+
+    def __init__(self, profile: LoadProfile, targets: List[LoadTarget], workers: int = 4,
+                 report_interval: float = 1.0, startup_timeout: float = 30.0, **shard_options):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if not targets:
+            raise ValueError("at least one load target is required")
+        self.profile = profile
+        self.targets = targets
+        self.workers = workers
+        self.report_interval = report_interval
+        self.startup_timeout = startup_timeout
+        self.shard_options = shard_options
+
+    def _progress(self, report: ShardedLoadReport, started: float):
+        overall = report.overall
+        elapsed = time.perf_counter() - started
+        print(f"  ⏳ {elapsed:5.1f}s: {overall.completed} completed, {overall.failed} failed, "
+              f"p99 {overall.latency.percentile(99):.3f}s")
+
+    def run(self, verbose: bool = True) -> ShardedLoadReport:
+        """Start the workers, release them together and merge results until all finish"""
+        # Spawned workers get a fresh interpreter rather than a forked copy of this one's state
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        start_event = context.Event()
+        specs = ShardSpec.split(self.profile, self.targets, self.workers,
+                                report_interval=self.report_interval, **self.shard_options)
+        processes = [
+            context.Process(target=shard_process, args=(spec, results, start_event),
+                            name=f"load-shard-{spec.shard}", daemon=True)
+            for spec in specs
+        ]
+        for process in processes:
+            process.start()
+
+        report = ShardedLoadReport(self.profile.mode, self.workers, LoadReport("sharded", self.profile.mode))
+        try:
+            ready = 0
+            deadline = time.monotonic() + self.startup_timeout
+            while ready < self.workers:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(f"only {ready}/{self.workers} load workers started")
+                if results.get(timeout=remaining)["type"] == "ready":
+                    ready += 1
+
+            start_event.set()
+            started = time.perf_counter()
+            last_progress = started
+            finished = 0
+            while finished < self.workers:
+                try:
+                    message = results.get(timeout=self.report_interval)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        raise RuntimeError("load workers exited without reporting")
+                    continue
+                if message["type"] == "interval":
+                    report.merge_delta(message["targets"])
+                elif message["type"] in ("done", "error"):
+                    report.finish_shard(message)
+                    finished += 1
+                    if message["type"] == "error" and verbose:
+                        print(f"  💥 Shard {message['shard']} failed: {message['error']}")
+                if verbose and time.perf_counter() - last_progress >= self.report_interval:
+                    self._progress(report, started)
+                    last_progress = time.perf_counter()
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Multi-process sharded load against the AlexAI endpoints")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Worker processes")
+    parser.add_argument("--mode", choices=LOAD_MODES, default="closed",
+                        help="open: fixed total request rate; closed: fixed total virtual users")
+    parser.add_argument("--rate", type=float, default=100.0, help="Total requests per second (open loop)")
+    parser.add_argument("--users", type=int, default=50, help="Total virtual users (closed loop)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Load duration in seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Linear ramp-up in seconds")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between requests per virtual user")
+    parser.add_argument("--groups", default="agents,sync",
+                        help=f"Comma-separated endpoint groups: {', '.join(TARGET_GROUPS)}")
+    parser.add_argument("--local-url", default="http://localhost:8000", help="AlexAI API base URL")
+    parser.add_argument("--n8n-url", default="https://n8n.pbradygeorgen.com", help="n8n base URL")
+    parser.add_argument("--alexai-standin", action="store_true",
+                        help="Drive an AlexAI API stand-in started in this process instead of --local-url")
+    parser.add_argument("--report-interval", type=float, default=1.0, help="Seconds between streamed deltas")
+    parser.add_argument("--stamp-requests", action="store_true",
+                        help="Add a request_id and timestamp to every fixed payload")
+    parser.add_argument("--corpus", help="NDJSON payload corpus (see fixture_catalog.py generate) sampled for POST bodies")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # Imported here so worker processes only load what drive_shard needs
+    from alexai_standin_server import AlexAIStandInServer
+    from comprehensive_agent_workflow_test import ComprehensiveAgentWorkflowTester
+    from standin_server import BackgroundStandIn
+
+    args = parse_args(argv)
+    groups = [group.strip() for group in args.groups.split(",") if group.strip()]
+    profile = LoadProfile(
+        target="sharded", mode=args.mode, rate=args.rate, users=args.users,
+        duration=args.duration, ramp_up=args.ramp_up, think_time=args.think_time
+    )
+
+    standin = BackgroundStandIn(AlexAIStandInServer()) if args.alexai_standin else None
+    local_url = standin.start() if standin else args.local_url
+    try:
+        tester = ComprehensiveAgentWorkflowTester(local_url=local_url, n8n_url=args.n8n_url)
+        targets = tester.load_targets(groups)
+        shape = f"{args.rate:g} req/s open loop" if args.mode == "open" else f"{args.users} virtual users"
+        print(f"📈 Sharded load: {len(targets)} endpoints, {args.workers} workers, {shape}, {args.duration:g}s")
+        if args.corpus:
+            # Index once here so workers find a fresh sidecar instead of each scanning the file
+            with NDJSONCorpus(args.corpus) as corpus:
+                print(f"📇 Sampling POST bodies from {len(corpus)} corpus payloads")
+        report = ShardedLoadRunner(profile, targets, args.workers, args.report_interval,
+                                   corpus=args.corpus, stamp_requests=args.stamp_requests).run()
+    finally:
+        if standin:
+            standin.stop()
+
+    summary = report.to_dict()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_filename = f"sharded_load_report_{timestamp}.json"
+    with open(f"tests/reports/{report_filename}", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    overall = summary["overall"]
+    print("\n" + "=" * 60)
+    print("📈 SHARDED LOAD RUN COMPLETE")
+    print("=" * 60)
+    print(f"Requests: {overall['completed']} completed, {overall['dropped']} dropped")
+    print(f"Throughput: {overall['throughput_rps']} req/s across {report.workers} workers, "
+          f"{overall['bytes_per_second'] / 1e6:.2f} MB/s received")
+    print(f"Error Rate: {overall['error_rate']}%")
+    latency = overall["latency"]
+    if latency["count"]:
+        print(f"Latency: p50 {latency['p50']:.3f}s | p90 {latency['p90']:.3f}s | p99 {latency['p99']:.3f}s | "
+              f"max {latency['max']:.3f}s")
+    print(f"Report Saved: {report_filename}")
+    return 0 if overall["failed"] == 0 and overall["completed"] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
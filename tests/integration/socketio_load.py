@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Socket.IO Concurrent-Client Load
+Opens many socketio.AsyncClient connections on a linear ramp, puts them in
+project rooms the way dashboards join them, and measures connect latency,
+echo round trips, room broadcast delivery and fan-out skew, and dropped
+connections. Every client runs on one event loop, so loop lag shows up in the
+latencies; watch the loop lag line before blaming the server
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import socketio
+
+from latency_histogram import LatencyHistogram
+from request_timing import elapsed_since
+from socketio_standin_server import DEFAULT_SOCKETIO_PATH, SocketIOStandInServer
+from standin_server import LatencyModel, FaultModel
+
+LATENCY_NAMES = ("connect", "echo", "broadcast", "fanout_skew", "loop_lag")
+
+
+@dataclass
+class SocketLoadProfile:
+    """Shape of a Socket.IO load run"""
+    clients: int = 100
+    ramp_up: float = 10.0
+    duration: float = 30.0
+    room_size: int = 10
+    echo_interval: float = 1.0
+    broadcast_interval: float = 1.0
+    connect_timeout: float = 10.0
+    delivery_timeout: float = 5.0
+    socketio_path: str = DEFAULT_SOCKETIO_PATH
+    transports: List[str] = field(default_factory=lambda: ["websocket"])
+
+    def __post_init__(self):
+        if self.clients < 1:
+            raise ValueError("a socket load run needs at least one client")
+        if self.duration <= 0:
+            raise ValueError("duration must be positive")
+        if self.room_size < 1:
+            raise ValueError("room size must be at least 1")
+        self.ramp_up = max(self.ramp_up, 0.0)
+
+    @property
+    def rooms(self) -> int:
+        return -(-self.clients // self.room_size)
+
+    def connect_offset(self, index: int) -> float:
+        """Seconds after the start at which the index-th client connects"""
+        return self.ramp_up * index / self.clients
+
+
+@dataclass
+class SocketLoadReport:
+    """Running totals for a Socket.IO load run"""
+    url: str
+    clients: int
+    connected: int = 0
+    connect_failures: int = 0
+    dropped: int = 0
+    peak_connected: int = 0
+    echo_sent: int = 0
+    echo_received: int = 0
+    broadcasts_sent: int = 0
+    deliveries_expected: int = 0
+    deliveries_received: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, int] = field(default_factory=dict)
+    latency: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {name: LatencyHistogram() for name in LATENCY_NAMES})
+
+    def error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarise the run for the JSON report"""
+        delivered = self.echo_received + self.deliveries_received
+        return {
+            "url": self.url,
+            "timestamp": datetime.now().isoformat(),
+            "connections": {
+                "attempted": self.clients,
+                "connected": self.connected,
+                "connect_failures": self.connect_failures,
+                "dropped": self.dropped,
+                "peak_connected": self.peak_connected
+            },
+            "messages": {
+                "echo_sent": self.echo_sent,
+                "echo_received": self.echo_received,
+                "echo_lost": self.echo_sent - self.echo_received,
+                "broadcasts_sent": self.broadcasts_sent,
+                "deliveries_expected": self.deliveries_expected,
+                "deliveries_received": self.deliveries_received,
+                "deliveries_missed": self.deliveries_expected - self.deliveries_received
+            },
+            # "overall" lets baseline_store.py gate message throughput alongside the latencies
+            "overall": {
+                "completed": delivered,
+                "elapsed": round(self.elapsed, 3),
+                "throughput_rps": round(delivered / self.elapsed, 2) if self.elapsed > 0 else 0
+            },
+            "errors": dict(self.errors),
+            "latency": {name: histogram.summary() for name, histogram in self.latency.items()},
+            "latency_histograms": {"socketio": {name: histogram.to_dict()
+                                                for name, histogram in self.latency.items()
+                                                if histogram.total_count}}
+        }
+
+
+@dataclass
+class _Broadcast:
+    sent_ns: int
+    recipients: Set[int]
+    arrivals: List[int] = field(default_factory=list)
+    delivered: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class _LoadClient:
+    """One Socket.IO connection and the rooms it joined"""
+
+    def __init__(self, run: "SocketLoadRun", index: int):
+        self.run = run
+        self.index = index
+        self.room = f"{run.run_id}-room-{index // run.profile.room_size}"
+        self.echo_room = f"{run.run_id}-echo-{index}"
+        self.ready = asyncio.Event()
+        self.closing = False
+        self.echo_seq = 0
+        self.sio = socketio.AsyncClient(reconnection=False, http_session=run.session, handle_sigint=False)
+        self.sio.on("chat_message", self.on_message)
+        self.sio.on("disconnect", self.on_disconnect)
+
+    async def on_message(self, message: Dict[str, Any]):
+        received = time.perf_counter_ns()
+        if message.get("kind") == "echo":
+            self.run.report.echo_received += 1
+            self.run.report.latency["echo"].record((received - message["sent_ns"]) / 1e9)
+            self.ready.set()
+        elif message.get("kind") == "broadcast":
+            self.run.deliver(message["room"], message["seq"], self.index, received)
+
+    async def on_disconnect(self, *reason):
+        self.run.live -= 1
+        if not self.closing:
+            self.run.report.dropped += 1
+            self.run.report.error(f"disconnect: {reason[0]}" if reason else "disconnect")
+        self.run.members.get(self.room, set()).discard(self.index)
+
+    async def connect(self) -> bool:
+        profile = self.run.profile
+        start = time.perf_counter_ns()
+        try:
+            await asyncio.wait_for(
+                self.sio.connect(self.run.url, transports=profile.transports, socketio_path=profile.socketio_path,
+                                 wait_timeout=profile.connect_timeout),
+                profile.connect_timeout
+            )
+        except (socketio.exceptions.ConnectionError, asyncio.TimeoutError, aiohttp.ClientError) as e:
+            self.run.report.connect_failures += 1
+            self.run.report.error(f"connect: {type(e).__name__}")
+            return False
+        self.run.report.latency["connect"].record(elapsed_since(start))
+        return True
+
+    async def emit_echo(self):
+        self.echo_seq += 1
+        self.run.report.echo_sent += 1
+        await self.sio.emit("chat_message", {"projectId": self.echo_room, "kind": "echo",
+                                             "seq": self.echo_seq, "sent_ns": time.perf_counter_ns()})
+
+    async def join(self) -> bool:
+        """Join the shared and echo rooms; ready once the first echo comes back through the echo room"""
+        await self.sio.emit("join_project", {"projectId": self.room})
+        await self.sio.emit("join_project", {"projectId": self.echo_room})
+        await self.emit_echo()
+        try:
+            await asyncio.wait_for(self.ready.wait(), self.run.profile.delivery_timeout)
+        except asyncio.TimeoutError:
+            self.run.report.error("join: no echo")
+            return False
+        return True
+
+    async def echo_loop(self, end: float):
+        interval = self.run.profile.echo_interval
+        await asyncio.sleep(random.uniform(0, interval))
+        while time.monotonic() < end and self.sio.connected:
+            await self.emit_echo()
+            await asyncio.sleep(interval)
+
+    async def close(self):
+        self.closing = True
+        if self.sio.connected:
+            await self.sio.disconnect()
+
+
+class SocketLoadRun:
+    """Ramps clients into project rooms and drives echo and broadcast traffic through them"""
+
+    def __init__(self, url: str, profile: SocketLoadProfile, report_interval: float = 5.0):
+        self.url = url
+        self.profile = profile
+        self.report_interval = report_interval
+        self.run_id = f"load-{uuid.uuid4().hex[:8]}"
+        self.report = SocketLoadReport(url=url, clients=profile.clients)
+        self.members: Dict[str, Set[int]] = {}
+        self.pending: Dict[Tuple[str, int], _Broadcast] = {}
+        self.clients: Dict[int, _LoadClient] = {}
+        self.live = 0
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def deliver(self, room: str, seq: int, index: int, received_ns: int):
+        broadcast = self.pending.get((room, seq))
+        if broadcast is None:
+            self.report.error("broadcast: late delivery")
+            return
+        if index not in broadcast.recipients:
+            return  # Joined the room after the broadcast was sent; not counted either way
+        broadcast.arrivals.append(received_ns)
+        self.report.deliveries_received += 1
+        self.report.latency["broadcast"].record((received_ns - broadcast.sent_ns) / 1e9)
+        if len(broadcast.arrivals) >= len(broadcast.recipients):
+            broadcast.delivered.set()
+
+    async def _settle(self, room: str, seq: int):
+        """Wait for every recipient or the delivery timeout, then record the fan-out skew"""
+        broadcast = self.pending[(room, seq)]
+        try:
+            await asyncio.wait_for(broadcast.delivered.wait(), self.profile.delivery_timeout)
+        except asyncio.TimeoutError:
+            pass
+        del self.pending[(room, seq)]
+        if len(broadcast.arrivals) > 1:
+            self.report.latency["fanout_skew"].record((max(broadcast.arrivals) - min(broadcast.arrivals)) / 1e9)
+
+    async def _client(self, index: int, start: float, end: float):
+        await asyncio.sleep(max(0.0, start + self.profile.connect_offset(index) - time.monotonic()))
+        client = _LoadClient(self, index)
+        self.clients[index] = client
+        if not await client.connect():
+            return
+        self.report.connected += 1
+        self.live += 1
+        self.report.peak_connected = max(self.report.peak_connected, self.live)
+        if not await client.join():
+            return
+        self.members.setdefault(client.room, set()).add(index)
+        await client.echo_loop(end)
+
+    async def _broadcaster(self, room: str, end: float):
+        """The room's lowest-numbered ready member announces to the room every interval"""
+        interval = self.profile.broadcast_interval
+        seq = 0
+        settling = []
+        await asyncio.sleep(random.uniform(0, interval))
+        while time.monotonic() < end:
+            members = self.members.get(room)
+            if members:
+                sender = self.clients[min(members)]
+                seq += 1
+                self.pending[(room, seq)] = _Broadcast(time.perf_counter_ns(), recipients=set(members))
+                self.report.broadcasts_sent += 1
+                self.report.deliveries_expected += len(members)
+                settling.append(asyncio.create_task(self._settle(room, seq)))
+                await sender.sio.emit("chat_message", {"projectId": room, "kind": "broadcast", "room": room,
+                                                       "seq": seq})
+            await asyncio.sleep(interval)
+        await asyncio.gather(*settling)
+
+    async def _loop_lag(self, end: float):
+        """Record how late a short sleep wakes up, a proxy for event-loop saturation"""
+        tick = 0.1
+        while time.monotonic() < end:
+            before = time.perf_counter_ns()
+            await asyncio.sleep(tick)
+            self.report.latency["loop_lag"].record(max(0.0, elapsed_since(before) - tick))
+
+    async def _progress(self, start: float, end: float):
+        while time.monotonic() < end:
+            await asyncio.sleep(min(self.report_interval, max(0.0, end - time.monotonic())))
+            echo = self.report.latency["echo"]
+            echo_p90 = f"{echo.percentile(90) * 1000:.1f}ms" if echo.total_count else "-"
+            print(f"🔌 t={time.monotonic() - start:5.1f}s connected {self.live}/{self.profile.clients} | "
+                  f"dropped {self.report.dropped} | failed {self.report.connect_failures} | "
+                  f"echo p90 {echo_p90} (n={echo.total_count})")
+
+    async def run(self) -> SocketLoadReport:
+        profile = self.profile
+        # No connection cap: every websocket holds a connection for the whole run
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(connector=connector) as self.session:
+            start = time.monotonic()
+            end = start + profile.ramp_up + profile.duration
+            rooms = [f"{self.run_id}-room-{room}" for room in range(profile.rooms)]
+            background = [asyncio.create_task(self._loop_lag(end))]
+            if self.report_interval > 0:
+                background.append(asyncio.create_task(self._progress(start, end)))
+            try:
+                await asyncio.gather(
+                    *(self._client(index, start, end) for index in range(profile.clients)),
+                    *(self._broadcaster(room, end) for room in rooms)
+                )
+                await asyncio.gather(*background)
+            finally:
+                for task in background:
+                    task.cancel()
+                self.report.elapsed = min(time.monotonic(), end) - start
+                await asyncio.gather(*(client.close() for client in self.clients.values()), return_exceptions=True)
+        return self.report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Concurrent Socket.IO client load and round-trip latency")
+    parser.add_argument("--url", default="http://localhost:8000", help="Socket.IO server base URL")
+    parser.add_argument("--socketio-path", default=DEFAULT_SOCKETIO_PATH,
+                        help="Socket.IO path (the Next.js app serves api/socket)")
+    parser.add_argument("--clients", type=int, default=100, help="Simultaneous clients to open")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds over which clients connect, evenly spaced")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to hold every client after the ramp")
+    parser.add_argument("--room-size", type=int, default=10, help="Clients per project room")
+    parser.add_argument("--echo-interval", type=float, default=1.0, help="Seconds between each client's echoes")
+    parser.add_argument("--broadcast-interval", type=float, default=1.0, help="Seconds between broadcasts per room")
+    parser.add_argument("--connect-timeout", type=float, default=10.0, help="Seconds allowed for each connect")
+    parser.add_argument("--delivery-timeout", type=float, default=5.0,
+                        help="Seconds after which an undelivered message counts as missed")
+    parser.add_argument("--polling", action="store_true",
+                        help="Start on HTTP long-polling and upgrade, as browsers do, instead of websocket only")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="Seconds between progress lines")
+    parser.add_argument("--standin", action="store_true",
+                        help="Run against a Socket.IO stand-in started in this process instead of --url")
+    parser.add_argument("--standin-latency", type=float, default=0.0, help="Stand-in service time per event")
+    parser.add_argument("--standin-error-rate", type=float, default=0.0,
+                        help="Fraction of stand-in connects refused and messages dropped")
+    return parser.parse_args(argv)
+
+
+async def run_load(args: argparse.Namespace) -> SocketLoadReport:
+    profile = SocketLoadProfile(
+        clients=args.clients, ramp_up=args.ramp_up, duration=args.duration, room_size=args.room_size,
+        echo_interval=args.echo_interval, broadcast_interval=args.broadcast_interval,
+        connect_timeout=args.connect_timeout, delivery_timeout=args.delivery_timeout,
+        socketio_path=args.socketio_path, transports=["polling", "websocket"] if args.polling else ["websocket"]
+    )
+    standin = None
+    url = args.url
+    if args.standin:
+        standin = SocketIOStandInServer(socketio_path=args.socketio_path,
+                                        latency=LatencyModel(base=args.standin_latency),
+                                        faults=FaultModel(error_rate=args.standin_error_rate))
+        url = await standin.start()
+    print(f"🔌 Socket.IO load: {profile.clients} clients in {profile.rooms} rooms against {url}, "
+          f"ramp {profile.ramp_up:g}s, hold {profile.duration:g}s")
+    try:
+        return await SocketLoadRun(url, profile, args.report_interval).run()
+    finally:
+        if standin:
+            await standin.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run_load(args))
+    summary = report.to_dict()
+    summary["profile"] = {key: value for key, value in vars(args).items() if not key.startswith("standin")}
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_filename = f"socketio_load_report_{timestamp}.json"
+    with open(f"tests/reports/{report_filename}", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    connections, messages = summary["connections"], summary["messages"]
+    print("\n" + "=" * 60)
+    print("🔌 SOCKET.IO LOAD RUN COMPLETE")
+    print("=" * 60)
+    print(f"Connections: {connections['connected']}/{connections['attempted']} connected, "
+          f"{connections['connect_failures']} failed, {connections['dropped']} dropped, "
+          f"peak {connections['peak_connected']}")
+    print(f"Echo: {messages['echo_received']}/{messages['echo_sent']} returned | "
+          f"Broadcast: {messages['deliveries_received']}/{messages['deliveries_expected']} delivered")
+    for name in LATENCY_NAMES:
+        latency = summary["latency"][name]
+        if latency["count"]:
+            print(f"{name:>12}: p50 {latency['p50'] * 1000:.1f}ms | p90 {latency['p90'] * 1000:.1f}ms | "
+                  f"p99 {latency['p99'] * 1000:.1f}ms | max {latency['max'] * 1000:.1f}ms")
+    for kind, count in sorted(summary["errors"].items()):
+        print(f"⚠️  {kind}: {count}")
+    print(f"Report Saved: {report_filename}")
+    failed = connections["connect_failures"] + connections["dropped"] + messages["deliveries_missed"]
+    return 0 if failed == 0 and connections["connected"] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
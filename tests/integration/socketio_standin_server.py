@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Local Socket.IO Stand-In
+Mirrors the project-room events of src/app/api/socket/route.ts on an aiohttp
+Socket.IO server, so socket load runs can target localhost without the app
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, List, Optional
+
+import socketio
+from aiohttp import web
+
+from standin_server import StandInServer, add_standin_arguments, models_from_args, serve_forever
+
+DEFAULT_SOCKETIO_PATH = "socket.io"
+
+
+def project_room(project_id: Any) -> str:
+    return f"project-{project_id}"
+
+
+class SocketIOStandInServer(StandInServer):
+    """Socket.IO server with the app's project rooms, chat and task broadcasts"""
+
+    def __init__(self, socketio_path: str = DEFAULT_SOCKETIO_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.socketio_path = socketio_path.strip("/")
+        self.sio: Optional[socketio.AsyncServer] = None
+        self.connected = 0
+        self.peak_connected = 0
+
+    def build_app(self) -> web.Application:
+        # Handlers run in arrival order per client, as on the Node server, so a client's
+        # join_project is in effect before any message it sends afterwards
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins="*", async_handlers=False)
+        app = web.Application()
+        self.sio.attach(app, socketio_path=self.socketio_path)
+        self._register_handlers(self.sio)
+        return app
+
+    async def _delay(self, key: str) -> bool:
+        """Apply the latency model for `key`; False when the fault model drops the event"""
+        self.request_counts[key] = self.request_counts.get(key, 0) + 1
+        delay = self.latency_overrides.get(key, self.latency).sample(self.rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.rng.random() >= self.faults.error_rate
+
+    def _register_handlers(self, sio: socketio.AsyncServer):
+        @sio.event
+        async def connect(sid, environ, auth=None):
+            # An injected fault refuses the connection, as an overloaded server would
+            if not await self._delay("connect"):
+                return False
+            self.connected += 1
+            self.peak_connected = max(self.peak_connected, self.connected)
+            await sio.save_session(sid, {"id": sid, "name": f"User-{sid[-4:]}", "status": "online"})
+            return True
+
+        @sio.event
+        async def disconnect(sid, *args):
+            self.connected -= 1
+            for room in sio.rooms(sid):
+                if room.startswith("project-"):
+                    await sio.emit("user_left", sid, room=room, skip_sid=sid)
+
+        @sio.event
+        async def join_project(sid, data):
+            room = project_room(data.get("projectId"))
+            await sio.enter_room(sid, room)
+            await sio.emit("user_joined", await sio.get_session(sid), room=room, skip_sid=sid)
+
+        @sio.event
+        async def leave_project(sid, data):
+            room = project_room(data.get("projectId"))
+            await sio.leave_room(sid, room)
+            await sio.emit("user_left", sid, room=room, skip_sid=sid)
+
+        @sio.event
+        async def task_update(sid, data):
+            if await self._delay("task_update"):
+                await sio.emit("task_updated", data, room=project_room(data.get("projectId")))
+
+        @sio.event
+        async def project_update(sid, data):
+            if await self._delay("project_update"):
+                await sio.emit("project_updated", data, room=project_room(data.get("id")))
+
+        @sio.event
+        async def chat_message(sid, message):
+            if message.get("projectId") and await self._delay("chat_message"):
+                await sio.emit("chat_message", message, room=project_room(message["projectId"]))
+
+        @sio.event
+        async def user_presence(sid, data):
+            if data.get("projectId"):
+                await sio.emit("user_presence_updated", data, room=project_room(data["projectId"]))
+
+        @sio.event
+        async def user_typing(sid, data):
+            if data.get("projectId"):
+                await sio.emit("user_typing", data.get("userId"), room=project_room(data["projectId"]),
+                               skip_sid=sid)
+
+        @sio.event
+        async def user_stopped_typing(sid, data):
+            if data.get("projectId"):
+                await sio.emit("user_stopped_typing", data.get("userId"), room=project_room(data["projectId"]),
+                               skip_sid=sid)
+
+    def stats(self) -> Dict[str, int]:
+        return {"connected": self.connected, "peak_connected": self.peak_connected, **self.request_counts}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Local Socket.IO stand-in server")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--socketio-path", default=DEFAULT_SOCKETIO_PATH,
+                        help="Socket.IO path (the Next.js app serves api/socket)")
+    add_standin_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    latency, faults = models_from_args(args)
+    server = SocketIOStandInServer(
+        socketio_path=args.socketio_path,
+        host=args.host,
+        port=args.port,
+        latency=latency,
+        faults=faults,
+        seed=args.seed
+    )
+    try:
+        asyncio.run(serve_forever(server, "Socket.IO"))
+    except KeyboardInterrupt:
+        print("\n⏹️ Socket.IO stand-in stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Stand-In Server Base
+Embedded asyncio HTTP server with configurable latency and fault injection,
+shared by the local stand-ins for n8n and the AlexAI API
+"""
+
+import asyncio
+import random
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+
+@dataclass
+class LatencyModel:
+    """Service-time model applied before a stand-in responds"""
+    base: float = 0.0
+    jitter: float = 0.0
+    tail_probability: float = 0.0
+    tail_latency: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one service time in seconds"""
+        delay = self.base
+        if self.jitter > 0:
+            delay += rng.uniform(0, self.jitter)
+        if self.tail_probability > 0 and rng.random() < self.tail_probability:
+            delay += self.tail_latency
+        return delay
+
+
+@dataclass
+class FaultModel:
+    """Error injection rates applied after the service time elapses"""
+    error_rate: float = 0.0
+    error_status: int = 500
+    malformed_rate: float = 0.0
+
+
+class StandInServer:
+    """Base class running an aiohttp application on a local port"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: Optional[LatencyModel] = None, faults: Optional[FaultModel] = None,
+                 latency_overrides: Optional[Dict[str, LatencyModel]] = None,
+                 seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.latency = latency or LatencyModel()
+        self.faults = faults or FaultModel()
+        self.latency_overrides: Dict[str, LatencyModel] = latency_overrides or {}
+        self.rng = random.Random(seed)
+        self.request_counts: Dict[str, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application serving this stand-in's routes"""
+        raise NotImplementedError
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start serving and return the base URL"""
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Port 0 asks the OS for a free port; read back the one it picked
+        self.port = self._runner.addresses[0][1]
+        return self.base_url
+
+    async def stop(self):
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StandInServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def simulate(self, key: str) -> Optional[web.Response]:
+        """Apply the latency model for `key` and return an injected error, if any"""
+        self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+        delay = self.latency_overrides.get(key, self.latency).sample(self.rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = self.rng.random()
+        if roll < self.faults.error_rate:
+            return web.json_response(
+                {"success": False, "error": "Injected stand-in failure"},
+                status=self.faults.error_status
+            )
+        if roll < self.faults.error_rate + self.faults.malformed_rate:
+            return web.json_response({"message": "Injected malformed response"})
+        return None
+
+
+class BackgroundStandIn:
+    """Runs a stand-in on its own event-loop thread for synchronous testers"""
+
+    def __init__(self, server: StandInServer, startup_timeout: float = 30.0):
+        self.server = server
+        self.startup_timeout = startup_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """Start the server thread and return the base URL once it is listening"""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.server.start())
+            except BaseException as e:
+                # A bind or build_app error ends the thread; hand it to start() instead
+                failure.append(e)
+                loop.run_until_complete(self.server.stop())
+                return
+            finally:
+                ready.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, name="standin-server", daemon=True)
+        thread.start()
+        if not ready.wait(self.startup_timeout):
+            raise TimeoutError(f"stand-in did not start listening within {self.startup_timeout}s")
+        if failure:
+            thread.join()
+            loop.close()
+            raise failure[0]
+        self._loop, self._thread = loop, thread
+        return self.server.base_url
+
+    def stop(self):
+        """Stop the server and join its thread"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def add_standin_arguments(parser):
+    """Add the shared latency and fault options to an argparse parser"""
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed service time in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform extra service time in seconds")
+    parser.add_argument("--tail-probability", type=float, default=0.0, help="Chance of a slow-tail response")
+    parser.add_argument("--tail-latency", type=float, default=0.0, help="Extra seconds for slow-tail responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status for injected errors")
+    parser.add_argument("--malformed-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with an invalid body")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+
+
+def models_from_args(args):
+    """Build (LatencyModel, FaultModel) from parsed stand-in options"""
+    latency = LatencyModel(args.latency, args.jitter, args.tail_probability, args.tail_latency)
+    faults = FaultModel(args.error_rate, args.error_status, args.malformed_rate)
+    return latency, faults
+
+
+async def serve_forever(server: StandInServer, name: str):
+    """Run a stand-in until interrupted"""
+    base_url = await server.start()
+    print(f"🛰️ {name} stand-in listening on {base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
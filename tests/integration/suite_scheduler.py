@@ -0,0 +1,135 @@
+"""
+Dependency-Aware Suite Scheduler
+Runs test phases as a DAG: each task declares the tasks it needs, independent
+tasks run concurrently under a global cap, and a task whose dependency failed
+is skipped, so suite wall time shrinks to the critical path
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class SuiteTask:
+    """One schedulable phase; `call` returns True when the phase passed"""
+    name: str
+    call: Callable[[], Awaitable[Any]]
+    needs: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_sync(cls, name: str, function: Callable[[], Any], needs: Iterable[str] = ()) -> "SuiteTask":
+        """Wrap a blocking phase so it runs on a worker thread"""
+        async def call():
+            return await asyncio.to_thread(function)
+        return cls(name, call, tuple(needs))
+
+
+@dataclass
+class TaskResult:
+    """Outcome and timing of one scheduled task"""
+    task: SuiteTask
+    passed: bool = False
+    skipped: bool = False
+    error: Optional[BaseException] = None
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def topological_order(tasks: Iterable[SuiteTask]) -> List[SuiteTask]:
+    """Order tasks so every task follows its dependencies; rejects unknown names and cycles"""
+    by_name: Dict[str, SuiteTask] = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate task name: {task.name}")
+        by_name[task.name] = task
+
+    for task in by_name.values():
+        missing = [need for need in task.needs if need not in by_name]
+        if missing:
+            raise ValueError(f"Task {task.name} needs unknown task(s): {', '.join(missing)}")
+
+    remaining = {name: set(task.needs) for name, task in by_name.items()}
+    ordered: List[SuiteTask] = []
+    while remaining:
+        ready = [name for name, needs in remaining.items() if not needs]
+        if not ready:
+            raise ValueError(f"Dependency cycle among: {', '.join(sorted(remaining))}")
+        for name in ready:
+            ordered.append(by_name[name])
+            del remaining[name]
+        for needs in remaining.values():
+            needs.difference_update(ready)
+    return ordered
+
+
+class SuiteScheduler:
+    """Runs a task DAG with at most `concurrency` tasks in flight"""
+
+    def __init__(self, concurrency: int = 4):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.wall_time = 0.0
+
+    async def run(self, tasks: Iterable[SuiteTask]) -> Dict[str, TaskResult]:
+        """Run every task once its dependencies pass; results keep declaration order"""
+        tasks = list(tasks)
+        ordered = topological_order(tasks)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        futures: Dict[str, asyncio.Future] = {}
+        origin = time.perf_counter()
+
+        async def run_task(task: SuiteTask) -> TaskResult:
+            dependencies = [await futures[need] for need in task.needs]
+            result = TaskResult(task)
+            if not all(dependency.passed for dependency in dependencies):
+                result.skipped = True
+                result.start = result.end = max((d.end for d in dependencies), default=0.0)
+                return result
+
+            # The slot is taken only once dependencies are met, so waiting tasks never block the cap
+            async with semaphore:
+                result.start = time.perf_counter() - origin
+                try:
+                    result.passed = bool(await task.call())
+                except Exception as e:
+                    result.error = e
+                result.end = time.perf_counter() - origin
+            return result
+
+        for task in ordered:
+            futures[task.name] = asyncio.ensure_future(run_task(task))
+        try:
+            await asyncio.gather(*futures.values())
+        finally:
+            for future in futures.values():
+                future.cancel()
+        self.wall_time = time.perf_counter() - origin
+
+        return {task.name: futures[task.name].result() for task in tasks}
+
+
+def critical_path(results: Dict[str, TaskResult]) -> List[str]:
+    """Chain of tasks ending at the last finisher, following each task's latest-finishing dependency"""
+    if not results:
+        return []
+    current: Optional[TaskResult] = max(results.values(), key=lambda result: result.end)
+    path = []
+    while current is not None:
+        path.append(current.task.name)
+        needs = [results[need] for need in current.task.needs]
+        current = max(needs, key=lambda result: result.end) if needs else None
+    return list(reversed(path))
+
+
+def format_schedule(results: Dict[str, TaskResult], wall_time: float) -> str:
+    """One-line wall time and critical path summary for console output"""
+    busy = sum(result.duration for result in results.values())
+    return (f"⏱️ Suite wall time {wall_time:.2f}s for {busy:.2f}s of phase time "
+            f"(critical path: {' → '.join(critical_path(results))})")
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Synthetic Monitoring Daemon
+Runs the PublicAccessTester and FixedDeploymentTester checks as probes on
+jittered intervals inside one asyncio process. Every probe keeps its recent
+latencies and outcomes in a fixed-size ring buffer, and a failed check is
+re-run on a short interval so an outage or slowdown is flagged within seconds
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from alexai_standin_server import AlexAIStandInServer
+from fixed_deployment_test import FixedDeploymentTester
+from request_policy import DEFAULT_TIMEOUTS, RequestPolicy, RetrySettings
+from result_sink import NDJSONResultSink
+from standin_server import FaultModel, LatencyModel
+from test_public_access import PublicAccessTester
+
+PROBE_THREAD_PREFIX = "probe"
+STATE_ICONS = {"healthy": "✅", "degraded": "⚠️", "down": "❌"}
+
+DEFAULT_PROBE_TIMEOUT = 5.0
+
+
+@dataclass
+class Probe:
+    """One named check, run on a blocking worker thread"""
+    name: str
+    check: Callable[[], bool]
+    interval: float = 10.0
+    jitter: float = 0.2
+
+    def next_delay(self, rng: random.Random, interval: Optional[float] = None) -> float:
+        """Interval spread by ±jitter so probes never fire in lockstep"""
+        interval = self.interval if interval is None else interval
+        return interval * (1 + rng.uniform(-self.jitter, self.jitter))
+
+
+class ProbeWindow:
+    """Ring buffer of the last `capacity` check times, latencies and outcomes"""
+
+    def __init__(self, capacity: int = 360):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.times = np.zeros(capacity)
+        self.latencies = np.zeros(capacity)
+        self.ok = np.zeros(capacity, dtype=bool)
+        self.count = 0
+        self.total = 0
+        self.consecutive_failures = 0
+
+    def add(self, timestamp: float, latency: float, ok: bool):
+        slot = self.total % self.capacity
+        self.times[slot], self.latencies[slot], self.ok[slot] = timestamp, latency, ok
+        self.total += 1
+        self.count = min(self.count + 1, self.capacity)
+        self.consecutive_failures = 0 if ok else self.consecutive_failures + 1
+
+    def _order(self, last: Optional[int]) -> np.ndarray:
+        """Slot indices of the newest `last` checks (all by default), oldest first"""
+        n = self.count if last is None else min(last, self.count)
+        return np.arange(self.total - n, self.total) % self.capacity
+
+    def latencies_of(self, last: Optional[int] = None, ok_only: bool = True) -> np.ndarray:
+        order = self._order(last)
+        return self.latencies[order][self.ok[order]] if ok_only else self.latencies[order]
+
+    def availability(self, last: Optional[int] = None) -> float:
+        order = self._order(last)
+        return float(self.ok[order].mean()) if len(order) else 1.0
+
+    def percentile(self, percentile: float, last: Optional[int] = None) -> Optional[float]:
+        latencies = self.latencies_of(last)
+        return float(np.percentile(latencies, percentile)) if len(latencies) else None
+
+
+@dataclass
+class DegradationPolicy:
+    """When a probe's recent window counts as degraded or down"""
+    recent: int = 5
+    down_after: int = 3
+    min_availability: float = 0.8
+    latency_factor: float = 2.0
+    latency_slo: Optional[float] = None
+    min_history: int = 10
+
+    def assess(self, window: ProbeWindow) -> Tuple[str, str]:
+        """(state, reason) for the window's newest checks"""
+        if window.consecutive_failures >= self.down_after:
+            return "down", f"{window.consecutive_failures} consecutive failures"
+        availability = window.availability(self.recent)
+        if availability < self.min_availability:
+            return "degraded", f"availability {availability * 100:.0f}% over the last {min(self.recent, window.count)} checks"
+
+        recent = window.latencies_of(self.recent)
+        if len(recent):
+            median = float(np.median(recent))
+            if self.latency_slo is not None and median > self.latency_slo:
+                return "degraded", f"median latency {median:.3f}s above the {self.latency_slo:.3f}s SLO"
+            # The long window excludes the recent checks so a slowdown is measured against its own past
+            history = window.latencies_of()[:-len(recent)] if window.count > self.recent else recent[:0]
+            if len(history) >= self.min_history:
+                typical = float(np.median(history))
+                if median > typical * self.latency_factor:
+                    return "degraded", f"median latency {median:.3f}s vs {typical:.3f}s typical"
+        return "healthy", ""
+
+
+class _ProbeOutput:
+    """stdout wrapper that drops the testers' progress lines printed from probe threads"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        if threading.current_thread().name.startswith(PROBE_THREAD_PREFIX):
+            return len(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def probe_request_policy(timeout: float = DEFAULT_PROBE_TIMEOUT, max_retries: int = 0) -> RequestPolicy:
+    """Short timeouts and no retries, so a check reports the failure it saw instead of
+    spending the test_config.json backoff on hiding it"""
+    return RequestPolicy(timeouts={category: timeout for category in DEFAULT_TIMEOUTS},
+                         retry=RetrySettings(max_retries=max_retries))
+
+
+def deployment_probes(main_url: str, local_url: str, interval: float = 10.0, jitter: float = 0.2,
+                      policy: Optional[RequestPolicy] = None) -> List[Probe]:
+    """Probes over the public access and fixed deployment checks, by default under probe_request_policy()"""
+    policy = policy or probe_request_policy()
+    public = PublicAccessTester(main_url=main_url, local_url=local_url, policy=policy)
+    fixed = FixedDeploymentTester(local_url=local_url, remote_main_url=main_url, policy=policy)
+
+    def fixed_check(method: Callable[[], bool]) -> Callable[[], bool]:
+        def check() -> bool:
+            try:
+                return method()
+            finally:
+                # log_test appends forever; a daemon only needs the return value
+                fixed.test_results.clear()
+        return check
+
+    checks = {
+        "main_page": public.test_main_page_access,
+        "alexai_endpoints": public.test_alexai_endpoints,
+        "observation_lounge": public.test_observation_lounge,
+        "alexai_consultation": public.test_alexai_consultation,
+        "local_deployment": fixed_check(fixed.test_local_deployment),
+        "remote_main_deployment": fixed_check(fixed.test_remote_main_deployment)
+    }
+    return [Probe(name, check, interval, jitter) for name, check in checks.items()]
+
+
+class SyntheticMonitor:
+    """Schedules probes on one event loop and tracks their health"""
+
+    def __init__(self, probes: List[Probe], policy: Optional[DegradationPolicy] = None,
+                 window: int = 360, recheck_interval: float = 1.0,
+                 sink: Optional[NDJSONResultSink] = None, seed: Optional[int] = None):
+        self.probes = probes
+        self.policy = policy or DegradationPolicy()
+        self.recheck_interval = recheck_interval
+        self.sink = sink
+        self.rng = random.Random(seed)
+        self.windows: Dict[str, ProbeWindow] = {probe.name: ProbeWindow(window) for probe in probes}
+        self.states: Dict[str, str] = {probe.name: "healthy" for probe in probes}
+        self.transitions: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._executor = ThreadPoolExecutor(max(1, len(probes)), thread_name_prefix=PROBE_THREAD_PREFIX)
+
+    async def check_once(self, probe: Probe) -> bool:
+        """Run one check off the loop and fold it into the probe's window"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            ok = bool(await loop.run_in_executor(self._executor, probe.check))
+        except Exception:
+            ok = False
+        latency = time.perf_counter() - start
+
+        window = self.windows[probe.name]
+        window.add(time.time(), latency, ok)
+        state, reason = self.policy.assess(window)
+        if self.sink is not None:
+            self.sink.write({"test_name": probe.name, "status": "PASS" if ok else "FAIL",
+                             "duration": round(latency, 6), "state": state,
+                             "timestamp": datetime.now().isoformat()})
+        if state != self.states[probe.name]:
+            self._transition(probe.name, state, reason)
+        return ok
+
+    def _transition(self, name: str, state: str, reason: str):
+        event = {"probe": name, "from": self.states[name], "to": state, "reason": reason,
+                 "timestamp": datetime.now().isoformat()}
+        self.states[name] = state
+        self.transitions.append(event)
+        print(f"{STATE_ICONS[state]} [{event['timestamp'][11:19]}] {name}: {event['from']} → {state}"
+              + (f" ({reason})" if reason else ""))
+        for listener in self.listeners:
+            listener(event)
+
+    async def _run_probe(self, probe: Probe):
+        # A random first offset spreads the probes across one interval
+        await asyncio.sleep(self.rng.uniform(0, probe.interval))
+        while True:
+            ok = await self.check_once(probe)
+            # Failures and unhealthy probes are re-checked quickly to confirm or clear them
+            fast = not ok or self.states[probe.name] != "healthy"
+            interval = min(self.recheck_interval, probe.interval) if fast else None
+            await asyncio.sleep(probe.next_delay(self.rng, interval))
+
+    async def _report_status(self, interval: float, status_file: Optional[str]):
+        while True:
+            await asyncio.sleep(interval)
+            self.print_status()
+            if status_file:
+                temporary = f"{status_file}.tmp"
+                with open(temporary, "w") as f:
+                    json.dump(self.snapshot(), f, indent=2)
+                os.replace(temporary, status_file)
+
+    async def run(self, duration: float = 0.0, status_interval: float = 30.0,
+                  status_file: Optional[str] = None):
+        """Probe until cancelled, or for `duration` seconds when it is positive"""
+        tasks = [asyncio.create_task(self._run_probe(probe)) for probe in self.probes]
+        if status_interval > 0:
+            tasks.append(asyncio.create_task(self._report_status(status_interval, status_file)))
+        try:
+            if duration > 0:
+                await asyncio.sleep(duration)
+            else:
+                await asyncio.Event().wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state and rolling-window statistics per probe"""
+        probes = {}
+        for name, window in self.windows.items():
+            p50, p95 = window.percentile(50), window.percentile(95)
+            probes[name] = {
+                "state": self.states[name],
+                "checks": window.total,
+                "window": window.count,
+                "availability": round(window.availability(), 4),
+                "recent_availability": round(window.availability(self.policy.recent), 4),
+                "p50": None if p50 is None else round(p50, 6),
+                "p95": None if p95 is None else round(p95, 6)
+            }
+        return {"timestamp": datetime.now().isoformat(), "probes": probes, "transitions": list(self.transitions)}
+
+    def print_status(self):
+        print(f"\n📡 Synthetic monitor status ({datetime.now().strftime('%H:%M:%S')})")
+        for name, probe in self.snapshot()["probes"].items():
+            latency = f"p50 {probe['p50']:.3f}s p95 {probe['p95']:.3f}s" if probe["p50"] is not None else "no successful checks"
+            print(f"  {STATE_ICONS[probe['state']]} {name}: {probe['availability'] * 100:.1f}% available "
+                  f"over {probe['window']} checks, {latency}")
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic monitoring of the AlexAI deployments")
+    parser.add_argument("--main-url", default="https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app",
+                        help="Public deployment URL")
+    parser.add_argument("--local-url", default="http://localhost:8000", help="Local deployment URL")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between checks of each probe")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Interval spread as a fraction of --interval")
+    parser.add_argument("--recheck-interval", type=float, default=1.0,
+                        help="Seconds between checks while a probe is failing or unhealthy")
+    parser.add_argument("--probe-timeout", type=float, default=DEFAULT_PROBE_TIMEOUT,
+                        help="Request timeout in seconds for every check")
+    parser.add_argument("--probe-retries", type=int, default=0,
+                        help="Retries per check request; any retry hides failures from the monitor")
+    parser.add_argument("--window", type=int, default=360, help="Checks kept per probe in its rolling window")
+    parser.add_argument("--recent", type=int, default=5, help="Newest checks used to judge degradation")
+    parser.add_argument("--down-after", type=int, default=3, help="Consecutive failures before a probe is down")
+    parser.add_argument("--min-availability", type=float, default=0.8,
+                        help="Lowest availability over the recent checks before a probe is degraded")
+    parser.add_argument("--latency-factor", type=float, default=2.0,
+                        help="Recent median latency over typical median that counts as degraded")
+    parser.add_argument("--latency-slo", type=float, default=None, help="Absolute median latency limit in seconds")
+    parser.add_argument("--duration", type=float, default=0.0, help="Stop after this many seconds (0: run until interrupted)")
+    parser.add_argument("--status-interval", type=float, default=30.0, help="Seconds between status summaries")
+    parser.add_argument("--status-file", help="Rewrite this JSON file with the status at every summary")
+    parser.add_argument("--results-ndjson", help="Append every check to an NDJSON log")
+    parser.add_argument("--standin", action="store_true",
+                        help="Probe an in-process AlexAI API stand-in instead of the deployments")
+    parser.add_argument("--standin-latency", type=float, default=0.0, help="Stand-in fixed service time (s)")
+    parser.add_argument("--standin-error-rate", type=float, default=0.0, help="Stand-in injected error fraction")
+    parser.add_argument("--verbose-probes", action="store_true", help="Keep the testers' own progress output")
+    return parser.parse_args(argv)
+
+
+async def run_monitor(args: argparse.Namespace) -> Dict[str, Any]:
+    main_url, local_url = args.main_url, args.local_url
+    standin = None
+    if args.standin:
+        standin = AlexAIStandInServer(latency=LatencyModel(args.standin_latency),
+                                      faults=FaultModel(args.standin_error_rate))
+        main_url = local_url = await standin.start()
+        print(f"🛰️ Monitoring AlexAI API stand-in at {main_url}")
+
+    probes = deployment_probes(main_url, local_url, args.interval, args.jitter,
+                               probe_request_policy(args.probe_timeout, args.probe_retries))
+    policy = DegradationPolicy(recent=args.recent, down_after=args.down_after, min_availability=args.min_availability,
+                               latency_factor=args.latency_factor, latency_slo=args.latency_slo)
+    sink = NDJSONResultSink(args.results_ndjson) if args.results_ndjson else None
+    monitor = SyntheticMonitor(probes, policy, window=args.window, recheck_interval=args.recheck_interval, sink=sink)
+    print(f"📡 {len(probes)} probes every {args.interval:g}s ±{args.jitter * 100:.0f}%")
+    try:
+        await monitor.run(args.duration, args.status_interval, args.status_file)
+    finally:
+        monitor.close()
+        snapshot = monitor.snapshot()
+        if sink is not None:
+            sink.close({"probes": snapshot["probes"]})
+        if standin is not None:
+            await standin.stop()
+    return snapshot
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not args.verbose_probes:
+        sys.stdout = _ProbeOutput(sys.stdout)
+    try:
+        snapshot = asyncio.run(run_monitor(args))
+    except KeyboardInterrupt:
+        print("\n🛑 Synthetic monitor stopped")
+        return 0
+    print("\n📡 Final status")
+    for name, probe in snapshot["probes"].items():
+        print(f"  {STATE_ICONS[probe['state']]} {name}: {probe['checks']} checks, "
+              f"{probe['availability'] * 100:.1f}% available")
+    return 0 if all(probe["state"] == "healthy" for probe in snapshot["probes"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,23 +4,70 @@ End-to-End Deployment Test Script
 Tests the complete CI/CD process for AlexAI Star Trek Agile System
 """
 
+import argparse
+import asyncio
 import requests
 import json
 import time
 import subprocess
 import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from http_transport import SharedTransport, get_transport
+from json_codec import DecodeError, decode
+from alexai_standin_server import AlexAIStandInServer
+from latency_histogram import LatencyHistogram, record_latency
+from metrics_exporter import HarnessMetrics, add_metrics_arguments, start_background_metrics_server
+from request_policy import PolicySession, RequestPolicy, load_request_policy
+from request_timing import format_phases, phase_summaries, record_phases
+from result_sink import NDJSONResultSink, RunningSummary
+from standin_server import BackgroundStandIn
+from suite_scheduler import SuiteScheduler, SuiteTask, format_schedule
 
 class EndToEndDeploymentTester:
     """Comprehensive end-to-end deployment tester"""
     
-    def __init__(self):
-        self.local_url = "http://localhost:8000"
-        self.remote_main_url = "https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app"
-        self.remote_dashboard_url = "https://alexaikatratransferpackageremotev7-5a0huy992-pbradygeorgen.vercel.app"
+    def __init__(self, transport: Optional[SharedTransport] = None,
+                 local_url: str = "http://localhost:8000",
+                 remote_main_url: str = "https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app",
+                 remote_dashboard_url: str = "https://alexaikatratransferpackageremotev7-5a0huy992-pbradygeorgen.vercel.app",
+                 result_sink: Optional[NDJSONResultSink] = None,
+                 policy: Optional[RequestPolicy] = None,
+                 suite_concurrency: int = 4,
+                 metrics: Optional[HarnessMetrics] = None):
+        self.local_url = local_url
+        self.remote_main_url = remote_main_url
+        self.remote_dashboard_url = remote_dashboard_url
         self.test_results = []
+        self.summary = RunningSummary()
+        self.result_sink = result_sink
+        # Timeouts, retries and hedging of idempotent GETs follow test_config.json
+        self.http = PolicySession((transport or get_transport()).sync_session(), policy, metrics=metrics)
+        # Live result counts for a /metrics scraper; request latency is recorded by self.http
+        self.metrics = metrics
+        self.latency_histograms: Dict[str, LatencyHistogram] = {}
+        # DNS, connect, TLS, first-byte and transfer phases per label, from the timed connection pools
+        self.request_phases: Dict[str, Dict[str, LatencyHistogram]] = {}
+        
+        # Phases run on worker threads, so shared results are updated under a lock
+        self.scheduler = SuiteScheduler(suite_concurrency)
+        self._lock = threading.Lock()
+        
+    def _timed_request(self, method: str, target: str, endpoint: str,
+                       category: str = "api_requests", **kwargs) -> requests.Response:
+        """Issue a request against a deployment target and record its latency"""
+        url = f"{getattr(self, f'{target}_url')}{endpoint}"
+        label = endpoint if target == "local" else f"{target}:{endpoint}"
+        start_ns = time.perf_counter_ns()
+        response = self.http.request(method, url, category=category, key=label, **kwargs)
         
+        with self._lock:
+            record_latency(self.latency_histograms, label, (time.perf_counter_ns() - start_ns) / 1e9)
+            record_phases(self.request_phases, label, response.timing)
+        return response
+    
     def log_test(self, test_name: str, status: str, details: str = ""):
         """Log test results"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -30,10 +77,17 @@ class EndToEndDeploymentTester:
             "status": status,
             "details": details
         }
-        self.test_results.append(result)
-        print(f"[{timestamp}] {test_name}: {status}")
-        if details:
-            print(f"  Details: {details}")
+        if self.metrics is not None:
+            self.metrics.record_result(status, 0.0)
+        with self._lock:
+            self.summary.add(status, 0.0)
+            if self.result_sink is not None:
+                self.result_sink.write(result)
+            else:
+                self.test_results.append(result)
+            print(f"[{timestamp}] {test_name}: {status}")
+            if details:
+                print(f"  Details: {details}")
     
     def test_local_deployment(self) -> bool:
         """Test local deployment"""
@@ -41,7 +95,7 @@ class EndToEndDeploymentTester:
         
         try:
             # Test main page
-            response = requests.get(f"{self.local_url}/", timeout=10)
+            response = self._timed_request("GET", "local", "/")
             if response.status_code == 200:
                 self.log_test("Local Main Page", "PASS", f"Status: {response.status_code}")
             else:
@@ -49,9 +103,9 @@ class EndToEndDeploymentTester:
                 return False
             
             # Test AlexAI status endpoint
-            response = requests.get(f"{self.local_url}/api/alexai/status", timeout=10)
+            response = self._timed_request("GET", "local", "/api/alexai/status")
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success"):
                     self.log_test("Local AlexAI Status", "PASS", "AlexAI core agent responding")
                 else:
@@ -62,7 +116,7 @@ class EndToEndDeploymentTester:
                 return False
             
             # Test observation lounge
-            response = requests.get(f"{self.local_url}/observation-lounge", timeout=10)
+            response = self._timed_request("GET", "local", "/observation-lounge")
             if response.status_code == 200:
                 self.log_test("Local Observation Lounge", "PASS", "Enhanced AlexAI interface accessible")
             else:
@@ -70,13 +124,12 @@ class EndToEndDeploymentTester:
                 return False
             
             # Test crew insights
-            response = requests.post(
-                f"{self.local_url}/api/agents/insights",
-                json={"context": "End-to-end deployment testing"},
-                timeout=10
+            response = self._timed_request(
+                "POST", "local", "/api/agents/insights",
+                json={"context": "End-to-end deployment testing"}
             )
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success"):
                     self.log_test("Local Crew Insights", "PASS", "Multi-agent system responding")
                 else:
@@ -91,6 +144,9 @@ class EndToEndDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("Local Deployment", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("Local Deployment", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def test_remote_main_deployment(self) -> bool:
         """Test remote main deployment"""
@@ -98,7 +154,7 @@ class EndToEndDeploymentTester:
         
         try:
             # Test main page (may have password protection)
-            response = requests.get(f"{self.remote_main_url}/", timeout=10)
+            response = self._timed_request("GET", "remote_main", "/")
             if response.status_code == 200:
                 self.log_test("Remote Main Page", "PASS", f"Status: {response.status_code}")
             elif response.status_code == 401 or "Authentication Required" in response.text:
@@ -108,9 +164,9 @@ class EndToEndDeploymentTester:
                 return False
             
             # Test AlexAI status endpoint
-            response = requests.get(f"{self.remote_main_url}/api/alexai/status", timeout=10)
+            response = self._timed_request("GET", "remote_main", "/api/alexai/status")
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success"):
                     self.log_test("Remote AlexAI Status", "PASS", "AlexAI core agent responding")
                 else:
@@ -127,6 +183,9 @@ class EndToEndDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("Remote Main Deployment", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("Remote Main Deployment", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def test_remote_dashboard_deployment(self) -> bool:
         """Test remote dashboard deployment"""
@@ -134,7 +193,7 @@ class EndToEndDeploymentTester:
         
         try:
             # Test dashboard page
-            response = requests.get(f"{self.remote_dashboard_url}/", timeout=10)
+            response = self._timed_request("GET", "remote_dashboard", "/")
             if response.status_code == 200:
                 self.log_test("Remote Dashboard", "PASS", f"Status: {response.status_code}")
             else:
@@ -153,13 +212,13 @@ class EndToEndDeploymentTester:
         
         try:
             # Test comprehensive consultation
-            response = requests.post(
-                f"{self.local_url}/api/alexai/consultation",
+            response = self._timed_request(
+                "POST", "local", "/api/alexai/consultation",
                 json={"context": "End-to-end deployment testing and validation"},
-                timeout=30
+                category="workflow_execution"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success") and data.get("analysis"):
                     analysis = data["analysis"]
                     self.log_test("AlexAI Consultation", "PASS", "Comprehensive analysis generated")
@@ -192,6 +251,9 @@ class EndToEndDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("AlexAI Consultation", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("AlexAI Consultation", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def test_multimodal_capabilities(self) -> bool:
         """Test multimodal capabilities"""
@@ -202,13 +264,12 @@ class EndToEndDeploymentTester:
             modes = ["orchestrator", "analyzer", "strategist", "mediator", "innovator", "monitor"]
             
             for mode in modes:
-                response = requests.post(
-                    f"{self.local_url}/api/alexai/mode",
-                    json={"mode": mode},
-                    timeout=10
+                response = self._timed_request(
+                    "POST", "local", "/api/alexai/mode",
+                    json={"mode": mode}
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = decode(response.content)
                     if data.get("success"):
                         self.log_test(f"Mode Switch: {mode}", "PASS", f"Switched to {mode}")
                     else:
@@ -223,6 +284,9 @@ class EndToEndDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("Multimodal Capabilities", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("Multimodal Capabilities", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def test_crew_coordination(self) -> bool:
         """Test crew coordination and collaboration"""
@@ -230,9 +294,9 @@ class EndToEndDeploymentTester:
         
         try:
             # Test crew status
-            response = requests.get(f"{self.local_url}/api/alexai/status", timeout=10)
+            response = self._timed_request("GET", "local", "/api/alexai/status")
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success") and data.get("crew_status"):
                     crew_status = data["crew_status"]
                     
@@ -271,15 +335,18 @@ class EndToEndDeploymentTester:
         except requests.exceptions.RequestException as e:
             self.log_test("Crew Coordination", "FAIL", f"Connection error: {str(e)}")
             return False
+        except DecodeError as e:
+            self.log_test("Crew Coordination", "FAIL", f"Invalid JSON response: {str(e)}")
+            return False
     
     def generate_test_report(self):
         """Generate comprehensive test report"""
         print("\n📋 Generating Test Report...")
         
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r["status"] == "PASS"])
-        failed_tests = len([r for r in self.test_results if r["status"] == "FAIL"])
-        warning_tests = len([r for r in self.test_results if r["status"] in ["WARNING", "PASSWORD_PROTECTED"]])
+        total_tests = self.summary.total
+        passed_tests = self.summary.count("PASS")
+        failed_tests = self.summary.count("FAIL")
+        warning_tests = self.summary.count("WARNING", "PASSWORD_PROTECTED")
         
         report = {
             "timestamp": datetime.now().isoformat(),
@@ -291,6 +358,11 @@ class EndToEndDeploymentTester:
                 "success_rate": (passed_tests / total_tests * 100) if total_tests > 0 else 0
             },
             "test_results": self.test_results,
+            "results_file": self.result_sink.path if self.result_sink else None,
+            "latency_percentiles": {key: h.summary() for key, h in sorted(self.latency_histograms.items())},
+            "latency_histograms": {"endpoints": {key: h.to_dict() for key, h in sorted(self.latency_histograms.items())}},
+            "request_phases": phase_summaries(self.request_phases),
+            "request_policy": self.http.stats.to_dict(),
             "deployment_urls": {
                 "local": self.local_url,
                 "remote_main": self.remote_main_url,
@@ -310,6 +382,15 @@ class EndToEndDeploymentTester:
         print(f"   Warnings: {warning_tests}")
         print(f"   Success Rate: {report['summary']['success_rate']:.1f}%")
         
+        if self.latency_histograms:
+            print(f"\n⏱️ Latency Percentiles:")
+            for key, summary in report["latency_percentiles"].items():
+                print(f"   {key}: p50 {summary['p50']:.3f}s | p90 {summary['p90']:.3f}s | "
+                      f"p99 {summary['p99']:.3f}s | max {summary['max']:.3f}s")
+        
+        if "all" in report["request_phases"]:
+            print(f"\n🔬 Request Phases: {format_phases(report['request_phases']['all'])}")
+        
         print(f"\n🌐 Deployment URLs:")
         print(f"   Local: {self.local_url}")
         print(f"   Remote Main: {self.remote_main_url}")
@@ -327,40 +408,79 @@ class EndToEndDeploymentTester:
         print("🚀 Starting End-to-End Deployment Test Suite")
         print("=" * 60)
         
-        # Test local deployment
-        local_success = self.test_local_deployment()
-        
-        # Test remote deployments
-        remote_main_success = self.test_remote_main_deployment()
-        remote_dashboard_success = self.test_remote_dashboard_deployment()
-        
-        # Test AlexAI features
-        if local_success:
-            alexai_success = self.test_alexai_consultation()
-            multimodal_success = self.test_multimodal_capabilities()
-            crew_success = self.test_crew_coordination()
-        else:
-            alexai_success = False
-            multimodal_success = False
-            crew_success = False
+        # Deployments are checked concurrently; AlexAI features need the local deployment up
+        tasks = [
+            SuiteTask.from_sync("local_deployment", self.test_local_deployment),
+            SuiteTask.from_sync("remote_main_deployment", self.test_remote_main_deployment),
+            SuiteTask.from_sync("remote_dashboard_deployment", self.test_remote_dashboard_deployment),
+            SuiteTask.from_sync("alexai_consultation", self.test_alexai_consultation, needs=["local_deployment"]),
+            SuiteTask.from_sync("multimodal_capabilities", self.test_multimodal_capabilities, needs=["local_deployment"]),
+            SuiteTask.from_sync("crew_coordination", self.test_crew_coordination, needs=["local_deployment"])
+        ]
+        phases = asyncio.run(self.scheduler.run(tasks))
+        for name, phase in phases.items():
+            if phase.error is not None:
+                self.log_test(name, "FAIL", f"Unexpected error: {str(phase.error)}")
+        print(f"\n{format_schedule(phases, self.scheduler.wall_time)}")
         
         # Generate report
         report = self.generate_test_report()
         
-        return {
-            "local_deployment": local_success,
-            "remote_main_deployment": remote_main_success,
-            "remote_dashboard_deployment": remote_dashboard_success,
-            "alexai_consultation": alexai_success,
-            "multimodal_capabilities": multimodal_success,
-            "crew_coordination": crew_success,
-            "report": report
-        }
+        results = {name: phase.passed for name, phase in phases.items()}
+        results["report"] = report
+        return results
 
 def main():
     """Main test execution"""
-    tester = EndToEndDeploymentTester()
-    results = tester.run_complete_test_suite()
+    parser = argparse.ArgumentParser(description="AlexAI end-to-end deployment tests")
+    parser.add_argument("--standin", action="store_true",
+                        help="Run every target against an in-process AlexAI API stand-in")
+    parser.add_argument("--results-ndjson", metavar="PATH",
+                        help="Stream results to an append-only NDJSON log instead of keeping them in memory")
+    parser.add_argument("--test-config", metavar="PATH",
+                        help="test_config.json supplying timeouts and retry settings (default: tests/fixtures/mock-data)")
+    parser.add_argument("--hedge-delay", type=float, default=None,
+                        help="Send a duplicate idempotent GET after this many seconds without a response")
+    parser.add_argument("--max-retries", type=int, default=None, help="Override retry_settings.max_retries")
+    parser.add_argument("--suite-concurrency", type=int, default=4,
+                        help="Test phases allowed to run at once (1 runs them serially)")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    policy = load_request_policy(args.test_config, args.hedge_delay, args.max_retries)
+    
+    result_sink = NDJSONResultSink(args.results_ndjson) if args.results_ndjson else None
+    tester = None
+    metrics_server = None
+    try:
+        metrics, metrics_server = start_background_metrics_server(args)
+        if args.standin:
+            with BackgroundStandIn(AlexAIStandInServer()) as standin_url:
+                print(f"🛰️ AlexAI stand-in serving on {standin_url}")
+                tester = EndToEndDeploymentTester(
+                    local_url=standin_url,
+                    remote_main_url=standin_url,
+                    remote_dashboard_url=standin_url,
+                    result_sink=result_sink,
+                    policy=policy,
+                    suite_concurrency=args.suite_concurrency,
+                    metrics=metrics
+                )
+                results = tester.run_complete_test_suite()
+        else:
+            tester = EndToEndDeploymentTester(
+                result_sink=result_sink,
+                policy=policy,
+                suite_concurrency=args.suite_concurrency,
+                metrics=metrics
+            )
+            results = tester.run_complete_test_suite()
+    finally:
+        if result_sink is not None:
+            result_sink.close(tester.summary.to_dict() if tester else None)
+        if tester is not None:
+            tester.http.close()
+        if metrics_server is not None:
+            metrics_server.stop()
     
     # Exit with appropriate code
     if results["local_deployment"] and results["remote_main_deployment"] and results["remote_dashboard_deployment"]:
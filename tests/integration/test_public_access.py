@@ -4,24 +4,34 @@ Test Public Access Script
 Tests the deployment after disabling password protection
 """
 
+import argparse
 import requests
 import json
 import time
 from datetime import datetime
 
+from http_transport import get_transport
+from json_codec import DecodeError, decode
+from metrics_exporter import add_metrics_arguments, start_background_metrics_server
+from request_policy import PolicySession
+
 class PublicAccessTester:
     """Tests public access to the deployment"""
     
-    def __init__(self):
-        self.main_url = "https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app"
-        self.local_url = "http://localhost:8000"
+    def __init__(self, transport=None,
+                 main_url="https://alexaikatratransferpackageremotev7-em8uv8wwo-pbradygeorgen.vercel.app",
+                 local_url="http://localhost:8000", policy=None, metrics=None):
+        self.main_url = main_url
+        self.local_url = local_url
+        self.http = PolicySession((transport or get_transport()).sync_session(), policy, metrics=metrics)
+        self.metrics = metrics
         
     def test_main_page_access(self):
         """Test if main page is publicly accessible"""
         print("🔓 Testing Main Page Public Access...")
         
         try:
-            response = requests.get(f"{self.main_url}/", timeout=10)
+            response = self.http.get(f"{self.main_url}/")
             if response.status_code == 200:
                 print(f"✅ Main Page: PUBLICLY ACCESSIBLE (Status: {response.status_code})")
                 return True
@@ -49,7 +59,7 @@ class PublicAccessTester:
         
         for endpoint in endpoints:
             try:
-                response = requests.get(f"{self.main_url}{endpoint}", timeout=10)
+                response = self.http.get(f"{self.main_url}{endpoint}")
                 if response.status_code == 200:
                     print(f"✅ {endpoint}: WORKING (Status: {response.status_code})")
                     results.append(True)
@@ -70,7 +80,7 @@ class PublicAccessTester:
         print("\n👁️ Testing Observation Lounge...")
         
         try:
-            response = requests.get(f"{self.main_url}/observation-lounge", timeout=10)
+            response = self.http.get(f"{self.main_url}/observation-lounge")
             if response.status_code == 200:
                 print(f"✅ Observation Lounge: ACCESSIBLE (Status: {response.status_code})")
                 return True
@@ -89,13 +99,13 @@ class PublicAccessTester:
         print("\n🧠 Testing AlexAI Consultation...")
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.main_url}/api/alexai/consultation",
                 json={"context": "Testing public access to AlexAI consultation"},
-                timeout=30
+                category="workflow_execution"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response.content)
                 if data.get("success"):
                     print(f"✅ AlexAI Consultation: WORKING")
                     if data.get("analysis"):
@@ -116,6 +126,9 @@ class PublicAccessTester:
         except requests.exceptions.RequestException as e:
             print(f"❌ AlexAI Consultation: CONNECTION ERROR ({str(e)})")
             return False
+        except DecodeError as e:
+            print(f"❌ AlexAI Consultation: INVALID JSON RESPONSE ({str(e)})")
+            return False
     
     def generate_public_access_report(self):
         """Generate comprehensive public access report"""
@@ -131,6 +144,9 @@ class PublicAccessTester:
         
         # Calculate success rate
         tests = [main_page_works, alexai_endpoints_work, observation_lounge_works, consultation_works]
+        if self.metrics is not None:
+            for passed in tests:
+                self.metrics.record_result("PASS" if passed else "FAIL", 0.0)
         passed_tests = sum(tests)
         total_tests = len(tests)
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
@@ -178,10 +194,19 @@ class PublicAccessTester:
         
         return report
 
-def main():
+def main(argv=None):
     """Main test execution"""
-    tester = PublicAccessTester()
-    report = tester.generate_public_access_report()
+    parser = argparse.ArgumentParser(description="AlexAI public access tests")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    metrics, metrics_server = start_background_metrics_server(args)
+    try:
+        tester = PublicAccessTester(metrics=metrics)
+        report = tester.generate_public_access_report()
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
     
     # Exit with appropriate code
     if report["status"] == "PUBLIC":
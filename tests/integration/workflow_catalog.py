@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Workflow Catalog
+Parses every workflows/*.json definition once into an index: webhook path to
+workflow, node counts by type and a content hash per file. Parsed entries are
+cached on disk keyed by file hash, so only new or edited definitions are
+re-parsed as the directory grows
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from json_codec import DecodeError, decode
+
+DEFAULT_WORKFLOWS_DIR = Path(__file__).resolve().parents[2] / "workflows"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "workflow_catalog.json"
+
+# Bump when WorkflowEntry changes so stale caches are rebuilt
+CACHE_VERSION = 1
+
+WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
+
+def workflow_slug(path: Path) -> str:
+    """Derive the harness-facing workflow name from a definition filename"""
+    slug = path.stem
+    if slug.startswith("alexai-"):
+        slug = slug[len("alexai-"):]
+    if slug.endswith("-workflow"):
+        slug = slug[:-len("-workflow")]
+    return slug
+
+
+def workflow_kind(name: str) -> str:
+    """Classify a workflow name into the response shape it should produce"""
+    if "agent-validation" in name:
+        return "agent-validation"
+    if "crew-coordination" in name or "crew-request" in name:
+        return "crew-coordination"
+    if "bilateral-learning" in name:
+        return "bilateral-learning"
+    if "multimodal" in name:
+        return "multimodal-agency"
+    return "generic"
+
+
+@dataclass
+class WorkflowEntry:
+    """Index record for one workflow definition"""
+    file: str
+    sha256: str
+    name: str
+    slug: str
+    kind: str
+    node_count: int = 0
+    connection_count: int = 0
+    node_types: Dict[str, int] = field(default_factory=dict)
+    # Webhook path -> HTTP method (n8n defaults to GET when httpMethod is unset)
+    webhooks: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def parse_definition(path: Path, raw: bytes, sha256: str) -> WorkflowEntry:
+    """Build the index record for one definition's bytes"""
+    slug = workflow_slug(path)
+    entry = WorkflowEntry(path.name, sha256, slug, slug, workflow_kind(slug))
+    try:
+        definition = decode(raw)
+    except DecodeError as e:
+        entry.error = f"invalid JSON: {e}"
+        return entry
+    if not isinstance(definition, dict):
+        entry.error = "definition is not a JSON object"
+        return entry
+
+    nodes = [node for node in definition.get("nodes") or [] if isinstance(node, dict)]
+    entry.name = definition.get("name") or slug
+    entry.node_count = len(nodes)
+    entry.node_types = dict(Counter(node.get("type", "unknown") for node in nodes))
+    entry.connection_count = sum(
+        len(targets)
+        for outputs in (definition.get("connections") or {}).values() if isinstance(outputs, dict)
+        for branches in outputs.values() if isinstance(branches, list)
+        for targets in branches if isinstance(targets, list)
+    )
+    for node in nodes:
+        parameters = node.get("parameters") or {}
+        if node.get("type") == WEBHOOK_NODE_TYPE and parameters.get("path"):
+            entry.webhooks.setdefault(parameters["path"], parameters.get("httpMethod") or "GET")
+    return entry
+
+
+class WorkflowCatalog:
+    """Index over a directory of n8n workflow definitions"""
+
+    def __init__(self, workflows_dir: Optional[Path] = None, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.workflows_dir = Path(workflows_dir) if workflows_dir else DEFAULT_WORKFLOWS_DIR
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries: List[WorkflowEntry] = []
+        self.by_webhook: Dict[str, WorkflowEntry] = {}
+        self.parsed = 0
+        self.reused = 0
+        self.load()
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, "rb") as f:
+                cache = decode(f.read())
+        except (OSError, DecodeError):
+            return {}
+        if cache.get("version") != CACHE_VERSION or cache.get("workflows_dir") != str(self.workflows_dir):
+            return {}
+        return cache.get("files", {})
+
+    def _write_cache(self, files: Dict[str, Dict[str, Any]]):
+        if self.cache_path is None:
+            return
+        cache = {"version": CACHE_VERSION, "workflows_dir": str(self.workflows_dir), "files": files}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.cache_path.with_suffix(".tmp")
+            with open(temporary, "w") as f:
+                json.dump(cache, f)
+            os.replace(temporary, self.cache_path)
+        except OSError:
+            pass  # The cache only saves parsing time; an unwritable location is not an error
+
+    def load(self):
+        """(Re)build the index, parsing only definitions whose hash is not cached"""
+        cached = self._read_cache()
+        files: Dict[str, Dict[str, Any]] = {}
+        self.entries, self.parsed, self.reused = [], 0, 0
+
+        for path in sorted(self.workflows_dir.glob("*.json")):
+            try:
+                stat = path.stat()
+                previous = cached.get(path.name)
+                # Unchanged mtime and size means unchanged content; skip even the read
+                if previous and (previous["mtime_ns"], previous["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    entry = WorkflowEntry(**previous["entry"])
+                    self.reused += 1
+                else:
+                    raw = path.read_bytes()
+                    sha256 = hashlib.sha256(raw).hexdigest()
+                    if previous and previous["entry"]["sha256"] == sha256:
+                        entry = WorkflowEntry(**previous["entry"])
+                        self.reused += 1
+                    else:
+                        entry = parse_definition(path, raw, sha256)
+                        self.parsed += 1
+            except OSError:
+                continue
+            files[path.name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "entry": asdict(entry)}
+            self.entries.append(entry)
+
+        if files != cached:
+            self._write_cache(files)
+        self._index()
+
+    def _index(self):
+        # Several definitions share a path, so the first one (by filename) wins
+        self.by_webhook = {}
+        for entry in self.entries:
+            if entry.error is None and entry.webhooks:
+                for path in entry.webhooks:
+                    self.by_webhook.setdefault(path, entry)
+
+    def webhook_paths(self) -> List[str]:
+        """Every distinct webhook path declared by a definition"""
+        return sorted(self.by_webhook)
+
+    def routes(self) -> Dict[str, WorkflowEntry]:
+        """Paths a stand-in should serve: each webhook path plus the slug the harness uses"""
+        routes: Dict[str, WorkflowEntry] = {}
+        for entry in self.entries:
+            if entry.error is None and entry.webhooks:
+                for path in [entry.slug] + list(entry.webhooks):
+                    routes.setdefault(path, entry)
+        return routes
+
+    def node_type_counts(self) -> Dict[str, int]:
+        """Node counts by type across all definitions"""
+        totals: Counter = Counter()
+        for entry in self.entries:
+            totals.update(entry.node_types)
+        return dict(totals.most_common())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflows": len(self.entries),
+            "invalid": [entry.file for entry in self.entries if entry.error],
+            "webhooks": {path: entry.file for path, entry in sorted(self.by_webhook.items())},
+            "node_types": self.node_type_counts()
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index n8n workflow definitions")
+    parser.add_argument("--workflows-dir", type=Path, default=DEFAULT_WORKFLOWS_DIR,
+                        help="Directory of n8n workflow JSON definitions")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every definition and skip the on-disk cache")
+    parser.add_argument("--json", action="store_true", help="Print the index as JSON")
+    args = parser.parse_args(argv)
+
+    catalog = WorkflowCatalog(args.workflows_dir, cache_path=None if args.no_cache else DEFAULT_CACHE_PATH)
+    if args.json:
+        print(json.dumps(catalog.to_dict(), indent=2))
+        return 0
+
+    print(f"📂 {len(catalog.entries)} workflows in {catalog.workflows_dir} "
+          f"({catalog.parsed} parsed, {catalog.reused} from cache)")
+    for path, entry in sorted(catalog.by_webhook.items()):
+        print(f"  • /webhook/{path} [{entry.webhooks[path]}] → {entry.file} ({entry.kind}, {entry.node_count} nodes)")
+    for entry in catalog.entries:
+        if entry.error:
+            print(f"  ⚠️ {entry.file}: {entry.error}")
+    print("🧩 Node types: " + ", ".join(f"{kind} ×{count}" for kind, count in list(catalog.node_type_counts().items())[:8]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Workflow Latency Simulator
+Builds the node DAG of an n8n workflow definition from its `connections`, gives
+every node a latency distribution (configured per node type, or measured from
+saved latency histograms) and runs a Monte Carlo over the graph. IF/Switch
+outputs are alternatives, so each sample follows one branch. It reports the
+expected end-to-end latency, the critical path and the fan-out points whose
+branches could run in parallel, for comparison with measured webhook latencies
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from json_codec import decode
+from latency_histogram import LatencyHistogram, merge_histogram_maps
+from workflow_catalog import WorkflowCatalog, WorkflowEntry
+
+# Configured (median, p90) service times in seconds by node type
+DEFAULT_NODE_LATENCY: Dict[str, Tuple[float, float]] = {
+    "n8n-nodes-base.webhook": (0.002, 0.004),
+    "n8n-nodes-base.respondToWebhook": (0.002, 0.004),
+    "n8n-nodes-base.code": (0.010, 0.030),
+    "n8n-nodes-base.function": (0.010, 0.030),
+    "n8n-nodes-base.functionItem": (0.010, 0.030),
+    "n8n-nodes-base.set": (0.002, 0.005),
+    "n8n-nodes-base.if": (0.001, 0.002),
+    "n8n-nodes-base.switch": (0.001, 0.002),
+    "n8n-nodes-base.merge": (0.002, 0.005),
+    "n8n-nodes-base.httpRequest": (0.350, 1.200)
+}
+# Model calls (OpenAI, LangChain agents) dominate any workflow that has them
+LLM_NODE_LATENCY = (1.500, 4.000)
+FALLBACK_NODE_LATENCY = (0.005, 0.020)
+
+# Only one output of these nodes fires per execution
+BRANCHING_NODE_TYPES = {"n8n-nodes-base.if", "n8n-nodes-base.switch"}
+# Canvas annotations, never executed
+IGNORED_NODE_TYPES = {"n8n-nodes-base.stickyNote"}
+
+# z-score of the 90th percentile of a standard normal
+Z90 = 1.2815515655446004
+
+REPORT_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+@dataclass
+class NodeLatency:
+    """Log-normal service time given by its median and 90th percentile"""
+    median: float
+    p90: float
+
+    @property
+    def sigma(self) -> float:
+        return math.log(self.p90 / self.median) / Z90 if self.p90 > self.median > 0 else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.median * math.exp(self.sigma ** 2 / 2)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.sigma == 0.0:
+            return np.full(size, self.median)
+        return rng.lognormal(math.log(self.median), self.sigma, size)
+
+
+class MeasuredLatency:
+    """Service time resampled from a recorded latency histogram"""
+
+    def __init__(self, histogram: LatencyHistogram):
+        buckets = histogram.buckets()
+        self.values = np.array([upper for upper, _ in buckets])
+        counts = np.array([count for _, count in buckets], dtype=float)
+        self.weights = counts / counts.sum()
+        self.mean = histogram.mean
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.choice(self.values, size=size, p=self.weights)
+
+
+def configured_latency(node_type: str, overrides: Dict[str, Tuple[float, float]]) -> NodeLatency:
+    """Configured service time for a node type, with overrides taking precedence"""
+    if node_type in overrides:
+        return NodeLatency(*overrides[node_type])
+    if node_type in DEFAULT_NODE_LATENCY:
+        return NodeLatency(*DEFAULT_NODE_LATENCY[node_type])
+    lowered = node_type.lower()
+    if "openai" in lowered or "langchain" in lowered:
+        return NodeLatency(*LLM_NODE_LATENCY)
+    return NodeLatency(*FALLBACK_NODE_LATENCY)
+
+
+@dataclass
+class WorkflowGraph:
+    """Executable nodes reachable from the trigger, in topological order"""
+    names: List[str]
+    types: List[str]
+    parameters: List[Dict[str, Any]]
+    # (source, output index, target) over node positions
+    edges: List[Tuple[int, int, int]]
+    entries: List[int]
+    # Edges dropped to break loops (e.g. SplitInBatches back-edges)
+    back_edges: List[Tuple[str, str]] = field(default_factory=list)
+    unresolved: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_definition(cls, definition: Dict[str, Any]) -> "WorkflowGraph":
+        nodes = [node for node in definition.get("nodes") or []
+                 if isinstance(node, dict) and node.get("type") not in IGNORED_NODE_TYPES]
+        # Connections are keyed by node name, or by node id in some exported definitions
+        position: Dict[str, int] = {}
+        for index, node in enumerate(nodes):
+            if node.get("id"):
+                position.setdefault(str(node["id"]), index)
+        for index, node in enumerate(nodes):
+            position[node.get("name", "")] = index
+
+        successors: Dict[int, List[Tuple[int, int]]] = {index: [] for index in range(len(nodes))}
+        unresolved = set()
+        for source, outputs in (definition.get("connections") or {}).items():
+            if source not in position:
+                unresolved.add(source)
+                continue
+            for output_index, targets in enumerate((outputs or {}).get("main") or []):
+                for target in targets or []:
+                    if target.get("node") in position:
+                        successors[position[source]].append((output_index, position[target["node"]]))
+                    else:
+                        unresolved.add(str(target.get("node")))
+
+        incoming = {target for edges in successors.values() for _, target in edges}
+        triggers = [i for i, node in enumerate(nodes) if node.get("type") == "n8n-nodes-base.webhook"]
+        entries = triggers or [i for i in range(len(nodes)) if i not in incoming]
+
+        # Depth-first from the triggers: keeps reachable nodes and drops back-edges that close loops
+        state: Dict[int, int] = {}
+        postorder: List[int] = []
+        back_edges: List[Tuple[int, int]] = []
+
+        def visit(start: int):
+            stack = [(start, iter(successors[start]))]
+            state[start] = 1
+            while stack:
+                node, children = stack[-1]
+                for _, child in children:
+                    if state.get(child) == 1:
+                        back_edges.append((node, child))
+                    elif child not in state:
+                        state[child] = 1
+                        stack.append((child, iter(successors[child])))
+                        break
+                else:
+                    state[node] = 2
+                    postorder.append(node)
+                    stack.pop()
+
+        for entry in entries:
+            if entry not in state:
+                visit(entry)
+
+        order = list(reversed(postorder))
+        renumber = {old: new for new, old in enumerate(order)}
+        dropped = set(back_edges)
+        edges = [
+            (renumber[source], output_index, renumber[target])
+            for source in order
+            for output_index, target in successors[source]
+            if (source, target) not in dropped
+        ]
+        return cls(
+            names=[nodes[i].get("name", f"node-{i}") for i in order],
+            types=[nodes[i].get("type", "unknown") for i in order],
+            parameters=[nodes[i].get("parameters") or {} for i in order],
+            edges=edges,
+            entries=[renumber[entry] for entry in entries if entry in renumber],
+            back_edges=[(nodes[s].get("name", ""), nodes[t].get("name", "")) for s, t in back_edges],
+            unresolved=sorted(unresolved)
+        )
+
+    def outputs(self, node: int) -> int:
+        """Number of distinct outputs wired on a node"""
+        return 1 + max((output for source, output, _ in self.edges if source == node), default=0)
+
+    def parallel_groups(self) -> Dict[str, List[str]]:
+        """Fan-out points whose targets all run per execution and so could run concurrently"""
+        groups: Dict[str, List[str]] = {}
+        for node in range(len(self.names)):
+            by_output: Dict[int, List[int]] = {}
+            for source, output, target in self.edges:
+                if source == node:
+                    by_output.setdefault(output, []).append(target)
+            if self.types[node] in BRANCHING_NODE_TYPES:
+                fanned = [targets for targets in by_output.values() if len(targets) > 1]
+            else:
+                fanned = [sum(by_output.values(), [])] if by_output else []
+            for targets in fanned:
+                if len(targets) > 1:
+                    groups[self.names[node]] = [self.names[target] for target in targets]
+        return groups
+
+
+class NodeLatencyModel:
+    """Chooses a latency distribution per node: measured when available, else configured"""
+
+    def __init__(self, overrides: Optional[Dict[str, Tuple[float, float]]] = None,
+                 measured: Optional[Dict[str, LatencyHistogram]] = None):
+        self.overrides = overrides or {}
+        self.measured = {key: MeasuredLatency(h) for key, h in (measured or {}).items() if h.total_count}
+
+    def for_node(self, node_type: str, parameters: Dict[str, Any]):
+        # HTTP nodes calling an endpoint the harness has measured reuse that distribution
+        url = parameters.get("url")
+        if node_type == "n8n-nodes-base.httpRequest" and isinstance(url, str):
+            path = urlparse(url.lstrip("=")).path
+            if path in self.measured:
+                return self.measured[path]
+        if node_type in self.measured:
+            return self.measured[node_type]
+        return configured_latency(node_type, self.overrides)
+
+
+@dataclass
+class SimulationResult:
+    """Monte Carlo outcome for one workflow"""
+    workflow: str
+    nodes: int
+    samples: int
+    # n8n runs one node at a time per execution, so latency is the sum over executed nodes
+    serial: np.ndarray
+    # Latency if independent branches ran concurrently: the longest executed path
+    parallel: np.ndarray
+    critical_path: List[str]
+    parallel_groups: Dict[str, List[str]]
+    back_edges: List[Tuple[str, str]]
+
+    @staticmethod
+    def _summary(values: np.ndarray) -> Dict[str, float]:
+        summary = {"mean": round(float(values.mean()), 6)}
+        for percentile, value in zip(REPORT_PERCENTILES, np.percentile(values, REPORT_PERCENTILES)):
+            summary[f"p{percentile:g}"] = round(float(value), 6)
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        mean_serial = float(self.serial.mean())
+        return {
+            "workflow": self.workflow,
+            "nodes": self.nodes,
+            "samples": self.samples,
+            "serial_latency": self._summary(self.serial),
+            "parallel_latency": self._summary(self.parallel),
+            # One n8n worker is busy for the serial time of every execution
+            "capacity_rps_per_worker": round(1.0 / mean_serial, 2) if mean_serial else None,
+            "critical_path": self.critical_path,
+            "parallel_groups": self.parallel_groups,
+            "loops_ignored": [f"{source} → {target}" for source, target in self.back_edges]
+        }
+
+
+def simulate(graph: WorkflowGraph, model: NodeLatencyModel, samples: int = 10000,
+             seed: Optional[int] = None, name: str = "") -> SimulationResult:
+    """Monte Carlo over the DAG; each branching node picks one wired output uniformly per sample"""
+    rng = np.random.default_rng(seed)
+    count = len(graph.names)
+    distributions = [model.for_node(graph.types[i], graph.parameters[i]) for i in range(count)]
+    latency = np.array([distribution.sample(rng, samples) for distribution in distributions]).reshape(count, samples)
+
+    reached = np.zeros((count, samples), dtype=bool)
+    start = np.zeros((count, samples))
+    finish = np.zeros((count, samples))
+    reached[graph.entries] = True
+    choice = {
+        node: rng.integers(0, graph.outputs(node), samples)
+        for node in range(count) if graph.types[node] in BRANCHING_NODE_TYPES
+    }
+
+    outgoing: Dict[int, List[Tuple[int, int]]] = {}
+    for source, output, target in graph.edges:
+        outgoing.setdefault(source, []).append((output, target))
+
+    # Positions are topological, so every predecessor is final before a node is processed
+    for node in range(count):
+        finish[node] = np.where(reached[node], start[node] + latency[node], 0.0)
+        for output, target in outgoing.get(node, []):
+            fired = reached[node] & (choice[node] == output) if node in choice else reached[node]
+            reached[target] |= fired
+            start[target] = np.maximum(start[target], np.where(fired, finish[node], 0.0))
+
+    serial = np.where(reached, latency, 0.0).sum(axis=0) if count else np.zeros(samples)
+    parallel = finish.max(axis=0) if count else np.zeros(samples)
+    means = [distribution.mean for distribution in distributions]
+    return SimulationResult(name, count, samples, serial, parallel,
+                            critical_path(graph, means), graph.parallel_groups(), graph.back_edges)
+
+
+def critical_path(graph: WorkflowGraph, means: List[float]) -> List[str]:
+    """Longest chain by mean service time, taking the slowest alternative at each branch"""
+    count = len(graph.names)
+    if not count:
+        return []
+    best = list(means)
+    previous: List[Optional[int]] = [None] * count
+    for source, _, target in sorted(graph.edges):
+        if best[source] + means[target] > best[target]:
+            best[target] = best[source] + means[target]
+            previous[target] = source
+    node: Optional[int] = max(range(count), key=lambda i: best[i])
+    path = []
+    while node is not None:
+        path.append(graph.names[node])
+        node = previous[node]
+    return list(reversed(path))
+
+
+def simulate_entry(catalog: WorkflowCatalog, entry: WorkflowEntry, model: NodeLatencyModel,
+                   samples: int, seed: Optional[int]) -> SimulationResult:
+    with open(catalog.workflows_dir / entry.file, "rb") as f:
+        graph = WorkflowGraph.from_definition(decode(f.read()))
+    return simulate(graph, model, samples, seed, entry.slug)
+
+
+def parse_latency_overrides(values: List[str]) -> Dict[str, Tuple[float, float]]:
+    """Parse TYPE=MEDIAN[:P90] overrides, in seconds"""
+    overrides = {}
+    for value in values:
+        node_type, _, timing = value.partition("=")
+        median, _, p90 = timing.partition(":")
+        overrides[node_type] = (float(median), float(p90 or median))
+    return overrides
+
+
+def load_measured(paths: List[Path]) -> Tuple[Dict[str, LatencyHistogram], Dict[str, LatencyHistogram]]:
+    """Merge saved reports' histograms into (per node type or endpoint, per workflow) maps"""
+    nodes: List[Dict[str, Any]] = []
+    workflows: List[Dict[str, Any]] = []
+    for path in paths:
+        with open(path) as f:
+            groups = json.load(f).get("latency_histograms", {})
+        workflows.append(groups.get("workflows", {}))
+        nodes.extend(histograms for group, histograms in groups.items() if group != "workflows")
+    return merge_histogram_maps(nodes), merge_histogram_maps(workflows)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Predict n8n workflow latency from its node graph")
+    parser.add_argument("workflows", nargs="*",
+                        help="Workflow slugs or webhook paths (default: every workflow with a webhook)")
+    parser.add_argument("--match", default="", help="Only workflows whose slug contains this text")
+    parser.add_argument("--samples", type=int, default=10000, help="Monte Carlo samples per workflow")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    parser.add_argument("--latency", action="append", default=[], metavar="TYPE=MEDIAN[:P90]",
+                        help="Configured service time for a node type, e.g. n8n-nodes-base.httpRequest=0.4:1.5")
+    parser.add_argument("--measured", action="append", default=[], type=Path, metavar="REPORT",
+                        help="Saved report whose latency histograms supply measured node and workflow latencies")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    catalog = WorkflowCatalog()
+    measured_nodes, measured_workflows = load_measured(args.measured)
+    try:
+        overrides = parse_latency_overrides(args.latency)
+    except ValueError:
+        print(f"❌ --latency expects TYPE=MEDIAN[:P90] in seconds, got: {', '.join(args.latency)}")
+        return 1
+    model = NodeLatencyModel(overrides, measured_nodes)
+
+    routes = catalog.routes()
+    if args.workflows:
+        missing = [name for name in args.workflows if name not in routes]
+        if missing:
+            print(f"❌ Unknown workflow(s): {', '.join(missing)}")
+            return 1
+        entries = [routes[name] for name in args.workflows]
+    else:
+        entries = [entry for entry in catalog.entries if entry.webhooks and entry.error is None]
+    entries = [entry for entry in entries if args.match in entry.slug]
+
+    results = [(entry, simulate_entry(catalog, entry, model, args.samples, args.seed)) for entry in entries]
+    results.sort(key=lambda pair: float(np.percentile(pair[1].serial, 99)), reverse=True)
+    summaries = []
+    for entry, result in results:
+        summary = {"file": entry.file, **result.to_dict()}
+        if result.workflow in measured_workflows:
+            summary["measured_latency"] = measured_workflows[result.workflow].summary()
+        summaries.append(summary)
+
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+        return 0
+
+    print(f"🧮 Simulated {len(results)} workflows, {args.samples} samples each")
+    for summary in summaries:
+        serial, parallel = summary["serial_latency"], summary["parallel_latency"]
+        print(f"\n• {summary['workflow']} [{summary['file']}] ({summary['nodes']} nodes, "
+              f"~{summary['capacity_rps_per_worker']} req/s per worker)")
+        print(f"  Predicted: p50 {serial['p50']:.3f}s | p90 {serial['p90']:.3f}s | p99 {serial['p99']:.3f}s "
+              f"(parallel branches: p99 {parallel['p99']:.3f}s)")
+        if "measured_latency" in summary:
+            measured = summary["measured_latency"]
+            print(f"  Measured:  p50 {measured['p50']:.3f}s | p90 {measured['p90']:.3f}s | "
+                  f"p99 {measured['p99']:.3f}s (n={measured['count']})")
+        print(f"  Critical path: {' → '.join(summary['critical_path'])}")
+        for node, targets in summary["parallel_groups"].items():
+            print(f"  ⑂ {node} fans out to: {', '.join(targets)}")
+        for loop in summary["loops_ignored"]:
+            print(f"  ↺ Loop edge ignored: {loop}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""
+Unit tests import the harness modules the way the integration scripts do,
+by their flat module names
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "integration"))
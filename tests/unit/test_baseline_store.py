@@ -0,0 +1,111 @@
+"""
+Tests for the regression gate statistics in baseline_store.py
+"""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from baseline_store import (GateThresholds, bootstrap_percentile_ratio, compare_latency, main,
+                            mann_whitney_greater)
+from latency_histogram import LatencyHistogram
+
+
+def histogram(seconds) -> LatencyHistogram:
+    result = LatencyHistogram()
+    for value in seconds:
+        result.record(float(value))
+    return result
+
+
+def lognormal(scale: float = 1.0, size: int = 2000, seed: int = 7) -> LatencyHistogram:
+    rng = np.random.default_rng(seed)
+    return histogram(scale * rng.lognormal(mean=np.log(0.2), sigma=0.3, size=size))
+
+
+def test_mann_whitney_hand_computed_with_ties():
+    # Tie groups 10ms x1, 20ms x3, 30ms x2, 40ms x2: U = 2 + 3.5 + 4 + 4 = 13.5 of 16 pairs,
+    # variance 16 / 12 * (9 - 36 / 56), z = (13.5 - 8 - 0.5) / sqrt(variance)
+    baseline = histogram([0.010, 0.020, 0.020, 0.030])
+    current = histogram([0.020, 0.030, 0.040, 0.040])
+    variance = 16 / 12 * (9 - 36 / 56)
+    z = (13.5 - 8 - 0.5) / math.sqrt(variance)
+
+    p_value, effect = mann_whitney_greater(baseline, current)
+    assert effect == pytest.approx(13.5 / 16)
+    assert p_value == pytest.approx(0.5 * math.erfc(z / math.sqrt(2)))
+    assert p_value == pytest.approx(0.067085, abs=1e-6)
+
+    # The other direction uses U' = 16 - U
+    p_value, effect = mann_whitney_greater(current, baseline)
+    assert effect == pytest.approx(2.5 / 16)
+    assert p_value == pytest.approx(0.963867, abs=1e-6)
+
+
+def test_mann_whitney_matches_scipy_without_ties():
+    # scipy.stats.mannwhitneyu(range(6, 11), range(1, 6), alternative="greater",
+    #                          method="asymptotic") gives U = 25, p = 0.006093
+    baseline = histogram([n / 100 for n in range(1, 6)])
+    current = histogram([n / 100 for n in range(6, 11)])
+    p_value, effect = mann_whitney_greater(baseline, current)
+    assert effect == 1.0
+    assert p_value == pytest.approx(0.006093, abs=1e-6)
+
+
+def test_mann_whitney_all_tied():
+    same = histogram([0.05] * 10)
+    assert mann_whitney_greater(same, same) == (1.0, 0.5)
+
+
+def test_bootstrap_ratio_of_single_bucket_runs():
+    low, high = bootstrap_percentile_ratio(histogram([0.010] * 100), histogram([0.020] * 100),
+                                           resamples=200, rng=np.random.default_rng(0))
+    assert low == pytest.approx(2.0, rel=0.01)
+    assert high == pytest.approx(2.0, rel=0.01)
+
+
+def test_bootstrap_interval_brackets_the_shift():
+    rng = np.random.default_rng(0)
+    low, high = bootstrap_percentile_ratio(lognormal(), lognormal(seed=8), resamples=500, rng=rng)
+    assert low < 1.0 < high
+    low, high = bootstrap_percentile_ratio(lognormal(), lognormal(1.3, seed=8), resamples=500, rng=rng)
+    assert 1.1 < low < 1.3 < high
+
+
+@pytest.mark.parametrize("scale, verdict", [
+    (1.0, "unchanged"),
+    (1.3, "regressed"),
+    (1 / 1.3, "improved")
+])
+def test_compare_latency_verdicts(scale, verdict):
+    comparison = compare_latency("endpoints", "/api/alexai/status", lognormal(), lognormal(scale, seed=8),
+                                 GateThresholds(resamples=500), np.random.default_rng(0))
+    assert comparison.verdict == verdict
+
+
+def test_compare_latency_needs_min_samples():
+    comparison = compare_latency("endpoints", "/api/alexai/status", lognormal(size=10), lognormal(2.0, size=10),
+                                 GateThresholds(), np.random.default_rng(0))
+    assert comparison.verdict == "insufficient"
+    assert comparison.p_value is None
+
+
+def write_report(path, latency: LatencyHistogram) -> str:
+    with open(path, "w") as f:
+        json.dump({"latency_histograms": {"endpoints": {"/api/alexai/status": latency.to_dict()}}}, f)
+    return str(path)
+
+
+def test_gate_exit_codes(tmp_path):
+    baselines = str(tmp_path / "baselines")
+    blessed = write_report(tmp_path / "blessed.json", lognormal())
+    same = write_report(tmp_path / "same.json", lognormal(seed=8))
+    slower = write_report(tmp_path / "slower.json", lognormal(1.3, seed=8))
+
+    assert main(["--baseline-dir", baselines, "bless", "--name", "status", blessed]) == 0
+    compare = ["--baseline-dir", baselines, "compare", "--resamples", "500"]
+    assert main(compare + ["--name", "status", same]) == 0
+    assert main(compare + ["--name", "status", slower]) == 1
+    assert main(compare + ["--name", "unknown", same]) == 2